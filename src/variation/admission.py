@@ -0,0 +1,219 @@
+"""Module for admission control of API requests."""
+
+import asyncio
+import logging
+import math
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_logger = logging.getLogger(__name__)
+
+# Default maximum number of requests waiting for each endpoint
+DEFAULT_MAX_QUEUE_SIZE = 100
+
+# Default number of seconds a request waits before it is rejected
+DEFAULT_QUEUE_TIMEOUT = 10.0
+
+
+class AdmissionError(Exception):
+    """Raised when a request is not admitted"""
+
+    def __init__(self, message: str, retry_after: int) -> None:
+        """Initialize the AdmissionError class
+
+        :param message: Reason the request was not admitted
+        :param retry_after: Number of seconds the client should wait before retrying
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionInfo(NamedTuple):
+    """Admission control statistics for an endpoint"""
+
+    max_concurrency: int  # Maximum number of requests in progress
+    active: int  # Requests currently in progress
+    queued: int  # Requests currently waiting
+    admitted: int  # Requests that were admitted
+    rejected: int  # Requests rejected because the queue was full
+    timed_out: int  # Requests rejected because they waited too long
+
+
+class AdmissionController:
+    """Limits the number of requests in progress at the same time.
+
+    Up to `max_concurrency` requests are in progress at once. Other requests wait in
+    a queue in the order they arrived. Requests are rejected straight away if
+    `max_queue_size` requests are already waiting, or once they have waited for
+    `queue_timeout` seconds, so that a saturated endpoint fails fast instead of
+    slowing down every request.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+    ) -> None:
+        """Initialize the AdmissionController class
+
+        :param max_concurrency: Maximum number of requests in progress at the same
+            time
+        :param max_queue_size: Maximum number of requests waiting to be admitted. If
+            `0`, requests are rejected when `max_concurrency` requests are in
+            progress.
+        :param queue_timeout: Maximum number of seconds a request waits to be
+            admitted
+        :raises ValueError: If `max_concurrency` is less than 1, or `max_queue_size`
+            or `queue_timeout` is negative
+        """
+        if max_concurrency < 1:
+            msg = "`max_concurrency` must be greater than 0"
+            raise ValueError(msg)
+        if max_queue_size < 0:
+            msg = "`max_queue_size` must not be negative"
+            raise ValueError(msg)
+        if queue_timeout < 0:
+            msg = "`queue_timeout` must not be negative"
+            raise ValueError(msg)
+
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = max(1, math.ceil(queue_timeout))
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._active = 0
+        self._queued = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    async def acquire(self) -> None:
+        """Wait until a request is admitted. Must be followed by `release` once the
+        request completes.
+
+        :raises AdmissionError: If the queue is full, or the request waited for
+            `queue_timeout` seconds
+        """
+        if self._semaphore.locked() or self._queued:
+            if self._queued >= self.max_queue_size:
+                self._rejected += 1
+                msg = "Too many requests are waiting. Please try again later."
+                raise AdmissionError(msg, self.retry_after)
+
+            self._queued += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except TimeoutError as e:
+                self._timed_out += 1
+                msg = "Timed out waiting for other requests. Please try again later."
+                raise AdmissionError(msg, self.retry_after) from e
+            finally:
+                self._queued -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self._active += 1
+        self._admitted += 1
+
+    def release(self) -> None:
+        """Release an admitted request"""
+        self._active -= 1
+        self._semaphore.release()
+
+    def admission_info(self) -> AdmissionInfo:
+        """Get admission control statistics
+
+        :return: Concurrency limit, numbers of requests in progress and waiting, and
+            numbers of admitted and rejected requests
+        """
+        return AdmissionInfo(
+            self.max_concurrency,
+            self._active,
+            self._queued,
+            self._admitted,
+            self._rejected,
+            self._timed_out,
+        )
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware that applies admission control to endpoints.
+
+    Each endpoint has its own `AdmissionController`. Requests that are not admitted
+    get a `503 Service Unavailable` response with a `Retry-After` header. A request
+    stays in progress until its whole response, including streamed responses, has
+    been sent.
+    """
+
+    def __init__(
+        self, app: ASGIApp, controllers: dict[str, AdmissionController]
+    ) -> None:
+        """Initialize the AdmissionControlMiddleware class
+
+        :param app: ASGI app
+        :param controllers: Admission controller for each endpoint path. Requests for
+            other paths are not limited.
+        """
+        self.app = app
+        self.controllers = controllers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request
+
+        :param scope: Connection scope
+        :param receive: Function to receive messages
+        :param send: Function to send messages
+        """
+        controller = (
+            self.controllers.get(scope["path"]) if scope["type"] == "http" else None
+        )
+        if controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await controller.acquire()
+        except AdmissionError as e:
+            _logger.warning("Rejected request for %s: %s", scope["path"], e)
+            response = JSONResponse(
+                {"detail": str(e)},
+                status_code=503,
+                headers={"Retry-After": str(e.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release()
+
+
+def create_admission_controllers(
+    paths: Iterable[str],
+    max_concurrency: int,
+    max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+) -> dict[str, AdmissionController]:
+    """Create an admission controller with the same limits for each endpoint
+
+    :param paths: Endpoint paths
+    :param max_concurrency: Maximum number of requests in progress at the same time,
+        for each endpoint
+    :param max_queue_size: Maximum number of requests waiting to be admitted, for each
+        endpoint
+    :param queue_timeout: Maximum number of seconds a request waits to be admitted
+    :return: Admission controller for each endpoint path
+    """
+    return {
+        path: AdmissionController(
+            max_concurrency,
+            max_queue_size=max_queue_size,
+            queue_timeout=queue_timeout,
+        )
+        for path in paths
+    }
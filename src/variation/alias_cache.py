@@ -0,0 +1,223 @@
+"""Module for caching SeqRepo alias translations."""
+
+import contextlib
+import sys
+from collections.abc import Callable, Hashable
+from pathlib import Path
+
+from cool_seq_tool.handlers import SeqRepoAccess
+
+from variation.cache import MISSING, CacheInfo, TTLCache
+
+# Default maximum size of cached alias translations in bytes
+DEFAULT_ALIAS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Accession prefixes to preload. Transcript and protein accessions are not preloaded
+# by default, since there are too many of them to fit in the default cache size.
+DEFAULT_PRELOAD_PREFIXES = ("NC_",)
+
+# Target namespaces to preload for each accession
+DEFAULT_PRELOAD_NAMESPACES = ("ga4gh",)
+
+# Alias translations shared by every cache for the same SeqRepo instance
+_shared_caches: dict[str, TTLCache] = {}
+
+
+def _getsizeof(value: tuple) -> int:
+    """Get approximate size in bytes of a cached alias translation
+
+    :param value: Cached key and translation
+    :return: Size in bytes
+    """
+    key, result = value
+    size = sys.getsizeof(value) + sys.getsizeof(result)
+    for item in (*key, *result):
+        if isinstance(item, list | tuple):
+            size += sys.getsizeof(item) + sum(sys.getsizeof(i) for i in item)
+        else:
+            size += sys.getsizeof(item)
+    return size
+
+
+def _get_namespaces_key(
+    target_namespaces: str | list[str] | tuple[str, ...] | None,
+) -> Hashable:
+    """Get hashable cache key for target namespaces
+
+    :param target_namespaces: Target namespaces
+    :return: `target_namespaces` as a tuple if it is a list. Otherwise, unchanged.
+    """
+    if isinstance(target_namespaces, list):
+        return tuple(target_namespaces)
+    return target_namespaces
+
+
+class AliasTranslationCache:
+    """Cache of SeqRepo alias translations for `SeqRepoAccess.translate_identifier`
+    and `SeqRepoAccess.translate_sequence_identifier`.
+
+    Translations are cached by identifier and target namespace, including those that
+    are not found. They do not change within a SeqRepo instance, so translations are
+    shared by every cache for the same resolved SeqRepo root directory in the process.
+    A different SeqRepo root directory or release has its own translations. Least
+    recently used translations are evicted once more than `max_bytes` are cached.
+    """
+
+    def __init__(
+        self,
+        seqrepo_access: SeqRepoAccess,
+        max_bytes: int = DEFAULT_ALIAS_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize the AliasTranslationCache class
+
+        :param seqrepo_access: Access to SeqRepo
+        :param max_bytes: Maximum size of cached translations in bytes. Only used if
+            there are no cached translations for this SeqRepo instance yet.
+        :raises ValueError: If `max_bytes` is less than 1
+        """
+        if max_bytes < 1:
+            msg = "`max_bytes` must be greater than 0"
+            raise ValueError(msg)
+
+        self.seqrepo_access = seqrepo_access
+        self.seqrepo_root_dir = str(
+            Path(seqrepo_access.sr._root_dir).resolve()  # noqa: SLF001
+        )
+        self._translate_identifier = seqrepo_access.translate_identifier
+        self._translate_sequence_identifier = (
+            seqrepo_access.translate_sequence_identifier
+        )
+        if self.seqrepo_root_dir not in _shared_caches:
+            _shared_caches[self.seqrepo_root_dir] = TTLCache(
+                max_bytes, getsizeof=_getsizeof
+            )
+        self._cache = _shared_caches[self.seqrepo_root_dir]
+
+    def _get(self, key: tuple, translate: Callable[[], tuple]) -> tuple:
+        """Get cached translation, or translate and cache it
+
+        :param key: Cache key
+        :param translate: Function that returns the translation to cache
+        :return: Translation
+        """
+        value = self._cache.get(key)
+        if value is MISSING:
+            value = (key, translate())
+            self._cache.set(key, value)
+        return value[1]
+
+    def translate_identifier(
+        self, ac: str, target_namespaces: str | list[str] | None = None
+    ) -> tuple[list[str], str | None]:
+        """Return list of identifiers for accession, from cache if possible
+
+        :param ac: Identifier
+        :param target_namespaces: Namespaces to translate to
+        :return: List of identifiers and warning, same as
+            `SeqRepoAccess.translate_identifier`
+        """
+        key = ("translate_identifier", ac, _get_namespaces_key(target_namespaces))
+        aliases, warning = self._get(
+            key, lambda: self._translate_identifier(ac, target_namespaces)
+        )
+        return list(aliases), warning
+
+    def translate_sequence_identifier(
+        self, identifier: str, namespace: str | None = None
+    ) -> list[str]:
+        """Return identifiers for a sequence identifier, from cache if possible
+
+        :param identifier: Sequence identifier
+        :param namespace: Namespace to translate to
+        :raises KeyError: If `identifier` is not found, same as
+            `SeqRepoAccess.translate_sequence_identifier`
+        :return: List of identifiers
+        """
+
+        def _translate() -> tuple[list[str], tuple | None]:
+            try:
+                return (
+                    self._translate_sequence_identifier(identifier, namespace),
+                    None,
+                )
+            except KeyError as e:
+                return [], e.args
+
+        key = ("translate_sequence_identifier", identifier, namespace)
+        aliases, error_args = self._get(key, _translate)
+        if error_args is not None:
+            raise KeyError(*error_args)
+        return list(aliases)
+
+    def preload(
+        self,
+        prefixes: tuple[str, ...] = DEFAULT_PRELOAD_PREFIXES,
+        namespaces: tuple[str, ...] = DEFAULT_PRELOAD_NAMESPACES,
+    ) -> None:
+        """Cache `translate_identifier` and `translate_sequence_identifier`
+        translations to each of `namespaces` for every current SeqRepo accession
+        starting with one of `prefixes`
+
+        :param prefixes: Accession prefixes to preload
+        :param namespaces: Target namespaces to preload
+        """
+        for prefix in prefixes:
+            for alias_rec in self.seqrepo_access.sr.aliases.find_aliases(
+                alias=f"{prefix}%"
+            ):
+                ac = alias_rec["alias"]
+                if not ac.startswith(prefix):
+                    continue
+
+                for namespace in namespaces:
+                    self.translate_identifier(ac, namespace)
+                    with contextlib.suppress(KeyError):
+                        self.translate_sequence_identifier(ac, namespace)
+
+    def memory_usage(self) -> int:
+        """Get approximate size of cached translations
+
+        :return: Size in bytes
+        """
+        return self._cache.cache_info().currsize
+
+    def cache_info(self) -> CacheInfo:
+        """Get cache statistics
+
+        :return: Number of hits, misses, maximum size in bytes and current size in
+            bytes
+        """
+        return self._cache.cache_info()
+
+    def clear(self) -> None:
+        """Remove all cached translations for this SeqRepo instance and reset
+        statistics
+        """
+        self._cache.clear()
+
+
+def enable_alias_cache(
+    seqrepo_access: SeqRepoAccess,
+    max_bytes: int = DEFAULT_ALIAS_CACHE_MAX_BYTES,
+    preload: bool = False,
+) -> AliasTranslationCache:
+    """Cache alias translations for every `translate_identifier` and
+    `translate_sequence_identifier` call made with `seqrepo_access`
+
+    :param seqrepo_access: Access to SeqRepo
+    :param max_bytes: Maximum size of cached translations in bytes
+    :param preload: Whether or not to preload translations to refget accessions for
+        every `NC_` accession
+    :return: Alias translation cache. If `seqrepo_access` already has an alias
+        translation cache, it is returned unchanged.
+    """
+    cache = getattr(seqrepo_access.translate_identifier, "__self__", None)
+    if not isinstance(cache, AliasTranslationCache):
+        cache = AliasTranslationCache(seqrepo_access, max_bytes=max_bytes)
+        seqrepo_access.translate_identifier = cache.translate_identifier
+        seqrepo_access.translate_sequence_identifier = (
+            cache.translate_sequence_identifier
+        )
+    if preload:
+        cache.preload()
+    return cache
@@ -0,0 +1,168 @@
+"""Module for querying the gene normalizer without blocking the event loop."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import TypeVar
+
+from gene.query import QueryHandler as GeneQueryHandler
+from gene.schemas import NormalizeService, SearchService
+
+from variation.scheduler import FairLimiter
+
+# Default number of threads that query the gene normalizer
+DEFAULT_GENE_MAX_WORKERS = 8
+
+T = TypeVar("T")
+
+# Async access for each gene normalizer QueryHandler instance
+_async_gene_normalizers: dict[GeneQueryHandler, "AsyncGeneNormalizer"] = {}
+
+
+class AsyncGeneNormalizer:
+    """Async access to the gene normalizer.
+
+    Gene normalizer queries run on a bounded thread pool, so database round trips do
+    not block the event loop. If `create_gene_normalizer` is provided, each thread
+    creates its own gene normalizer QueryHandler (and database connection) once and
+    reuses it for every query. Otherwise, every thread uses `gene_normalizer`, and
+    queries are run one at a time, since database connections may not be safe to
+    share between threads. When every thread is busy, waiting queries are admitted
+    fairly between lanes.
+    """
+
+    def __init__(
+        self,
+        gene_normalizer: GeneQueryHandler,
+        max_workers: int = DEFAULT_GENE_MAX_WORKERS,
+        create_gene_normalizer: Callable[[], GeneQueryHandler] | None = None,
+    ) -> None:
+        """Initialize the AsyncGeneNormalizer class
+
+        :param gene_normalizer: Gene normalizer QueryHandler instance
+        :param max_workers: Maximum number of threads that query the gene normalizer at
+            the same time
+        :param create_gene_normalizer: Function that creates a gene normalizer
+            QueryHandler instance with its own database connection, for each thread
+        :raises ValueError: If `max_workers` is less than 1
+        """
+        if max_workers < 1:
+            msg = "`max_workers` must be greater than 0"
+            raise ValueError(msg)
+
+        self.gene_normalizer = gene_normalizer
+        self.max_workers = max_workers
+        self._create_gene_normalizer = create_gene_normalizer
+        self._lock = None if create_gene_normalizer else threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gene"
+        )
+        self._local = threading.local()
+        self._limiter = FairLimiter(max_workers)
+
+    def _get_gene_normalizer(self) -> GeneQueryHandler:
+        """Get gene normalizer QueryHandler instance for the current thread
+
+        :return: Gene normalizer QueryHandler instance
+        """
+        if not self._create_gene_normalizer:
+            return self.gene_normalizer
+
+        gene_normalizer = getattr(self._local, "gene_normalizer", None)
+        if gene_normalizer is None:
+            gene_normalizer = self._create_gene_normalizer()
+            self._local.gene_normalizer = gene_normalizer
+        return gene_normalizer
+
+    def _call(self, func: Callable[[GeneQueryHandler], T]) -> T:
+        """Call a function with the gene normalizer for the current thread
+
+        :param func: Function that takes a gene normalizer QueryHandler instance
+        :return: Result of `func`
+        """
+        with self._lock or nullcontext():
+            return func(self._get_gene_normalizer())
+
+    async def _run(self, func: Callable[[GeneQueryHandler], T]) -> T:
+        """Run a function with the gene normalizer on the thread pool
+
+        :param func: Function that takes a gene normalizer QueryHandler instance
+        :return: Result of `func`
+        """
+        loop = asyncio.get_running_loop()
+        async with self._limiter.slot():
+            return await loop.run_in_executor(self._executor, self._call, func)
+
+    async def normalize(self, query: str) -> NormalizeService:
+        """Normalize a gene query. Same as `QueryHandler.normalize`.
+
+        :param query: Gene query
+        :return: Normalized gene concept
+        """
+        return await self._run(lambda gn: gn.normalize(query))
+
+    async def normalize_many(
+        self, queries: Iterable[str]
+    ) -> dict[str, NormalizeService]:
+        """Normalize gene queries concurrently. Each unique query is only looked up
+        once.
+
+        :param queries: Gene queries
+        :return: Normalized gene concept for each unique query
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        resps = await asyncio.gather(*(self.normalize(q) for q in unique_queries))
+        return dict(zip(unique_queries, resps, strict=True))
+
+    async def search(self, query: str, incl: str = "") -> SearchService:
+        """Search sources for gene records. Same as `QueryHandler.search`.
+
+        :param query: Gene query
+        :param incl: Comma-separated list of sources to include
+        :return: Records for each source that match `query`
+        """
+        return await self._run(lambda gn: gn.search(query, incl=incl))
+
+    def close(self) -> None:
+        """Shut down the thread pool, without waiting for running calls"""
+        self._executor.shutdown(wait=False)
+
+
+def get_async_gene_normalizer(
+    gene_normalizer: GeneQueryHandler,
+    max_workers: int | None = None,
+    create_gene_normalizer: Callable[[], GeneQueryHandler] | None = None,
+) -> AsyncGeneNormalizer:
+    """Get async access to the gene normalizer for `gene_normalizer`, shared by every
+    caller
+
+    :param gene_normalizer: Gene normalizer QueryHandler instance
+    :param max_workers: Maximum number of threads that query the gene normalizer at
+        the same time. If not provided, existing async access is used as is, and new
+        async access uses `DEFAULT_GENE_MAX_WORKERS`.
+    :param create_gene_normalizer: Function that creates a gene normalizer
+        QueryHandler instance with its own database connection, for each thread
+    :raises ValueError: If `gene_normalizer` already has async access with a
+        different `max_workers`
+    :return: Async access to the gene normalizer. If `gene_normalizer` already has
+        async access, it is returned unchanged.
+    """
+    async_gene_normalizer = _async_gene_normalizers.get(gene_normalizer)
+    if async_gene_normalizer is None:
+        async_gene_normalizer = AsyncGeneNormalizer(
+            gene_normalizer,
+            max_workers=(
+                DEFAULT_GENE_MAX_WORKERS if max_workers is None else max_workers
+            ),
+            create_gene_normalizer=create_gene_normalizer,
+        )
+        _async_gene_normalizers[gene_normalizer] = async_gene_normalizer
+    elif max_workers is not None and max_workers != async_gene_normalizer.max_workers:
+        msg = (
+            f"Async gene normalizer access already uses "
+            f"{async_gene_normalizer.max_workers} workers, not {max_workers}"
+        )
+        raise ValueError(msg)
+    return async_gene_normalizer
@@ -0,0 +1,208 @@
+"""Module for accessing SeqRepo without blocking the event loop."""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from biocommons.seqrepo import SeqRepo
+from cool_seq_tool.handlers import SeqRepoAccess
+from cool_seq_tool.schemas import CoordinateType
+
+from variation.alias_cache import AliasTranslationCache, enable_alias_cache
+from variation.scheduler import FairLimiter
+from variation.sequence_cache import SequenceBlockCache
+
+# Default number of threads that access SeqRepo
+DEFAULT_SEQREPO_MAX_WORKERS = 8
+
+T = TypeVar("T")
+
+# Async access for each SeqRepoAccess instance
+_async_seqrepo_access: dict[SeqRepoAccess, "AsyncSeqRepoAccess"] = {}
+
+
+class AsyncSeqRepoAccess:
+    """Async access to SeqRepo.
+
+    Reference sequence fetches and alias translations run on a bounded thread pool, so
+    slow bgzip seeks and sqlite queries do not block the event loop. SeqRepo is not
+    safe to share between threads, so each thread opens its own SeqRepo instance (and
+    sqlite connection) for the same root directory. Thread instances use the same
+    sequence and alias caches as `seqrepo_access`, if it has them. When every thread
+    is busy, waiting calls are admitted fairly between lanes.
+    """
+
+    def __init__(
+        self,
+        seqrepo_access: SeqRepoAccess,
+        max_workers: int = DEFAULT_SEQREPO_MAX_WORKERS,
+    ) -> None:
+        """Initialize the AsyncSeqRepoAccess class
+
+        :param seqrepo_access: Access to SeqRepo
+        :param max_workers: Maximum number of threads that access SeqRepo at the same
+            time
+        :raises ValueError: If `max_workers` is less than 1
+        """
+        if max_workers < 1:
+            msg = "`max_workers` must be greater than 0"
+            raise ValueError(msg)
+
+        self.seqrepo_access = seqrepo_access
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="seqrepo"
+        )
+        self._local = threading.local()
+        self._limiter = FairLimiter(max_workers)
+
+    def _create_seqrepo_access(self) -> SeqRepoAccess:
+        """Create access to the same SeqRepo instance for the current thread
+
+        :return: Access to SeqRepo, using the caches of `seqrepo_access`
+        """
+        sr = SeqRepo(self.seqrepo_access.sr._root_dir)  # noqa: SLF001
+        sequences = self.seqrepo_access.sr.sequences
+        if isinstance(sequences, SequenceBlockCache):
+            sr.sequences = sequences.for_sequences(sr.sequences)
+
+        seqrepo_access = SeqRepoAccess(sr)
+        alias_cache = getattr(
+            self.seqrepo_access.translate_identifier, "__self__", None
+        )
+        if isinstance(alias_cache, AliasTranslationCache):
+            enable_alias_cache(seqrepo_access)
+        return seqrepo_access
+
+    def _get_seqrepo_access(self) -> SeqRepoAccess:
+        """Get access to SeqRepo for the current thread
+
+        :return: Access to SeqRepo
+        """
+        seqrepo_access = getattr(self._local, "seqrepo_access", None)
+        if seqrepo_access is None:
+            seqrepo_access = self._create_seqrepo_access()
+            self._local.seqrepo_access = seqrepo_access
+        return seqrepo_access
+
+    async def _run(self, func: Callable[[SeqRepoAccess], T]) -> T:
+        """Run a function with access to SeqRepo on the thread pool
+
+        :param func: Function that takes access to SeqRepo
+        :return: Result of `func`
+        """
+        loop = asyncio.get_running_loop()
+        async with self._limiter.slot():
+            return await loop.run_in_executor(
+                self._executor, lambda: func(self._get_seqrepo_access())
+            )
+
+    async def get_reference_sequence(
+        self,
+        ac: str,
+        start: int | None = None,
+        end: int | None = None,
+        coordinate_type: CoordinateType = CoordinateType.RESIDUE,
+    ) -> tuple[str, str | None]:
+        """Get reference sequence for an accession given a start and end position.
+        Same as `SeqRepoAccess.get_reference_sequence`.
+
+        :param ac: Accession
+        :param start: Start position
+        :param end: End position
+        :param coordinate_type: Coordinate type for `start` and `end`
+        :return: Sequence at position (if accession and positions actually exist, else
+            return empty string), warning if any
+        """
+        return await self._run(
+            lambda sr: sr.get_reference_sequence(
+                ac, start=start, end=end, coordinate_type=coordinate_type
+            )
+        )
+
+    async def translate_identifier(
+        self, ac: str, target_namespaces: str | list[str] | None = None
+    ) -> tuple[list[str], str | None]:
+        """Return list of identifiers for accession. Same as
+        `SeqRepoAccess.translate_identifier`.
+
+        :param ac: Identifier accession
+        :param target_namespaces: The namespace(s) of identifier to return
+        :return: List of identifiers, warning
+        """
+        return await self._run(
+            lambda sr: sr.translate_identifier(ac, target_namespaces=target_namespaces)
+        )
+
+    async def translate_sequence_identifier(
+        self, identifier: str, namespace: str | None = None
+    ) -> list[str]:
+        """Translate a sequence identifier. Same as
+        `SeqRepoAccess.translate_sequence_identifier`.
+
+        :param identifier: Sequence identifier
+        :param namespace: Namespace of identifiers to return
+        :raises KeyError: If identifier is not found in SeqRepo
+        :return: List of identifiers
+        """
+        return await self._run(
+            lambda sr: sr.translate_sequence_identifier(identifier, namespace)
+        )
+
+    async def slice_length(self, ac: str, start: int, end: int | None = None) -> int:
+        """Get length of a slice of a sequence. Same as `len(sr[ac][start:end])`, or
+        `len(sr[ac][start])` if `end` is not provided.
+
+        :param ac: Accession
+        :param start: Inter-residue start position
+        :param end: Inter-residue end position
+        :raises KeyError: If accession is not found in SeqRepo
+        :raises ValueError: If position is not valid on accession
+        :return: Length of slice
+        """
+
+        def _slice_length(seqrepo_access: SeqRepoAccess) -> int:
+            if end is None:
+                return len(seqrepo_access.sr[ac][start])
+            return len(seqrepo_access.sr[ac][start:end])
+
+        return await self._run(_slice_length)
+
+    def close(self) -> None:
+        """Shut down the thread pool, without waiting for running calls"""
+        self._executor.shutdown(wait=False)
+
+
+def get_async_seqrepo_access(
+    seqrepo_access: SeqRepoAccess,
+    max_workers: int | None = None,
+) -> AsyncSeqRepoAccess:
+    """Get async access to SeqRepo for `seqrepo_access`, shared by every caller
+
+    :param seqrepo_access: Access to SeqRepo
+    :param max_workers: Maximum number of threads that access SeqRepo at the same
+        time. If not provided, existing async access is used as is, and new async
+        access uses `DEFAULT_SEQREPO_MAX_WORKERS`.
+    :raises ValueError: If `seqrepo_access` already has async access with a different
+        `max_workers`
+    :return: Async access to SeqRepo. If `seqrepo_access` already has async access, it
+        is returned unchanged.
+    """
+    async_seqrepo_access = _async_seqrepo_access.get(seqrepo_access)
+    if async_seqrepo_access is None:
+        async_seqrepo_access = AsyncSeqRepoAccess(
+            seqrepo_access,
+            max_workers=(
+                DEFAULT_SEQREPO_MAX_WORKERS if max_workers is None else max_workers
+            ),
+        )
+        _async_seqrepo_access[seqrepo_access] = async_seqrepo_access
+    elif max_workers is not None and max_workers != async_seqrepo_access.max_workers:
+        msg = (
+            f"Async SeqRepo access already uses {async_seqrepo_access.max_workers} "
+            f"workers, not {max_workers}"
+        )
+        raise ValueError(msg)
+    return async_seqrepo_access
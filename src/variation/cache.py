@@ -0,0 +1,193 @@
+"""Module for in-memory caches."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, NamedTuple
+
+# Returned by cache lookups when a key is not cached, since `None` is a valid value
+MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for a cache"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class TTLCache:
+    """Thread-safe least recently used (LRU) cache whose entries expire after a time to
+    live (TTL)
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        timer: Callable[[], float] = time.monotonic,
+        getsizeof: Callable[[Any], int] | None = None,
+    ) -> None:
+        """Initialize the TTLCache class
+
+        :param maxsize: Maximum total size of entries. Least recently used entries are
+            evicted first.
+        :param ttl: Number of seconds an entry is valid for. If not provided, entries
+            do not expire.
+        :param timer: Function that returns the current time in seconds
+        :param getsizeof: Function that returns the size of a value. If not provided,
+            every entry has a size of 1, so `maxsize` is the maximum number of entries.
+        :raises ValueError: If `maxsize` is less than 1 or `ttl` is not positive
+        """
+        if maxsize < 1:
+            msg = "`maxsize` must be greater than 0"
+            raise ValueError(msg)
+        if ttl is not None and ttl <= 0:
+            msg = "`ttl` must be greater than 0"
+            raise ValueError(msg)
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._getsizeof = getsizeof or (lambda _: 1)
+        self._data: OrderedDict[Hashable, tuple[float | None, Any, int]] = OrderedDict()
+        self._currsize = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache, including expired entries that
+        have not been evicted yet
+        """
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:  # noqa: ANN401
+        """Get cached value for a key. Counts as a hit or miss.
+
+        :param key: Cache key
+        :param default: Value to return if `key` is not cached or has expired
+        :return: Cached value if found. Otherwise, `default`
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value, _ = entry
+                if expires_at is None or expires_at > self._timer():
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return value
+                self._pop(key)
+
+            self._misses += 1
+            return default
+
+    def peek(self, key: Hashable, default: Any = MISSING) -> Any:  # noqa: ANN401
+        """Get cached value for a key without updating recency or statistics
+
+        :param key: Cache key
+        :param default: Value to return if `key` is not cached or has expired
+        :return: Cached value if found. Otherwise, `default`
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value, _ = entry
+                if expires_at is None or expires_at > self._timer():
+                    return value
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:  # noqa: ANN401
+        """Cache a value for a key. If the cache is full, least recently used entries
+        are evicted. Values larger than `maxsize` are not cached.
+
+        :param key: Cache key
+        :param value: Value to cache
+        """
+        expires_at = self._timer() + self.ttl if self.ttl is not None else None
+        size = self._getsizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+            if size > self.maxsize:
+                return
+
+            self._data[key] = (expires_at, value, size)
+            self._currsize += size
+            while self._currsize > self.maxsize:
+                self._pop(next(iter(self._data)))
+
+    def _pop(self, key: Hashable) -> None:
+        """Remove an entry. Must be called while holding the lock.
+
+        :param key: Cache key
+        """
+        _, _, size = self._data.pop(key)
+        self._currsize -= size
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics"""
+        with self._lock:
+            self._data.clear()
+            self._currsize = 0
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Get cache statistics
+
+        :return: Number of hits, misses, max size and current size
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, self._currsize)
+
+
+class AsyncLoadingCache:
+    """Cache for results of coroutine functions.
+
+    If a result is already being loaded for a key, other lookups for the same key wait
+    for it instead of loading it again. Results that raise are not cached.
+    """
+
+    def __init__(self, cache: TTLCache) -> None:
+        """Initialize the AsyncLoadingCache class
+
+        :param cache: Cache to store results in
+        """
+        self.cache = cache
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:  # noqa: ANN401
+        """Get cached result, or wait for a load in progress, or load it
+
+        :param key: Cache key
+        :param load: Function that loads the result to cache
+        :return: Result
+        """
+        value = self.cache.get(key)
+        if value is not MISSING:
+            return value
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(load())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self._set(key, f))
+
+        # Shield load so that it still completes for other callers if this caller is
+        # cancelled
+        return await asyncio.shield(future)
+
+    def _set(self, key: Hashable, future: asyncio.Future) -> None:
+        """Cache result of a completed load
+
+        :param key: Cache key
+        :param future: Completed load
+        """
+        self._in_flight.pop(key, None)
+        if not future.cancelled() and future.exception() is None:
+            self.cache.set(key, future.result())
@@ -0,0 +1,94 @@
+"""Module for looking up RefSeq genomic accessions for chromosomes."""
+
+import logging
+from typing import Literal
+
+from cool_seq_tool.handlers import SeqRepoAccess
+
+from variation.schemas.service_schema import ClinVarAssembly
+
+_logger = logging.getLogger(__name__)
+
+# Chromosomes supported in gnomAD VCF queries
+CHROMOSOMES = (*(str(i) for i in range(1, 23)), "X", "Y")
+
+# Assemblies supported in gnomAD VCF queries, in priority order
+ASSEMBLIES = (ClinVarAssembly.GRCH38, ClinVarAssembly.GRCH37)
+
+
+class ChromosomeAccessions:
+    """Table of chromosome to RefSeq genomic (`NC_`) accession for each assembly.
+
+    The table is built from SeqRepo aliases when initialized, so looking up the
+    accession for a chromosome does not query SeqRepo.
+    """
+
+    def __init__(self, seqrepo_access: SeqRepoAccess) -> None:
+        """Initialize the ChromosomeAccessions class
+
+        :param seqrepo_access: Access to SeqRepo
+        """
+        self.seqrepo_access = seqrepo_access
+        self._accessions: dict[tuple[ClinVarAssembly, str], str] = {}
+        for assembly in ASSEMBLIES:
+            for chromosome in CHROMOSOMES:
+                nc_accession = self._get_nc_accession(f"{assembly.value}:{chromosome}")
+                if nc_accession:
+                    self._accessions[(assembly, chromosome)] = nc_accession
+
+    def __len__(self) -> int:
+        """Return the number of chromosomes in the table"""
+        return len(self._accessions)
+
+    def _get_nc_accession(self, identifier: str) -> str | None:
+        """Given an identifier (assembly+chr), return RefSeq genomic accession from
+        SeqRepo
+
+        :param identifier: assembly+chr
+        :return: RefSeq genomic accession, if found
+        """
+        nc_accession = None
+        try:
+            translated_identifiers, _ = self.seqrepo_access.translate_identifier(
+                identifier
+            )
+        except KeyError:
+            _logger.warning("Data Proxy unable to get metadata for %s", identifier)
+        else:
+            aliases = [a for a in translated_identifiers if a.startswith("refseq:NC_")]
+            if aliases:
+                nc_accession = aliases[0].split(":")[-1]
+        return nc_accession
+
+    def get_accession(
+        self,
+        chromosome: str,
+        assembly: Literal[ClinVarAssembly.GRCH37, ClinVarAssembly.GRCH38],
+    ) -> str | None:
+        """Get RefSeq genomic accession for a chromosome
+
+        :param chromosome: Chromosome (e.g. `"7"` or `"X"`)
+        :param assembly: Assembly
+        :return: RefSeq genomic accession, if found
+        """
+        return self._accessions.get((assembly, chromosome))
+
+    def get_accessions(
+        self,
+        chromosome: str,
+        assembly: Literal[ClinVarAssembly.GRCH37, ClinVarAssembly.GRCH38] | None = None,
+    ) -> list[str]:
+        """Get RefSeq genomic accessions for a chromosome
+
+        :param chromosome: Chromosome (e.g. `"7"` or `"X"`)
+        :param assembly: Assembly. If not provided, will get accessions for GRCh38 and
+            then GRCh37
+        :return: RefSeq genomic accessions found
+        """
+        assemblies = [assembly] if assembly else ASSEMBLIES
+        nc_accessions = []
+        for a in assemblies:
+            nc_accession = self.get_accession(chromosome, a)
+            if nc_accession:
+                nc_accessions.append(nc_accession)
+        return nc_accessions
@@ -1,5 +1,6 @@
 """Module for classification."""
 
+from collections import Counter
 from typing import ClassVar
 
 from variation.classifiers import (
@@ -31,6 +32,29 @@ from variation.schemas.classification_response_schema import Classification
 from variation.schemas.token_response_schema import Token, TokenType
 
 
+def _get_classifier_dispatch(
+    classifiers: list[Classifier],
+) -> dict[tuple[TokenType, ...], list[Classifier]]:
+    """Get classifiers that can classify each sequence of token types
+
+    A classifier can classify a sequence of token types when exactly one of its exact
+    match candidates is that sequence. See `Classifier.can_classify`.
+
+    :param classifiers: Classifiers, in priority order
+    :return: Dictionary mapping token types to the classifiers that can classify them,
+        in priority order
+    """
+    dispatch: dict[tuple[TokenType, ...], list[Classifier]] = {}
+    for classifier in classifiers:
+        candidate_counts = Counter(
+            tuple(candidate) for candidate in classifier.exact_match_candidates()
+        )
+        for token_types, count in candidate_counts.items():
+            if count == 1:
+                dispatch.setdefault(token_types, []).append(classifier)
+    return dispatch
+
+
 class Classify:
     """The classify class."""
 
@@ -45,7 +69,6 @@ class Classify:
         GenomicSubstitutionClassifier(),
         CdnaReferenceAgreeClassifier(),
         GenomicReferenceAgreeClassifier(),
-        ProteinDelInsClassifier(),
         CdnaDelInsClassifier(),
         GenomicDelInsClassifier(),
         ProteinDeletionClassifier(),
@@ -59,6 +82,9 @@ class Classify:
         GenomicDuplicationAmbiguousClassifier(),
         AmplificationClassifier(),
     ]
+    classifier_dispatch: ClassVar[dict[tuple[TokenType, ...], list[Classifier]]] = (
+        _get_classifier_dispatch(classifiers)
+    )
 
     def perform(self, tokens: list[Token]) -> Classification | None:
         """Classify a list of tokens.
@@ -76,12 +102,11 @@ class Classify:
             elif token_type == TokenType.GNOMAD_VCF:
                 classification = self.gnomad_vcf_classifier.match(tokens[0])
         else:
-            for classifier in self.classifiers:
-                # We only do EXACT match candidates
-                can_classify = classifier.can_classify(tokens)
-                if can_classify:
-                    classification = classifier.match(tokens)
-                    if classification:
-                        break
+            # We only do EXACT match candidates
+            token_types = tuple(t.token_type for t in tokens)
+            for classifier in self.classifier_dispatch.get(token_types, []):
+                classification = classifier.match(tokens)
+                if classification:
+                    break
 
         return classification
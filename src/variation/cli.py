@@ -0,0 +1,155 @@
+"""Provide command-line interface for bulk variation normalization."""
+
+import argparse
+import asyncio
+import csv
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TextIO
+
+from variation.gnomad_vcf_to_protein_variation import (
+    DEFAULT_VCF_CHUNK_SIZE,
+    DEFAULT_VCF_MAX_CONCURRENCY,
+)
+from variation.log_config import configure_logging
+from variation.query import QueryHandler
+from variation.schemas.gnomad_vcf_to_protein_schema import GnomadVcfToProteinService
+from variation.schemas.service_schema import ClinVarAssembly
+
+TSV_HEADER = [
+    "variation_query",
+    "variation_id",
+    "refget_accession",
+    "start",
+    "end",
+    "ref",
+    "alt",
+    "gene",
+    "warnings",
+]
+
+
+def _get_tsv_row(resp: GnomadVcfToProteinService) -> list[str]:
+    """Get TSV row for a gnomAD-VCF to protein response
+
+    :param resp: Response for a single gnomAD-VCF query
+    :return: Row values, in the same order as `TSV_HEADER`
+    """
+    variation = resp.variation
+    gene = resp.gene_context.name if resp.gene_context else ""
+    warnings = "; ".join(resp.warnings)
+    if not variation:
+        return [resp.variation_query, "", "", "", "", "", "", gene, warnings]
+
+    location = variation.location
+    return [
+        resp.variation_query,
+        variation.id,
+        location.sequenceReference.refgetAccession,
+        str(location.start),
+        str(location.end),
+        location.sequence.root if location.sequence else "",
+        variation.state.sequence.root,
+        gene,
+        warnings,
+    ]
+
+
+async def _write_gnomad_vcf_to_protein(
+    vcf_path: Path,
+    out: TextIO,
+    output_format: str,
+    input_assembly: ClinVarAssembly | None,
+    chunk_size: int,
+    max_concurrency: int,
+) -> None:
+    """Write protein consequences for every record in a VCF file
+
+    :param vcf_path: Path to VCF or VCF.gz file
+    :param out: Stream to write output to
+    :param output_format: Either `tsv` or `ndjson`
+    :param input_assembly: Assembly used for `vcf_path`
+    :param chunk_size: Number of queries to process at a time
+    :param max_concurrency: Maximum number of lookups to run at the same time within
+        a chunk
+    """
+    handler = QueryHandler().gnomad_vcf_to_protein_handler
+
+    writer = None
+    if output_format == "tsv":
+        writer = csv.writer(out, delimiter="\t", lineterminator="\n")
+        writer.writerow(TSV_HEADER)
+
+    async for resp in handler.gnomad_vcf_file_to_protein(
+        vcf_path,
+        input_assembly=input_assembly,
+        chunk_size=chunk_size,
+        max_concurrency=max_concurrency,
+    ):
+        if writer:
+            writer.writerow(_get_tsv_row(resp))
+        else:
+            out.write(resp.model_dump_json(exclude_none=True) + "\n")
+
+
+def gnomad_vcf_to_protein(args: list[str] | None = None) -> None:
+    """Get protein VRS Alleles for every record in a VCF or VCF.gz file.
+
+    Multi-allelic records are split into one output row per ALT allele.
+
+    :param args: Command-line arguments. If not provided, uses `sys.argv`
+    """
+    parser = argparse.ArgumentParser(
+        description="Get protein VRS Alleles for every record in a VCF or VCF.gz file."
+    )
+    parser.add_argument("vcf_path", type=Path, help="Path to VCF or VCF.gz file")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Path to write output to. If not provided, writes to stdout",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["tsv", "ndjson"],
+        default="tsv",
+        help="Output format",
+    )
+    parser.add_argument(
+        "-a",
+        "--input-assembly",
+        choices=[ClinVarAssembly.GRCH37.value, ClinVarAssembly.GRCH38.value],
+        help="Assembly used for VCF. If not provided, will try to first validate against GRCh38 and then GRCh37",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_VCF_CHUNK_SIZE,
+        help="Number of records to process at a time",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_VCF_MAX_CONCURRENCY,
+        help="Maximum number of lookups to run at the same time within a chunk",
+    )
+    parsed = parser.parse_args(args)
+    configure_logging()
+
+    input_assembly = (
+        ClinVarAssembly(parsed.input_assembly) if parsed.input_assembly else None
+    )
+    out_ctx = parsed.output.open("w") if parsed.output else nullcontext(sys.stdout)
+    with out_ctx as out:
+        asyncio.run(
+            _write_gnomad_vcf_to_protein(
+                parsed.vcf_path,
+                out,
+                parsed.format,
+                input_assembly,
+                parsed.chunk_size,
+                parsed.max_concurrency,
+            )
+        )
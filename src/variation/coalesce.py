@@ -0,0 +1,112 @@
+"""Module for coalescing identical concurrent requests."""
+
+import asyncio
+import functools
+import inspect
+import logging
+from typing import TYPE_CHECKING, NamedTuple
+
+from pydantic import BaseModel
+
+from variation.query_key import get_query_call, get_query_text_key, use_query_call
+from variation.result_cache import has_variation
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+_logger = logging.getLogger(__name__)
+
+
+class CoalescingInfo(NamedTuple):
+    """Statistics for request coalescing"""
+
+    requests: int  # Requests with a canonical query key
+    coalesced: int  # Requests that used the response of another request
+    in_flight: int  # Unique requests currently in progress
+
+
+class _InFlight(NamedTuple):
+    """Request in progress"""
+
+    query_text_key: str
+    future: asyncio.Future
+
+
+class RequestCoalescer:
+    """Shares a single computation between identical concurrent requests.
+
+    Requests are identical if they have the same canonical query key (see
+    `variation.query_key.get_query_key`) and options. While a request is in progress,
+    identical requests wait for its response instead of running the pipeline again,
+    and get a copy with their own query. Responses without a variation may include the
+    query in their warnings, so they are only shared by requests with the same query
+    text; other requests run the pipeline themselves. Nothing is kept once a request
+    completes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the RequestCoalescer class"""
+        self._in_flight: dict[Hashable, _InFlight] = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    def coalesce_method(self, handler: object, name: str, query_field: str) -> None:
+        """Coalesce identical concurrent calls of a handler's method
+
+        :param handler: Handler instance with `tokenizer` and `classifier` attributes
+        :param name: Name of async method that returns a response. The first argument
+            must be the query.
+        :param query_field: Name of the response field that contains the query
+        """
+        method: Callable[..., Awaitable[BaseModel]] = getattr(handler, name)
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def _coalesced_method(*args, **kwargs) -> BaseModel:
+            call = await get_query_call(handler, signature, args, kwargs)
+            # Wrapped methods (and the tasks below) reuse the query key
+            with use_query_call(handler, call):
+                if call.query_key is None:
+                    return await method(*args, **kwargs)
+
+                key = (id(handler), name, tuple(call.arguments.items()))
+                try:
+                    hash(key)
+                except TypeError:
+                    return await method(*args, **kwargs)
+
+                self._requests += 1
+                query_text_key = get_query_text_key(call.query)
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    future = asyncio.ensure_future(method(*args, **kwargs))
+                    self._in_flight[key] = _InFlight(query_text_key, future)
+                    future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+                    # Shield request so that it still completes for identical requests
+                    # if this request is cancelled
+                    return await asyncio.shield(future)
+
+                same_text = in_flight.query_text_key == query_text_key
+                try:
+                    response = await asyncio.shield(in_flight.future)
+                except Exception:
+                    if same_text:
+                        self._coalesced += 1
+                        raise
+                    return await method(*args, **kwargs)
+
+                if not same_text and not has_variation(response):
+                    return await method(*args, **kwargs)
+
+            self._coalesced += 1
+            _logger.debug("Coalesced request: %s(%r)", name, call.query)
+            return response.model_copy(update={query_field: call.query})
+
+        setattr(handler, name, _coalesced_method)
+
+    def coalescing_info(self) -> CoalescingInfo:
+        """Get coalescing statistics
+
+        :return: Number of requests, coalesced requests and requests in progress
+        """
+        return CoalescingInfo(self._requests, self._coalesced, len(self._in_flight))
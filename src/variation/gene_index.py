@@ -0,0 +1,119 @@
+"""Module for an in-memory index of gene coordinates."""
+
+import logging
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from gene.query import QueryHandler as GeneQueryHandler
+from gene.schemas import RecordType, SourceName
+
+_logger = logging.getLogger(__name__)
+
+
+class GeneInterval(NamedTuple):
+    """Location of a gene on a sequence"""
+
+    symbol: str
+    refget_accession: str
+    start: int  # Inter-residue
+    end: int  # Inter-residue
+
+
+class GeneIntervalIndex:
+    """Index of Ensembl gene locations (GRCh38).
+
+    Genes can be looked up by symbol, and genes containing a position on a sequence
+    are found with a binary search over gene start positions.
+    """
+
+    def __init__(self, intervals: Iterable[GeneInterval]) -> None:
+        """Initialize the GeneIntervalIndex class
+
+        :param intervals: Gene locations
+        """
+        self._symbols: dict[str, GeneInterval | None] = {}
+        by_sequence: dict[str, list[GeneInterval]] = defaultdict(list)
+        for interval in intervals:
+            key = interval.symbol.upper()
+            # Symbols with more than one location are ambiguous
+            self._symbols[key] = None if key in self._symbols else interval
+            by_sequence[interval.refget_accession].append(interval)
+
+        self._intervals: dict[str, list[GeneInterval]] = {}
+        self._starts: dict[str, list[int]] = {}
+        self._max_lengths: dict[str, int] = {}
+        for refget_accession, seq_intervals in by_sequence.items():
+            seq_intervals.sort(key=lambda i: (i.start, i.end))
+            self._intervals[refget_accession] = seq_intervals
+            self._starts[refget_accession] = [i.start for i in seq_intervals]
+            self._max_lengths[refget_accession] = max(
+                i.end - i.start for i in seq_intervals
+            )
+
+    def __len__(self) -> int:
+        """Return the number of genes in the index"""
+        return sum(len(i) for i in self._intervals.values())
+
+    @classmethod
+    def from_gene_normalizer(
+        cls, gene_normalizer: GeneQueryHandler
+    ) -> "GeneIntervalIndex":
+        """Build index from every Ensembl gene record in the gene normalizer database
+
+        :param gene_normalizer: Gene normalizer QueryHandler
+        :return: Gene interval index
+        """
+        intervals = []
+        for record in gene_normalizer.db.get_all_records(RecordType.IDENTITY):
+            if record.get("src_name") != SourceName.ENSEMBL.value:
+                continue
+
+            symbol = record.get("symbol")
+            locations = record.get("locations")
+            if not symbol or not locations:
+                continue
+
+            # Same location that the gene normalizer search would use
+            loc = locations[0]
+            if loc.get("type") != "SequenceLocation":
+                continue
+
+            # DynamoDB stores as Decimal, so need to convert to int
+            intervals.append(
+                GeneInterval(
+                    symbol,
+                    loc["sequenceReference"]["refgetAccession"],
+                    int(loc["start"]),
+                    int(loc["end"]),
+                )
+            )
+        _logger.info("Loaded %s gene locations into gene index", len(intervals))
+        return cls(intervals)
+
+    def get_gene(self, symbol: str) -> GeneInterval | None:
+        """Get location of a gene
+
+        :param symbol: Gene symbol. Case-insensitive.
+        :return: Gene location if the symbol has exactly one location in the index.
+            Else, `None`
+        """
+        return self._symbols.get(symbol.upper())
+
+    def get_genes(self, refget_accession: str, pos: int) -> list[GeneInterval]:
+        """Get genes that contain a position
+
+        :param refget_accession: Refget accession of sequence
+        :param pos: Inter-residue position. Genes contain the residue immediately after
+            this position.
+        :return: Locations of genes that contain `pos`, sorted by start position
+        """
+        starts = self._starts.get(refget_accession)
+        if not starts:
+            return []
+
+        intervals = self._intervals[refget_accession]
+        lo = bisect_left(starts, pos - self._max_lengths[refget_accession] + 1)
+        hi = bisect_right(starts, pos)
+        return [i for i in intervals[lo:hi] if i.end > pos]
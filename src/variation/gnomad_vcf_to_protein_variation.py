@@ -1,7 +1,12 @@
 """Module for translating gnomAD-VCF to protein VRS Allele representation"""
 
+import asyncio
 import datetime
-from typing import TYPE_CHECKING, Literal
+import gzip
+import logging
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, NamedTuple, TextIO
 
 from cool_seq_tool.handlers import SeqRepoAccess
 from cool_seq_tool.mappers import ManeTranscript
@@ -11,8 +16,11 @@ from ga4gh.core.models import MappableConcept
 from ga4gh.vrs import models, normalize
 from gene.query import QueryHandler as GeneQueryHandler
 from gene.schemas import MatchType as GeneMatchType
+from gene.schemas import NormalizeService as GeneNormalizeService
 
 from variation import __version__
+from variation.async_gene import get_async_gene_normalizer
+from variation.async_seqrepo import get_async_seqrepo_access
 from variation.classify import Classify
 from variation.schemas.classification_response_schema import Nomenclature
 from variation.schemas.gnomad_vcf_to_protein_schema import GnomadVcfToProteinService
@@ -33,11 +41,128 @@ if TYPE_CHECKING:
         ProteinAndCdnaRepresentation,
     )
 
+_logger = logging.getLogger(__name__)
+
+
+# Number of gnomAD-VCF queries to process at a time in bulk mode
+DEFAULT_VCF_CHUNK_SIZE = 1000
+
+# Maximum number of lookups to run at the same time within a chunk in bulk mode
+DEFAULT_VCF_MAX_CONCURRENCY = 10
+
+# Approximate number of bytes of a VCF file to read at a time in bulk mode
+VCF_READ_SIZE = 1 << 20
+
+# Codon-aligned intervals within this many bases of each other share a single
+# reference sequence fetch in bulk mode, up to a total window size
+MAX_REFERENCE_WINDOW_GAP = 1000
+MAX_REFERENCE_WINDOW_SIZE = 100_000
+
 
 class GnomadVcfToProteinError(Exception):
     """Custom exception for gnomAD VCF To Protein specific errors"""
 
 
+class GenomicChange(NamedTuple):
+    """Represent a genomic change on GRCh38 (residue coordinates)"""
+
+    ac: str
+    start: int
+    end: int
+    ref: str
+    alt: str
+    alt_type: AltType
+
+
+class ReferenceWindow(NamedTuple):
+    """Represent genomic reference sequence that has already been fetched"""
+
+    ac: str
+    start: int  # residue
+    end: int  # residue
+    sequence: str
+
+    def get_sequence(self, ac: str, start: int, end: int) -> str | None:
+        """Get reference sequence for an interval within the window
+
+        :param ac: Genomic RefSeq accession
+        :param start: Start position (residue coordinates)
+        :param end: End position (residue coordinates)
+        :return: Reference sequence if interval is contained in the window. Otherwise,
+            `None`
+        """
+        if ac != self.ac or start < self.start or end > self.end or start > end:
+            return None
+        return self.sequence[start - self.start : end - self.start + 1]
+
+
+def get_gnomad_vcf_queries(vcf_line: str) -> list[str]:
+    """Get gnomAD-VCF queries for a VCF record. Multi-allelic records are split into
+    one query per ALT allele.
+
+    Header lines, missing ALT alleles (`.`) and spanning deletions (`*`) do not have
+    queries.
+
+    :param vcf_line: Line from a VCF file
+    :return: List of gnomAD-VCF queries (`chr-pos-ref-alt`)
+    """
+    vcf_line = vcf_line.rstrip("\r\n")
+    if not vcf_line or vcf_line.startswith("#"):
+        return []
+
+    try:
+        chrom, pos, _, ref, alts = vcf_line.split("\t", 5)[:5]
+    except ValueError:
+        # Malformed record. Use as query so that it is reported
+        return [vcf_line.strip()]
+
+    return [
+        f"{chrom}-{pos}-{ref}-{alt}" for alt in alts.split(",") if alt not in {".", "*"}
+    ]
+
+
+def _open_vcf(vcf_path: Path) -> TextIO:
+    """Open a VCF file for reading
+
+    :param vcf_path: Path to VCF file. Files ending in `.gz` or `.bgz` are read with
+        gzip.
+    :return: Text stream for VCF file
+    """
+    if vcf_path.suffix in {".gz", ".bgz"}:
+        return gzip.open(vcf_path, "rt")
+    return vcf_path.open()
+
+
+async def _read_vcf_queries(vcf_path: Path) -> AsyncGenerator[str, None]:
+    """Read gnomAD-VCF queries from a VCF file without blocking the event loop
+
+    Lines are read (and decompressed) on a worker thread, `VCF_READ_SIZE` bytes at a
+    time.
+
+    :param vcf_path: Path to VCF file. Files ending in `.gz` or `.bgz` are read with
+        gzip.
+    :return: Async generator yielding gnomAD-VCF queries, in file order
+    """
+    f = await asyncio.to_thread(_open_vcf, vcf_path)
+    try:
+        while lines := await asyncio.to_thread(f.readlines, VCF_READ_SIZE):
+            for line in lines:
+                for vcf_query in get_gnomad_vcf_queries(line):
+                    yield vcf_query
+    finally:
+        f.close()
+
+
+async def _aiter(items: Iterable[str]) -> AsyncGenerator[str, None]:
+    """Wrap an iterable so that it can be consumed with `async for`
+
+    :param items: Iterable to wrap
+    :return: Async generator yielding `items`
+    """
+    for item in items:
+        yield item
+
+
 def _get_char_match_count(
     min_length: int, ref: str, alt: str, trim_prefix: bool = True
 ) -> int:
@@ -184,12 +309,14 @@ class GnomadVcfToProteinVariation:
         :param gene_normalizer: Client for normalizing gene concepts
         """
         self.seqrepo_access = seqrepo_access
+        self.async_seqrepo_access = get_async_seqrepo_access(seqrepo_access)
         self.tokenizer = tokenizer
         self.classifier = classifier
         self.validator = validator
         self.translator = translator
         self.mane_transcript = mane_transcript
         self.gene_normalizer = gene_normalizer
+        self.async_gene_normalizer = get_async_gene_normalizer(gene_normalizer)
 
     async def _get_valid_result(
         self,
@@ -206,6 +333,7 @@ class GnomadVcfToProteinVariation:
             are found. Also if `vcf_query` is not a gnomAD-VCF query.
         :return: List of valid results for a gnomAD-VCF query
         """
+        await self.tokenizer.prefetch_genes(vcf_query)
         tokens = self.tokenizer.perform(vcf_query, warnings)
         if not tokens:
             msg = "No tokens found"
@@ -311,7 +439,7 @@ class GnomadVcfToProteinVariation:
             genomic_start_ix,
         )
 
-    def _get_codon_aligned_alternate_sequence(
+    async def _get_codon_aligned_alternate_sequence(
         self,
         g_ac: str,
         g_input_alt: str,
@@ -391,7 +519,7 @@ class GnomadVcfToProteinVariation:
                 remainder = len(alt) % 3
                 if remainder:
                     tmp_g_end_pos = g_end_pos + (3 - remainder)
-                    tmp_ref, _ = self.seqrepo_access.get_reference_sequence(
+                    tmp_ref, _ = await self.async_seqrepo_access.get_reference_sequence(
                         g_ac, g_end_pos, tmp_g_end_pos
                     )
                     alt += tmp_ref
@@ -480,56 +608,91 @@ class GnomadVcfToProteinVariation:
         variation.location.id = ga4gh_identify(variation.location)
         return variation
 
-    def _get_gene_context(self, gene: str) -> MappableConcept | None:
-        """Get additional gene information from gene-normalizer
+    @staticmethod
+    def _get_gene_from_response(
+        gene_norm_resp: GeneNormalizeService,
+    ) -> MappableConcept | None:
+        """Get gene data from a gene-normalizer response
 
-        :param gene: Gene symbol
-        :return: Gene data from gene-normalizer if match found
+        :param gene_norm_resp: Gene-normalizer response
+        :return: Gene data if match found
         """
-        gene_norm_resp = self.gene_normalizer.normalize(gene)
         return (
             gene_norm_resp.gene
             if gene_norm_resp.match_type != GeneMatchType.NO_MATCH
             else None
         )
 
-    async def gnomad_vcf_to_protein(
-        self,
+    async def _get_gene_context(self, gene: str) -> MappableConcept | None:
+        """Get additional gene information from gene-normalizer
+
+        :param gene: Gene symbol
+        :return: Gene data from gene-normalizer if match found
+        """
+        gene_norm_resp = await self.async_gene_normalizer.normalize(gene)
+        return self._get_gene_from_response(gene_norm_resp)
+
+    async def _get_gene_contexts(
+        self, genes: Iterable[str]
+    ) -> dict[str, MappableConcept | None]:
+        """Get additional gene information from gene-normalizer for several genes.
+        Genes are looked up concurrently.
+
+        :param genes: Gene symbols
+        :return: Gene data from gene-normalizer for each gene, if match found
+        """
+        gene_norm_resps = await self.async_gene_normalizer.normalize_many(genes)
+        return {
+            gene: self._get_gene_from_response(gene_norm_resp)
+            for gene, gene_norm_resp in gene_norm_resps.items()
+        }
+
+    @staticmethod
+    def _get_service(
         vcf_query: str,
-        input_assembly: Literal[ClinVarAssembly.GRCH37, ClinVarAssembly.GRCH38]
-        | None = None,
+        warnings: list[str],
+        variation: models.Allele | None = None,
+        gene_context: MappableConcept | None = None,
     ) -> GnomadVcfToProteinService:
-        """Given genomic gnomAD-VCF expression, return associated protein consequence
-
-        Genomic variant -> cDNA variant -> protein variant
-        If `input_assembly` is GRCh37, will attempt to liftover to GRCh38
+        """Get response for a gnomAD-VCF query
 
-        :param vcf_query: gnomAD-VCF expression of the form `chr-pos-ref-alt`. For
-            example, `7-140753336-A-T`. gnomAD-VCF uses 1-based inclusive coordinates.
-        :param input_assembly: Assembly used for `vcf_query`. If not provided, will try
-            to first validate against GRCh38 and then GRCh37
-        :return: GnomadVcfToProteinService containing protein VRS Allele, if validation
-            and translation was successful
+        :param vcf_query: gnomAD-VCF input query
+        :param warnings: List of warnings
+        :param variation: Protein VRS Allele, if translation was successful
+        :param gene_context: Gene data from gene-normalizer, if found
+        :return: GnomadVcfToProteinService for `vcf_query`
         """
-        variation = None
-        warnings = []
+        return GnomadVcfToProteinService(
+            variation_query=vcf_query,
+            variation=variation,
+            gene_context=gene_context,
+            warnings=warnings,
+            service_meta_=ServiceMeta(
+                version=__version__,
+                response_datetime=datetime.datetime.now(tz=datetime.UTC),
+            ),
+        )
+
+    async def _get_genomic_change(
+        self,
+        vcf_query: str,
+        warnings: list,
+        input_assembly: Literal[ClinVarAssembly.GRCH37, ClinVarAssembly.GRCH38] | None,
+    ) -> GenomicChange:
+        """Get the GRCh38 genomic change for a gnomAD-VCF query
 
+        :param vcf_query: gnomAD-VCF input query
+        :param warnings: List of warnings
+        :param input_assembly: Assembly used for `vcf_query`. If GRCh37, will attempt
+            to liftover to GRCh38
+        :raises GnomadVcfToProteinError: If `vcf_query` is not valid or unable to
+            liftover to GRCh38
+        :return: Genomic change on GRCh38 (residue coordinates)
+        """
         # Ensure `vcf_query` is valid (both syntax and reference sequence)
-        try:
-            valid_result: ValidationResult = await self._get_valid_result(
-                vcf_query, warnings, input_assembly=input_assembly
-            )
-        except GnomadVcfToProteinError as e:
-            warnings.append(str(e))
-            return GnomadVcfToProteinService(
-                variation_query=vcf_query,
-                variation=variation,
-                warnings=warnings,
-                service_meta_=ServiceMeta(
-                    version=__version__,
-                    response_datetime=datetime.datetime.now(tz=datetime.UTC),
-                ),
-            )
+        valid_result = await self._get_valid_result(
+            vcf_query, warnings, input_assembly=input_assembly
+        )
 
         # Get relevant genomic information from input `vcf_query`
         token: GnomadVcfToken = valid_result.classification.matching_tokens[0]  # type: ignore
@@ -549,18 +712,8 @@ class GnomadVcfToProteinVariation:
                 coordinate_type=CoordinateType.RESIDUE,
             )
             if not grch38_rep:
-                warnings.append(
-                    f"Unable to liftover {vcf_query} to GRCh38 representation"
-                )
-                return GnomadVcfToProteinService(
-                    variation_query=vcf_query,
-                    variation=variation,
-                    warnings=warnings,
-                    service_meta_=ServiceMeta(
-                        version=__version__,
-                        response_datetime=datetime.datetime.now(tz=datetime.UTC),
-                    ),
-                )
+                msg = f"Unable to liftover {vcf_query} to GRCh38 representation"
+                raise GnomadVcfToProteinError(msg)
 
             g_ac = grch38_rep.ac
             g_start_pos = grch38_rep.pos[0] + 1  # Change back to residue
@@ -576,87 +729,114 @@ class GnomadVcfToProteinVariation:
         alt_type: AltType = self._get_genomic_alt_type(
             len_g_ref, len_g_alt, g_ref, g_alt
         )
+        return GenomicChange(g_ac, g_start_pos, g_end_pos, g_ref, g_alt, alt_type)
 
-        # Given genomic data, get associated cDNA and protein consequences
-        p_c_data: (
-            ProteinAndCdnaRepresentation | None
-        ) = await self.mane_transcript.grch38_to_mane_c_p(
-            g_ac,
-            g_start_pos,
-            g_end_pos,
+    async def _get_mane_c_p(
+        self, change: GenomicChange
+    ) -> "ProteinAndCdnaRepresentation | None":
+        """Get associated cDNA and protein representation for a genomic change
+
+        :param change: Genomic change on GRCh38
+        :return: cDNA and protein representation if found
+        """
+        return await self.mane_transcript.grch38_to_mane_c_p(
+            change.ac,
+            change.start,
+            change.end,
             try_longest_compatible=True,
             coordinate_type=CoordinateType.RESIDUE,
         )
-        if not p_c_data:
-            warnings.append("Unable to get cDNA and protein representation")
-            return GnomadVcfToProteinService(
-                variation_query=vcf_query,
-                variation=variation,
-                warnings=warnings,
-                service_meta_=ServiceMeta(
-                    version=__version__,
-                    response_datetime=datetime.datetime.now(tz=datetime.UTC),
-                ),
-            )
+
+    async def _get_codon_aligned_ref_seq(
+        self,
+        g_ac: str,
+        start: int,
+        end: int,
+        ref_windows: list[ReferenceWindow] | None = None,
+    ) -> str:
+        """Get genomic reference sequence for a codon-aligned interval
+
+        :param g_ac: Genomic RefSeq accession
+        :param start: Codon-aligned interval start position (residue coordinates)
+        :param end: Codon-aligned interval end position (residue coordinates)
+        :param ref_windows: Reference sequences that have already been fetched. If
+            none of them contain the interval, SeqRepo will be queried.
+        :raises GnomadVcfToProteinError: If unable to get the reference sequence
+        :return: Genomic reference sequence
+        """
+        for ref_window in ref_windows or []:
+            seq = ref_window.get_sequence(g_ac, start, end)
+            if seq is not None:
+                return seq
+
+        seq, w = await self.async_seqrepo_access.get_reference_sequence(
+            g_ac, start, end, coordinate_type=CoordinateType.RESIDUE
+        )
+        if w:
+            raise GnomadVcfToProteinError(w)
+        return seq
+
+    async def _get_protein_consequence(
+        self,
+        vcf_query: str,
+        change: GenomicChange,
+        p_c_data: "ProteinAndCdnaRepresentation",
+        p_ga4gh_seq_id: list[str],
+        warnings: list[str],
+        ref_windows: list[ReferenceWindow] | None = None,
+        gene_contexts: dict[str, MappableConcept | None] | None = None,
+    ) -> GnomadVcfToProteinService:
+        """Get protein consequence for a genomic change
+
+        :param vcf_query: gnomAD-VCF input query
+        :param change: Genomic change on GRCh38
+        :param p_c_data: cDNA and protein representation for `change`
+        :param p_ga4gh_seq_id: GA4GH identifier for protein accession
+        :param warnings: List of warnings
+        :param ref_windows: Genomic reference sequences that have already been fetched
+        :param gene_contexts: Gene data that has already been fetched, keyed by gene
+            symbol. Will be mutated if gene data is fetched.
+        :return: GnomadVcfToProteinService containing protein VRS Allele, if
+            translation was successful
+        """
+        variation = None
 
         # NOTE: These coordinates are inter-residue
         p_data: DataRepresentation = p_c_data.protein
         c_data: CdnaRepresentation = p_c_data.cdna
-
-        # Get GA4GH identifier (`ga4gh:SQ.`) for protein accession.
-        # This is used later, but we want to fail fast
         p_ac = p_data.refseq or p_data.ensembl
-        p_ga4gh_seq_id, w = self.seqrepo_access.translate_identifier(p_ac, "ga4gh")
-        if w:
-            warnings.append(w)
-            return GnomadVcfToProteinService(
-                variation_query=vcf_query,
-                variation=variation,
-                warnings=warnings,
-                service_meta_=ServiceMeta(
-                    version=__version__,
-                    response_datetime=datetime.datetime.now(tz=datetime.UTC),
-                ),
-            )
 
         # Get genomic position range change (NOTE: these are residue coordinates)
         # This ensures that there 3 nucleotides needed for codon
         strand = c_data.strand
         codon_aligned_interval_start, codon_aligned_interval_end, genomic_start_ix = (
             self._get_codon_aligned_interval(
-                c_data.pos[0], c_data.pos[1], strand, g_start_pos, g_end_pos
+                c_data.pos[0], c_data.pos[1], strand, change.start, change.end
             )
         )
 
         # Get genomic reference sequence for the codon-aligned interval
-        codon_aligned_ref_seq, w = self.seqrepo_access.get_reference_sequence(
-            g_ac,
-            codon_aligned_interval_start,
-            codon_aligned_interval_end,
-            coordinate_type=CoordinateType.RESIDUE,
-        )
-        if w:
-            warnings.append(w)
-            return GnomadVcfToProteinService(
-                variation_query=vcf_query,
-                variation=variation,
-                warnings=warnings,
-                service_meta_=ServiceMeta(
-                    version=__version__,
-                    response_datetime=datetime.datetime.now(tz=datetime.UTC),
-                ),
+        try:
+            codon_aligned_ref_seq = await self._get_codon_aligned_ref_seq(
+                change.ac,
+                codon_aligned_interval_start,
+                codon_aligned_interval_end,
+                ref_windows=ref_windows,
             )
+        except GnomadVcfToProteinError as e:
+            warnings.append(str(e))
+            return self._get_service(vcf_query, warnings)
 
         if strand == Strand.NEGATIVE:
             codon_aligned_ref_seq = codon_aligned_ref_seq[::-1]
 
         # Get genomic altered sequence within a codon-aligned interval
-        codon_aligned_alt = self._get_codon_aligned_alternate_sequence(
-            g_ac,
-            g_alt,
-            len_g_ref,
+        codon_aligned_alt = await self._get_codon_aligned_alternate_sequence(
+            change.ac,
+            change.alt,
+            len(change.ref),
             codon_aligned_interval_end,
-            alt_type,
+            change.alt_type,
             genomic_start_ix,
             strand,
             codon_aligned_ref_seq,
@@ -687,15 +867,346 @@ class GnomadVcfToProteinVariation:
                 f"Protein gene ({p_data.gene}) and cDNA gene ({c_data.gene}) mismatch"
             )
         gene = p_data.gene or c_data.gene
-        gene_context = self._get_gene_context(gene) if gene else None
+        gene_context = None
+        if gene:
+            if gene_contexts is None:
+                gene_context = await self._get_gene_context(gene)
+            else:
+                if gene not in gene_contexts:
+                    gene_contexts[gene] = await self._get_gene_context(gene)
+                gene_context = gene_contexts[gene]
 
-        return GnomadVcfToProteinService(
-            variation_query=vcf_query,
-            variation=variation,
-            gene_context=gene_context,
-            warnings=warnings,
-            service_meta_=ServiceMeta(
-                version=__version__,
-                response_datetime=datetime.datetime.now(tz=datetime.UTC),
-            ),
+        return self._get_service(
+            vcf_query, warnings, variation=variation, gene_context=gene_context
         )
+
+    async def gnomad_vcf_to_protein(
+        self,
+        vcf_query: str,
+        input_assembly: Literal[ClinVarAssembly.GRCH37, ClinVarAssembly.GRCH38]
+        | None = None,
+    ) -> GnomadVcfToProteinService:
+        """Given genomic gnomAD-VCF expression, return associated protein consequence
+
+        Genomic variant -> cDNA variant -> protein variant
+        If `input_assembly` is GRCh37, will attempt to liftover to GRCh38
+
+        :param vcf_query: gnomAD-VCF expression of the form `chr-pos-ref-alt`. For
+            example, `7-140753336-A-T`. gnomAD-VCF uses 1-based inclusive coordinates.
+        :param input_assembly: Assembly used for `vcf_query`. If not provided, will try
+            to first validate against GRCh38 and then GRCh37
+        :return: GnomadVcfToProteinService containing protein VRS Allele, if validation
+            and translation was successful
+        """
+        warnings = []
+
+        try:
+            change = await self._get_genomic_change(
+                vcf_query, warnings, input_assembly=input_assembly
+            )
+        except GnomadVcfToProteinError as e:
+            warnings.append(str(e))
+            return self._get_service(vcf_query, warnings)
+
+        # Given genomic data, get associated cDNA and protein consequences
+        p_c_data = await self._get_mane_c_p(change)
+        if not p_c_data:
+            warnings.append("Unable to get cDNA and protein representation")
+            return self._get_service(vcf_query, warnings)
+
+        # Get GA4GH identifier (`ga4gh:SQ.`) for protein accession.
+        # This is used later, but we want to fail fast
+        p_ac = p_c_data.protein.refseq or p_c_data.protein.ensembl
+        p_ga4gh_seq_id, w = await self.async_seqrepo_access.translate_identifier(
+            p_ac, "ga4gh"
+        )
+        if w:
+            warnings.append(w)
+            return self._get_service(vcf_query, warnings)
+
+        return await self._get_protein_consequence(
+            vcf_query, change, p_c_data, p_ga4gh_seq_id, warnings
+        )
+
+    async def _get_reference_windows(
+        self, g_ac: str, intervals: list[tuple[int, int]]
+    ) -> list[ReferenceWindow]:
+        """Fetch genomic reference sequence covering a set of intervals
+
+        Nearby intervals are merged so that a single SeqRepo fetch is shared by all
+        of them.
+
+        :param g_ac: Genomic RefSeq accession
+        :param intervals: List of intervals (residue coordinates)
+        :return: List of fetched reference windows. Windows that could not be fetched
+            are excluded.
+        """
+        merged: list[list[int]] = []
+        for start, end in sorted(intervals):
+            if (
+                merged
+                and start - merged[-1][1] <= MAX_REFERENCE_WINDOW_GAP
+                and max(end, merged[-1][1]) - merged[-1][0] < MAX_REFERENCE_WINDOW_SIZE
+            ):
+                merged[-1][1] = max(end, merged[-1][1])
+            else:
+                merged.append([start, end])
+
+        ref_windows = []
+        for start, end in merged:
+            seq, w = await self.async_seqrepo_access.get_reference_sequence(
+                g_ac, start, end, coordinate_type=CoordinateType.RESIDUE
+            )
+            if not w:
+                ref_windows.append(ReferenceWindow(g_ac, start, end, seq))
+        return ref_windows
+
+    def _get_unhandled_exception_service(
+        self, vcf_query: str
+    ) -> GnomadVcfToProteinService:
+        """Log an unhandled exception for a gnomAD-VCF query and get its response
+
+        :param vcf_query: gnomAD-VCF input query
+        :return: GnomadVcfToProteinService for `vcf_query` with a warning
+        """
+        _logger.exception("Unhandled exception translating %s", vcf_query)
+        return self._get_service(
+            vcf_query, ["Unhandled exception. See logs for more details."]
+        )
+
+    async def _gnomad_vcf_chunk_to_protein(
+        self,
+        vcf_queries: list[str],
+        input_assembly: Literal[ClinVarAssembly.GRCH37, ClinVarAssembly.GRCH38] | None,
+        max_concurrency: int = DEFAULT_VCF_MAX_CONCURRENCY,
+    ) -> list[GnomadVcfToProteinService]:
+        """Get protein consequences for a chunk of gnomAD-VCF queries
+
+        Each step (validation, cDNA and protein representation lookup, and protein
+        consequence) runs concurrently across the chunk, with at most `max_concurrency`
+        lookups running at the same time. cDNA and protein representations are fetched
+        once per genomic interval, so the ALT alleles of a multi-allelic record share a
+        single lookup. Queries on the same transcript then share the protein identifier
+        lookup, codon reference windows, and gene data. An unhandled exception for a
+        query (or a group of queries) is logged and added as a warning to its
+        responses, so it does not affect the rest of the chunk.
+
+        :param vcf_queries: List of gnomAD-VCF queries
+        :param input_assembly: Assembly used for `vcf_queries`
+        :param max_concurrency: Maximum number of lookups to run at the same time
+        :return: List of GnomadVcfToProteinService, in the same order as `vcf_queries`
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        resps: dict[int, GnomadVcfToProteinService] = {}
+        warnings: list[list[str]] = [[] for _ in vcf_queries]
+
+        changes: dict[int, GenomicChange] = {}
+
+        async def _get_genomic_change(i: int) -> None:
+            async with semaphore:
+                try:
+                    changes[i] = await self._get_genomic_change(
+                        vcf_queries[i], warnings[i], input_assembly=input_assembly
+                    )
+                except GnomadVcfToProteinError as e:
+                    warnings[i].append(str(e))
+                    resps[i] = self._get_service(vcf_queries[i], warnings[i])
+                except Exception:
+                    resps[i] = self._get_unhandled_exception_service(vcf_queries[i])
+
+        await asyncio.gather(*(_get_genomic_change(i) for i in range(len(vcf_queries))))
+
+        # Split multi-allelic records share the same genomic interval
+        interval_ixs: dict[tuple[str, int, int], list[int]] = {}
+        for i in sorted(changes):
+            change = changes[i]
+            interval_ixs.setdefault((change.ac, change.start, change.end), []).append(i)
+
+        p_c_data_by_ix: dict[int, ProteinAndCdnaRepresentation] = {}
+
+        async def _get_mane_c_p(ixs: list[int]) -> None:
+            async with semaphore:
+                try:
+                    p_c_data = await self._get_mane_c_p(changes[ixs[0]])
+                except Exception:
+                    for i in ixs:
+                        resps[i] = self._get_unhandled_exception_service(vcf_queries[i])
+                    return
+
+            for i in ixs:
+                if p_c_data:
+                    p_c_data_by_ix[i] = p_c_data
+                else:
+                    warnings[i].append("Unable to get cDNA and protein representation")
+                    resps[i] = self._get_service(vcf_queries[i], warnings[i])
+
+        await asyncio.gather(*(_get_mane_c_p(ixs) for ixs in interval_ixs.values()))
+
+        groups: dict[tuple[str, str, str], list[int]] = {}
+        for i in sorted(p_c_data_by_ix):
+            p_c_data = p_c_data_by_ix[i]
+            p_ac = p_c_data.protein.refseq or p_c_data.protein.ensembl
+            c_ac = p_c_data.cdna.refseq or p_c_data.cdna.ensembl
+            groups.setdefault((p_ac, c_ac, changes[i].ac), []).append(i)
+
+        try:
+            gene_contexts = await self._get_gene_contexts(
+                gene
+                for p_c_data in p_c_data_by_ix.values()
+                if (gene := p_c_data.protein.gene or p_c_data.cdna.gene)
+            )
+        except Exception:
+            # Gene data is fetched for each query instead
+            _logger.exception("Unhandled exception getting gene contexts")
+            gene_contexts = {}
+
+        async def _get_protein_consequence(
+            i: int, p_ga4gh_seq_id: list[str], ref_windows: list[ReferenceWindow]
+        ) -> None:
+            async with semaphore:
+                try:
+                    resps[i] = await self._get_protein_consequence(
+                        vcf_queries[i],
+                        changes[i],
+                        p_c_data_by_ix[i],
+                        p_ga4gh_seq_id,
+                        warnings[i],
+                        ref_windows=ref_windows,
+                        gene_contexts=gene_contexts,
+                    )
+                except Exception:
+                    resps[i] = self._get_unhandled_exception_service(vcf_queries[i])
+
+        async def _get_group_protein_consequences(
+            p_ac: str, g_ac: str, ixs: list[int]
+        ) -> None:
+            # Release the slot before getting each query's protein consequence
+            async with semaphore:
+                try:
+                    (
+                        p_ga4gh_seq_id,
+                        w,
+                    ) = await self.async_seqrepo_access.translate_identifier(
+                        p_ac, "ga4gh"
+                    )
+                    if not w:
+                        intervals = []
+                        for i in ixs:
+                            c_data = p_c_data_by_ix[i].cdna
+                            start, end, _ = self._get_codon_aligned_interval(
+                                c_data.pos[0],
+                                c_data.pos[1],
+                                c_data.strand,
+                                changes[i].start,
+                                changes[i].end,
+                            )
+                            intervals.append((start, end))
+                        ref_windows = await self._get_reference_windows(g_ac, intervals)
+                except Exception:
+                    for i in ixs:
+                        resps[i] = self._get_unhandled_exception_service(vcf_queries[i])
+                    return
+
+            if w:
+                for i in ixs:
+                    warnings[i].append(w)
+                    resps[i] = self._get_service(vcf_queries[i], warnings[i])
+                return
+
+            await asyncio.gather(
+                *(_get_protein_consequence(i, p_ga4gh_seq_id, ref_windows) for i in ixs)
+            )
+
+        await asyncio.gather(
+            *(
+                _get_group_protein_consequences(p_ac, g_ac, ixs)
+                for (p_ac, _, g_ac), ixs in groups.items()
+            )
+        )
+
+        return [resps[i] for i in range(len(vcf_queries))]
+
+    async def gnomad_vcf_records_to_protein(
+        self,
+        vcf_queries: AsyncIterable[str] | Iterable[str],
+        input_assembly: Literal[ClinVarAssembly.GRCH37, ClinVarAssembly.GRCH38]
+        | None = None,
+        chunk_size: int = DEFAULT_VCF_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_VCF_MAX_CONCURRENCY,
+    ) -> AsyncGenerator[GnomadVcfToProteinService, None]:
+        """Get protein consequences for a stream of gnomAD-VCF queries
+
+        Queries are processed in chunks of `chunk_size`. Within a chunk, queries are
+        processed concurrently, queries on the same genomic interval share cDNA and
+        protein representation lookups, and queries on the same transcript share codon
+        reference sequence fetches, so input sorted by position (as in a VCF) gets the
+        most reuse.
+
+        :param vcf_queries: gnomAD-VCF queries of the form `chr-pos-ref-alt`. Use
+            `get_gnomad_vcf_queries` to get these from VCF records.
+        :param input_assembly: Assembly used for `vcf_queries`. If not provided, will
+            try to first validate against GRCh38 and then GRCh37
+        :param chunk_size: Number of queries to process at a time
+        :param max_concurrency: Maximum number of lookups to run at the same time
+            within a chunk
+        :raises ValueError: If `chunk_size` or `max_concurrency` is less than 1
+        :return: Async generator yielding a GnomadVcfToProteinService for each query, in
+            the same order as `vcf_queries`
+        """
+        if chunk_size < 1:
+            msg = "`chunk_size` must be greater than 0"
+            raise ValueError(msg)
+
+        if max_concurrency < 1:
+            msg = "`max_concurrency` must be greater than 0"
+            raise ValueError(msg)
+
+        if not isinstance(vcf_queries, AsyncIterable):
+            vcf_queries = _aiter(vcf_queries)
+
+        chunk = []
+        async for vcf_query in vcf_queries:
+            chunk.append(vcf_query)
+            if len(chunk) == chunk_size:
+                for resp in await self._gnomad_vcf_chunk_to_protein(
+                    chunk, input_assembly, max_concurrency=max_concurrency
+                ):
+                    yield resp
+                chunk = []
+
+        if chunk:
+            for resp in await self._gnomad_vcf_chunk_to_protein(
+                chunk, input_assembly, max_concurrency=max_concurrency
+            ):
+                yield resp
+
+    async def gnomad_vcf_file_to_protein(
+        self,
+        vcf_path: Path,
+        input_assembly: Literal[ClinVarAssembly.GRCH37, ClinVarAssembly.GRCH38]
+        | None = None,
+        chunk_size: int = DEFAULT_VCF_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_VCF_MAX_CONCURRENCY,
+    ) -> AsyncGenerator[GnomadVcfToProteinService, None]:
+        """Get protein consequences for every record in a VCF or VCF.gz file
+
+        The file is streamed and multi-allelic records are split into one query per
+        ALT allele.
+
+        :param vcf_path: Path to VCF file. Files ending in `.gz` or `.bgz` are read
+            with gzip.
+        :param input_assembly: Assembly used for `vcf_path`. If not provided, will try
+            to first validate against GRCh38 and then GRCh37
+        :param chunk_size: Number of queries to process at a time
+        :param max_concurrency: Maximum number of lookups to run at the same time
+            within a chunk
+        :return: Async generator yielding a GnomadVcfToProteinService for each ALT
+            allele, in file order
+        """
+        async for resp in self.gnomad_vcf_records_to_protein(
+            _read_vcf_queries(vcf_path),
+            input_assembly=input_assembly,
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
+        ):
+            yield resp
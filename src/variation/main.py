@@ -1,18 +1,23 @@
 """Main application for FastAPI."""
 
+import codecs
 import datetime
 import logging
+import os
 import traceback
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from enum import Enum
+from pathlib import Path
 from typing import Annotated, Literal
 from urllib.parse import unquote
 
 from bioutils.exceptions import BioutilsError
 from cool_seq_tool.mappers.feature_overlap import FeatureOverlap, FeatureOverlapError
 from cool_seq_tool.schemas import Assembly, CoordinateType
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
 from ga4gh.vrs import __version__ as vrs_python_version
 from ga4gh.vrs import models
 from ga4gh.vrs.dataproxy import DataProxyValidationError
@@ -20,9 +25,30 @@ from hgvs.exceptions import HGVSError
 from pydantic import ValidationError
 
 from variation import __version__
+from variation.admission import (
+    DEFAULT_MAX_QUEUE_SIZE,
+    DEFAULT_QUEUE_TIMEOUT,
+    AdmissionController,
+    AdmissionControlMiddleware,
+    create_admission_controllers,
+)
+from variation.alias_cache import DEFAULT_ALIAS_CACHE_MAX_BYTES
+from variation.async_gene import DEFAULT_GENE_MAX_WORKERS
+from variation.async_seqrepo import DEFAULT_SEQREPO_MAX_WORKERS
+from variation.gnomad_vcf_to_protein_variation import get_gnomad_vcf_queries
 from variation.log_config import configure_logging
+from variation.mane_cache import DEFAULT_MANE_CACHE_MAXSIZE
 from variation.query import QueryHandler
+from variation.scheduler import (
+    DEFAULT_BULK_MAX_CONCURRENCY,
+    DEFAULT_INTERACTIVE_MAX_CONCURRENCY,
+    DEFAULT_UTA_MAX_CONCURRENCY,
+    Lane,
+    use_lane,
+)
 from variation.schemas import NormalizeService, ServiceMeta, ToVRSService
+from variation.schemas.batch_schema import NormalizeBatchQuery, NormalizeBatchService
+from variation.schemas.classification_response_schema import ClassificationType
 from variation.schemas.copy_number_schema import (
     AmplificationToCxVarService,
     ParsedToCnVarQuery,
@@ -54,6 +80,13 @@ from variation.schemas.vrs_python_translator_schema import (
     TranslateToService,
     VrsPythonMeta,
 )
+from variation.sequence_cache import DEFAULT_MAX_BYTES
+from variation.to_vrs import DEFAULT_BATCH_MAX_CONCURRENCY
+from variation.transcript_cache import DEFAULT_TRANSCRIPT_CACHE_MAXSIZE
+from variation.validators.validator import (
+    DEFAULT_ACCESSION_MAX_CONCURRENCY,
+    DEFAULT_GENE_CACHE_MAXSIZE,
+)
 
 _logger = logging.getLogger(__name__)
 
@@ -68,10 +101,85 @@ class Tag(Enum):
     TO_COPY_NUMBER_VARIATION = "To Copy Number Variation"
     ALIGNMENT_MAPPER = "Alignment Mapper"
     FEATURE_OVERLAP = "Feature Overlap"
-
-
-query_handler = QueryHandler()
+    BATCH = "Batch"
+    SERVICE = "Service"
+
+
+gene_list_path = os.environ.get("VARIATION_NORM_GENE_LIST_PATH")
+classification_types = os.environ.get("VARIATION_NORM_CLASSIFICATION_TYPES")
+sequence_length_index_path = os.environ.get("VARIATION_NORM_SEQUENCE_LENGTH_INDEX_PATH")
+result_cache_path = os.environ.get("VARIATION_NORM_RESULT_CACHE_PATH")
+query_handler = QueryHandler(
+    gene_list_path=Path(gene_list_path) if gene_list_path else None,
+    classification_types=(
+        [ClassificationType(t.strip()) for t in classification_types.split(",")]
+        if classification_types
+        else None
+    ),
+    accession_max_concurrency=int(
+        os.environ.get(
+            "VARIATION_NORM_ACCESSION_MAX_CONCURRENCY",
+            DEFAULT_ACCESSION_MAX_CONCURRENCY,
+        )
+    ),
+    mane_first="VARIATION_NORM_MANE_FIRST" in os.environ,
+    sequence_cache_max_bytes=int(
+        os.environ.get("VARIATION_NORM_SEQUENCE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+    ),
+    sequence_length_index_path=(
+        Path(sequence_length_index_path) if sequence_length_index_path else None
+    ),
+    alias_cache_max_bytes=int(
+        os.environ.get(
+            "VARIATION_NORM_ALIAS_CACHE_MAX_BYTES", DEFAULT_ALIAS_CACHE_MAX_BYTES
+        )
+    ),
+    alias_cache_preload="VARIATION_NORM_ALIAS_CACHE_PRELOAD" in os.environ,
+    transcript_cache_maxsize=int(
+        os.environ.get(
+            "VARIATION_NORM_TRANSCRIPT_CACHE_MAXSIZE", DEFAULT_TRANSCRIPT_CACHE_MAXSIZE
+        )
+    ),
+    gene_cache_maxsize=int(
+        os.environ.get("VARIATION_NORM_GENE_CACHE_MAXSIZE", DEFAULT_GENE_CACHE_MAXSIZE)
+    ),
+    load_gene_index="VARIATION_NORM_GENE_INDEX" in os.environ,
+    mane_cache_maxsize=int(
+        os.environ.get("VARIATION_NORM_MANE_CACHE_MAXSIZE", DEFAULT_MANE_CACHE_MAXSIZE)
+    ),
+    result_cache_path=Path(result_cache_path) if result_cache_path else None,
+    coalesce_requests="VARIATION_NORM_NO_REQUEST_COALESCING" not in os.environ,
+    seqrepo_max_workers=int(
+        os.environ.get(
+            "VARIATION_NORM_SEQREPO_MAX_WORKERS", DEFAULT_SEQREPO_MAX_WORKERS
+        )
+    ),
+    gene_max_workers=int(
+        os.environ.get("VARIATION_NORM_GENE_MAX_WORKERS", DEFAULT_GENE_MAX_WORKERS)
+    ),
+    interactive_max_concurrency=int(
+        os.environ.get(
+            "VARIATION_NORM_INTERACTIVE_MAX_CONCURRENCY",
+            DEFAULT_INTERACTIVE_MAX_CONCURRENCY,
+        )
+    ),
+    bulk_max_concurrency=int(
+        os.environ.get(
+            "VARIATION_NORM_BULK_MAX_CONCURRENCY", DEFAULT_BULK_MAX_CONCURRENCY
+        )
+    ),
+    uta_max_concurrency=int(
+        os.environ.get(
+            "VARIATION_NORM_UTA_MAX_CONCURRENCY", DEFAULT_UTA_MAX_CONCURRENCY
+        )
+    ),
+)
 feature_overlap = FeatureOverlap(query_handler.seqrepo_access)
+batch_max_concurrency = int(
+    os.environ.get(
+        "VARIATION_NORM_BATCH_MAX_CONCURRENCY", DEFAULT_BATCH_MAX_CONCURRENCY
+    )
+)
 
 
 @asynccontextmanager
@@ -82,7 +190,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:  # noqa: ARG001
     :return: async context handler
     """
     configure_logging()
+    if "VARIATION_NORM_TRANSCRIPT_CACHE_PRELOAD" in os.environ:
+        await query_handler.preload_mane_transcripts()
     yield
+    query_handler.async_seqrepo_access.close()
+    query_handler.async_gene_normalizer.close()
 
 
 app = FastAPI(
@@ -103,6 +215,36 @@ app = FastAPI(
     swagger_ui_parameters={"tryItOutEnabled": True},
 )
 
+
+@app.middleware("http")
+async def use_request_lane(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Run a request in its priority lane. Batch endpoints use the bulk lane and
+    other endpoints use the interactive lane, unless the `X-Priority-Lane` header
+    selects a lane.
+
+    :param request: Incoming request
+    :param call_next: Function that handles the request
+    :return: Response for the request
+    """
+    default_lane = (
+        Lane.BULK
+        if request.url.path.startswith("/variation/batch/")
+        else Lane.INTERACTIVE
+    )
+    lane_value = request.headers.get("X-Priority-Lane", default_lane.value)
+    try:
+        lane = Lane(lane_value)
+    except ValueError:
+        options = ", ".join(option.value for option in Lane)
+        detail = f"Invalid X-Priority-Lane: {lane_value}. Must be one of: {options}"
+        return JSONResponse({"detail": detail}, status_code=400)
+
+    with use_lane(lane):
+        return await call_next(request)
+
+
 translate_summary = (
     "Translate a HGVS, gnomAD VCF and Free Text descriptions to VRS variation(s)."
 )
@@ -210,6 +352,95 @@ async def normalize(
     )
 
 
+@app.post(
+    "/variation/batch/normalize",
+    summary="Normalize and translate a batch of HGVS, gnomAD VCF or Free Text descriptions on GRCh37 or GRCh38 assembly to VRS Variations.",
+    response_model_exclude_none=True,
+    response_description="A response to a validly-formed query.",
+    description="Normalizes each query in the request body the same way as `/variation/normalize`. Identical queries are only normalized once and queries are normalized concurrently. Results are returned in the same order as the queries, and each result contains its own warnings.",
+    tags=[Tag.BATCH],
+)
+async def normalize_batch(request_body: NormalizeBatchQuery) -> NormalizeBatchService:
+    """Normalize and translate a batch of HGVS, gnomAD VCF or Free Text descriptions
+    on GRCh37 or GRCh38 assembly to VRS Variations.
+
+    :param request_body: Request body containing list of queries and their options
+    :return: NormalizeBatchService containing a NormalizeService for each query, in the
+        same order as the queries
+    """
+    queries = [
+        query.model_copy(update={"q": unquote(query.q)})
+        for query in request_body.queries
+    ]
+    results = await query_handler.normalize_handler.normalize_many(
+        queries, max_concurrency=batch_max_concurrency
+    )
+    return NormalizeBatchService(
+        results=results,
+        service_meta_=ServiceMeta(
+            version=__version__,
+            response_datetime=datetime.datetime.now(tz=datetime.UTC),
+        ),
+    )
+
+
+async def _iter_request_lines(request: Request) -> AsyncGenerator[str, None]:
+    """Read non-empty lines from a request body as they arrive
+
+    :param request: Incoming request
+    :return: Async generator yielding stripped, unquoted lines
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    async for chunk in request.stream():
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            if line.strip():
+                yield unquote(line.strip())
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer.strip():
+        yield unquote(buffer.strip())
+
+
+@app.post(
+    "/variation/batch/to_vrs",
+    summary="Translate newline-delimited HGVS, gnomAD VCF and Free Text descriptions to VRS variation(s).",
+    response_description="Newline-delimited JSON, one ToVRSService per query.",
+    description="Reads one query per line from the request body and streams back one `/variation/to_vrs` response per line (NDJSON), in the same order as the queries. Results are written as soon as they are available, so the request body is never fully buffered.",
+    tags=[Tag.BATCH],
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/plain": {
+                    "schema": {"type": "string"},
+                    "example": "BRAF V600E\nNC_000007.13:g.140453136A>T\n",
+                }
+            },
+        }
+    },
+)
+async def to_vrs_batch(request: Request) -> StreamingResponse:
+    """Translate newline-delimited HGVS, gnomAD VCF and Free Text descriptions to VRS
+    variation(s). Each line in the response is a ToVRSService.
+
+    :param request: Request whose body contains one query per line
+    :return: Streaming NDJSON response
+    """
+
+    async def _ndjson() -> AsyncGenerator[str, None]:
+        async for resp in query_handler.to_vrs_handler.to_vrs_stream(
+            _iter_request_lines(request), max_concurrency=batch_max_concurrency
+        ):
+            yield resp.model_dump_json(exclude_none=True) + "\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
 @app.get(
     "/variation/translate_identifier",
     summary="Given an identifier, use SeqRepo to return a list of aliases.",
@@ -385,6 +616,58 @@ async def gnomad_vcf_to_protein(
     )
 
 
+@app.post(
+    "/variation/batch/gnomad_vcf_to_protein",
+    summary="Given VCF records, return the associated protein consequence for each ALT allele as newline-delimited JSON.",
+    response_description="Newline-delimited JSON, one GnomadVcfToProteinService per ALT allele.",
+    description="Reads VCF records from the request body and streams back one `/variation/gnomad_vcf_to_protein` response per line (NDJSON), in the same order as the records. Multi-allelic records are split into one result per ALT allele. Header lines are ignored.",
+    tags=[Tag.BATCH],
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/plain": {
+                    "schema": {"type": "string"},
+                    "example": "7\t140753336\t.\tA\tT,G\t.\t.\t.\n",
+                }
+            },
+        }
+    },
+)
+async def gnomad_vcf_to_protein_batch(
+    request: Request,
+    input_assembly: Annotated[
+        Literal[ClinVarAssembly.GRCH37] | Literal[ClinVarAssembly.GRCH38] | None,
+        Query(
+            description="Assembly used for VCF records.",
+        ),
+    ] = None,
+) -> StreamingResponse:
+    """Return protein consequences for VCF records. Each line in the response is a
+    GnomadVcfToProteinService.
+
+    :param request: Request whose body contains VCF records
+    :param input_assembly: Assembly used for VCF records
+    :return: Streaming NDJSON response
+    """
+
+    async def _vcf_queries() -> AsyncGenerator[str, None]:
+        async for line in _iter_request_lines(request):
+            for vcf_query in get_gnomad_vcf_queries(line):
+                yield vcf_query
+
+    async def _ndjson() -> AsyncGenerator[str, None]:
+        handler = query_handler.gnomad_vcf_to_protein_handler
+        async for resp in handler.gnomad_vcf_records_to_protein(
+            _vcf_queries(), input_assembly=input_assembly
+        ):
+            yield resp.model_dump_json(exclude_none=True) + "\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
 hgvs_dup_del_mode_decsr = (
     "This parameter determines how to interpret HGVS dup/del expressions in VRS."
 )
@@ -915,3 +1198,45 @@ def get_feature_overlap(
             response_datetime=datetime.datetime.now(tz=datetime.UTC),
         ),
     )
+
+
+@app.get(
+    "/variation/admission",
+    summary="Get admission control statistics for each endpoint",
+    response_description="Admission control statistics, keyed by endpoint path.",
+    description="Get the concurrency limit, the number of requests in progress and waiting (queue depth), and the numbers of admitted and rejected requests for each endpoint. Empty if admission control is not enabled.",
+    tags=[Tag.SERVICE],
+)
+def get_admission_info() -> dict[str, dict[str, int]]:
+    """Get admission control statistics for each endpoint
+
+    :return: Concurrency limit, numbers of requests in progress and waiting, and
+        numbers of admitted and rejected requests, keyed by endpoint path
+    """
+    return {
+        path: controller.admission_info()._asdict()
+        for path, controller in admission_controllers.items()
+    }
+
+
+max_concurrent_requests = os.environ.get("VARIATION_NORM_MAX_CONCURRENT_REQUESTS")
+admission_controllers: dict[str, AdmissionController] = (
+    create_admission_controllers(
+        [
+            route.path
+            for route in app.routes
+            if isinstance(route, APIRoute) and Tag.SERVICE not in route.tags
+        ],
+        int(max_concurrent_requests),
+        max_queue_size=int(
+            os.environ.get("VARIATION_NORM_MAX_QUEUED_REQUESTS", DEFAULT_MAX_QUEUE_SIZE)
+        ),
+        queue_timeout=float(
+            os.environ.get("VARIATION_NORM_QUEUE_TIMEOUT", DEFAULT_QUEUE_TIMEOUT)
+        ),
+    )
+    if max_concurrent_requests
+    else {}
+)
+if admission_controllers:
+    app.add_middleware(AdmissionControlMiddleware, controllers=admission_controllers)
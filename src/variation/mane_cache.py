@@ -0,0 +1,150 @@
+"""Module for caching MANE transcript resolution."""
+
+import copy
+import inspect
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from cool_seq_tool.mappers import ManeTranscript
+
+from variation.cache import MISSING, AsyncLoadingCache, CacheInfo, TTLCache
+
+_logger = logging.getLogger(__name__)
+
+# Default maximum number of cached MANE transcript results
+DEFAULT_MANE_CACHE_MAXSIZE = 10000
+
+# ManeTranscript methods whose results are cached
+CACHED_METHODS = ("get_mane_transcript", "g_to_grch38", "grch38_to_mane_c_p")
+
+
+class ManeTranscriptCache:
+    """Cache for `ManeTranscript.get_mane_transcript`, `ManeTranscript.g_to_grch38` and
+    `ManeTranscript.grch38_to_mane_c_p`.
+
+    Results are cached by method and every argument, including defaults, so calls are
+    only served from the cache if they would get the same result (e.g. the same
+    accession, positions, annotation layer, reference sequence, gene and
+    `try_longest_compatible`). Concurrent calls with the same arguments share a single
+    call. Cached results are copied before they are returned, so callers can not change
+    them.
+
+    Cache keys include a version. Changing the version, e.g. after updating UTA or MANE
+    data, invalidates every cached result.
+    """
+
+    def __init__(
+        self,
+        mane_transcript: ManeTranscript,
+        maxsize: int = DEFAULT_MANE_CACHE_MAXSIZE,
+        version: Hashable = None,
+    ) -> None:
+        """Initialize the ManeTranscriptCache class
+
+        :param mane_transcript: MANE transcript mapper
+        :param maxsize: Maximum number of cached results
+        :param version: Version of data that results are from
+        :raises ValueError: If `maxsize` is less than 1
+        """
+        self.mane_transcript = mane_transcript
+        self.version = version
+        self._methods = {
+            name: getattr(mane_transcript, name) for name in CACHED_METHODS
+        }
+        self._signatures = {
+            name: inspect.signature(method) for name, method in self._methods.items()
+        }
+        self._loader = AsyncLoadingCache(TTLCache(maxsize))
+
+    async def _get(self, name: str, *args, **kwargs) -> Any:  # noqa: ANN401
+        """Get result of a MANE transcript method, from cache if possible
+
+        :param name: Name of method
+        :param args: Positional arguments for method
+        :param kwargs: Keyword arguments for method
+        :return: Result of method
+        """
+        method: Callable[..., Awaitable[Any]] = self._methods[name]
+        bound = self._signatures[name].bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (self.version, name, tuple(bound.arguments.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return await method(*args, **kwargs)
+
+        if (
+            _logger.isEnabledFor(logging.DEBUG)
+            and self._loader.cache.peek(key) is not MISSING
+        ):
+            _logger.debug("MANE transcript cache hit: %s%s", name, bound.arguments)
+        result = await self._loader.get(key, lambda: method(*args, **kwargs))
+        return copy.deepcopy(result)
+
+    async def get_mane_transcript(self, *args, **kwargs) -> Any:  # noqa: ANN401
+        """Get MANE transcript representation, from cache if possible. Takes the same
+        arguments as `ManeTranscript.get_mane_transcript`.
+
+        :return: Same as `ManeTranscript.get_mane_transcript`
+        """
+        return await self._get("get_mane_transcript", *args, **kwargs)
+
+    async def g_to_grch38(self, *args, **kwargs) -> Any:  # noqa: ANN401
+        """Get GRCh38 representation, from cache if possible. Takes the same arguments
+        as `ManeTranscript.g_to_grch38`.
+
+        :return: Same as `ManeTranscript.g_to_grch38`
+        """
+        return await self._get("g_to_grch38", *args, **kwargs)
+
+    async def grch38_to_mane_c_p(self, *args, **kwargs) -> Any:  # noqa: ANN401
+        """Get MANE cDNA and protein representation, from cache if possible. Takes the
+        same arguments as `ManeTranscript.grch38_to_mane_c_p`.
+
+        :return: Same as `ManeTranscript.grch38_to_mane_c_p`
+        """
+        return await self._get("grch38_to_mane_c_p", *args, **kwargs)
+
+    def set_version(self, version: Hashable) -> None:
+        """Set version of data that results are from. If it is different, results
+        cached for the previous version are no longer used.
+
+        :param version: Version of data that results are from
+        """
+        if version != self.version:
+            self.version = version
+            self._loader.cache.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """Get cache statistics
+
+        :return: Number of hits, misses, max size and current size
+        """
+        return self._loader.cache.cache_info()
+
+    def clear(self) -> None:
+        """Remove all cached results and reset statistics"""
+        self._loader.cache.clear()
+
+
+def enable_mane_cache(
+    mane_transcript: ManeTranscript,
+    maxsize: int = DEFAULT_MANE_CACHE_MAXSIZE,
+    version: Hashable = None,
+) -> ManeTranscriptCache:
+    """Cache MANE transcript resolution for every call made with `mane_transcript`,
+    including calls made by translators
+
+    :param mane_transcript: MANE transcript mapper
+    :param maxsize: Maximum number of cached results
+    :param version: Version of data that results are from
+    :return: MANE transcript cache. If `mane_transcript` already has a MANE transcript
+        cache, it is returned unchanged.
+    """
+    cache = getattr(mane_transcript.get_mane_transcript, "__self__", None)
+    if not isinstance(cache, ManeTranscriptCache):
+        cache = ManeTranscriptCache(mane_transcript, maxsize=maxsize, version=version)
+        for name in CACHED_METHODS:
+            setattr(mane_transcript, name, getattr(cache, name))
+    return cache
@@ -1,17 +1,25 @@
 """Module for Variation Normalization."""
 
+import asyncio
 import datetime
+import logging
 from typing import Literal
 from urllib.parse import unquote
 
 from cool_seq_tool.handlers import SeqRepoAccess
-from cool_seq_tool.sources import UtaDatabase
+from cool_seq_tool.sources import ManeTranscriptMappings, UtaDatabase
 from ga4gh.vrs import models
 
 from variation import __version__
+from variation.cache import AsyncLoadingCache, TTLCache
 from variation.classify import Classify
 from variation.schemas.app_schemas import Endpoint
-from variation.schemas.classification_response_schema import ClassificationType
+from variation.schemas.batch_schema import NormalizeQuery
+from variation.schemas.classification_response_schema import (
+    Classification,
+    ClassificationType,
+    Nomenclature,
+)
 from variation.schemas.normalize_response_schema import (
     HGVSDupDelModeOption,
     NormalizeService,
@@ -24,13 +32,22 @@ from variation.schemas.translation_response_schema import (
     TranslationResult,
     VrsSeqLocAcStatus,
 )
-from variation.schemas.validation_response_schema import ValidationSummary
-from variation.to_vrs import ToVRS
+from variation.schemas.validation_response_schema import (
+    ValidationResult,
+    ValidationSummary,
+)
+from variation.sequence_length_index import SequenceLengthIndex
+from variation.to_vrs import DEFAULT_BATCH_MAX_CONCURRENCY, ToVRS
 from variation.tokenize import Tokenize
 from variation.translate import Translate
 from variation.utils import get_vrs_loc_seq, update_warnings_for_no_resp
 from variation.validate import Validate
 
+_logger = logging.getLogger(__name__)
+
+# Maximum number of genes to cache MANE data for
+DEFAULT_MANE_DATA_CACHE_MAXSIZE = 20000
+
 
 class Normalize(ToVRS):
     """The Normalize class used to normalize a given variation."""
@@ -43,6 +60,9 @@ class Normalize(ToVRS):
         validator: Validate,
         translator: Translate,
         uta: UtaDatabase,
+        mane_transcript_mappings: ManeTranscriptMappings | None = None,
+        mane_first: bool = False,
+        sequence_length_index: SequenceLengthIndex | None = None,
     ) -> None:
         """Initialize Normalize class.
 
@@ -52,7 +72,21 @@ class Normalize(ToVRS):
         :param validator: Validator class for validating valid inputs
         :param translator: Translating valid inputs
         :param UtaDatabase uta: Access to db containing alignment data
+        :param mane_transcript_mappings: Access to MANE transcript mappings. Required
+            if `mane_first` is `True`.
+        :param mane_first: Whether or not to translate the valid results of free text
+            protein and cDNA queries starting with MANE transcripts, then the longest
+            transcripts. Every valid result is still translated, so output is the same.
+        :param sequence_length_index: Index of sequence lengths. If provided, will be
+            used to order the remaining transcripts longest first when `mane_first` is
+            `True`.
+        :raises ValueError: If `mane_first` is `True` and `mane_transcript_mappings`
+            is not provided
         """
+        if mane_first and not mane_transcript_mappings:
+            msg = "`mane_transcript_mappings` is required when `mane_first` is `True`"
+            raise ValueError(msg)
+
         super().__init__(
             seqrepo_access,
             tokenizer,
@@ -61,6 +95,12 @@ class Normalize(ToVRS):
             translator,
         )
         self.uta = uta
+        self.mane_transcript_mappings = mane_transcript_mappings
+        self.mane_first = mane_first
+        self.sequence_length_index = sequence_length_index
+        self._mane_data_cache = AsyncLoadingCache(
+            TTLCache(DEFAULT_MANE_DATA_CACHE_MAXSIZE)
+        )
 
     @staticmethod
     def _get_priority_translation_result(
@@ -173,6 +213,58 @@ class Normalize(ToVRS):
             )
         return None
 
+    async def _get_gene_mane_data(self, gene: str) -> list[dict]:
+        """Get MANE data for a gene, from cache if possible
+
+        :param gene: Gene symbol
+        :return: MANE data for gene, same as
+            `ManeTranscriptMappings.get_gene_mane_data`
+        """
+        return await self._mane_data_cache.get(
+            gene,
+            lambda: asyncio.to_thread(
+                self.mane_transcript_mappings.get_gene_mane_data, gene
+            ),
+        )
+
+    async def _get_mane_first_translation_order(
+        self, classification: Classification, valid_results: list[ValidationResult]
+    ) -> list[int] | None:
+        """Get the order to translate valid results of a free text protein or cDNA
+        classification in. MANE Select accessions come first, followed by MANE Plus
+        Clinical accessions, then the remaining accessions, longest first. Accessions
+        with the same priority keep their original order.
+
+        :param classification: A classification for a list of tokens
+        :param valid_results: Valid results for `classification`
+        :return: Indexes of `valid_results`, in the order to translate them in. `None`
+            if `classification` is not a free text protein or cDNA classification.
+        """
+        classification_type = classification.classification_type.value
+        if classification.nomenclature != Nomenclature.FREE_TEXT or (
+            not classification_type.startswith(("protein", "cdna"))
+        ):
+            return None
+
+        mane_data = await self._get_gene_mane_data(classification.gene_token.token)
+        ac_key = (
+            "RefSeq_prot" if classification_type.startswith("protein") else "RefSeq_nuc"
+        )
+        mane_priority = {}
+        for data in mane_data:
+            priority = 0 if data["MANE_status"] == "MANE Select" else 1
+            mane_priority.setdefault(data[ac_key], priority)
+
+        def _get_priority(i: int) -> tuple[int, int]:
+            ac = valid_results[i].accession
+            length = None
+            if ac not in mane_priority and self.sequence_length_index is not None:
+                # Already looked up if validators share the index
+                length = self.sequence_length_index.get_length(ac)
+            return mane_priority.get(ac, 2), -(length or 0)
+
+        return sorted(range(len(valid_results)), key=_get_priority)
+
     async def normalize(
         self,
         q: str,
@@ -211,6 +303,7 @@ class Normalize(ToVRS):
         }
 
         # Get tokens for input query
+        await self.tokenizer.prefetch_genes(unquote(q.strip()))
         tokens = self.tokenizer.perform(unquote(q.strip()), warnings)
         if warnings:
             update_warnings_for_no_resp(label, warnings)
@@ -245,6 +338,12 @@ class Normalize(ToVRS):
 
         variation = None
         if validation_summary.valid_results:
+            translation_order = None
+            if self.mane_first:
+                translation_order = await self._get_mane_first_translation_order(
+                    classification, validation_summary.valid_results
+                )
+
             # Get translated VRS representations for valid results
             translations, warnings = await self.get_translations(
                 validation_summary.valid_results,
@@ -254,6 +353,7 @@ class Normalize(ToVRS):
                 baseline_copies=baseline_copies,
                 copy_change=copy_change,
                 do_liftover=True,
+                translation_order=translation_order,
             )
             if translations:
                 # Get prioritized translation result so that output is always the same
@@ -292,3 +392,72 @@ class Normalize(ToVRS):
         params["variation"] = variation
         params["warnings"] = warnings
         return NormalizeService(**params)
+
+    async def normalize_many(
+        self,
+        queries: list[NormalizeQuery],
+        max_concurrency: int = DEFAULT_BATCH_MAX_CONCURRENCY,
+    ) -> list[NormalizeService]:
+        """Normalize a batch of queries.
+
+        Identical queries (same query text, ignoring whitespace and URL encoding, and
+        same options) are only normalized once. Unique queries are normalized
+        concurrently, with at most `max_concurrency` queries running at the same time.
+
+        :param queries: List of queries to normalize, along with their options
+        :param max_concurrency: Maximum number of queries to normalize at the same time
+        :raises ValueError: If `max_concurrency` is less than 1
+        :return: List of NormalizeService, in the same order as `queries`. Each
+            NormalizeService contains its own warnings.
+        """
+        if max_concurrency < 1:
+            msg = "`max_concurrency` must be greater than 0"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _normalize(query: NormalizeQuery) -> NormalizeService:
+            """Normalize a single query once a slot is available
+
+            :param query: Query to normalize
+            :return: NormalizeService for query. If an unhandled exception occurs,
+                the exception will be logged and added as a warning.
+            """
+            async with semaphore:
+                try:
+                    return await self.normalize(
+                        query.q,
+                        hgvs_dup_del_mode=query.hgvs_dup_del_mode,
+                        input_assembly=query.input_assembly,
+                        baseline_copies=query.baseline_copies,
+                        copy_change=query.copy_change,
+                    )
+                except Exception:
+                    _logger.exception("Unhandled exception normalizing %s", query.q)
+                    return NormalizeService(
+                        variation_query=query.q,
+                        warnings=["Unhandled exception. See logs for more details."],
+                        service_meta_=ServiceMeta(
+                            version=__version__,
+                            response_datetime=datetime.datetime.now(tz=datetime.UTC),
+                        ),
+                    )
+
+        # Preserve first occurrence of each unique query
+        unique_queries: dict[tuple, NormalizeQuery] = {}
+        for query in queries:
+            unique_queries.setdefault(query.dedup_key(), query)
+
+        unique_resps = await asyncio.gather(
+            *(_normalize(query) for query in unique_queries.values())
+        )
+        resps_by_key = dict(zip(unique_queries, unique_resps, strict=True))
+
+        resps = []
+        for query in queries:
+            resp = resps_by_key[query.dedup_key()]
+            if resp.variation_query != query.q:
+                # Duplicate queries may differ by whitespace or URL encoding
+                resp = resp.model_copy(update={"variation_query": query.q})
+            resps.append(resp)
+        return resps
@@ -1,20 +1,55 @@
 """Module for providing methods for handling queries."""
 
+from collections.abc import Iterable
+from pathlib import Path
+
 from cool_seq_tool.app import CoolSeqTool
 from ga4gh.vrs.extras.translator import AlleleTranslator as VrsPythonTranslator
 from gene.database import create_db
 from gene.query import QueryHandler as GeneQueryHandler
 
+from variation.alias_cache import DEFAULT_ALIAS_CACHE_MAX_BYTES, enable_alias_cache
+from variation.async_gene import DEFAULT_GENE_MAX_WORKERS, get_async_gene_normalizer
+from variation.async_seqrepo import (
+    DEFAULT_SEQREPO_MAX_WORKERS,
+    get_async_seqrepo_access,
+)
+from variation.chromosome_accessions import ChromosomeAccessions
 from variation.classify import Classify
+from variation.coalesce import RequestCoalescer
+from variation.gene_index import GeneIntervalIndex
 from variation.gnomad_vcf_to_protein_variation import GnomadVcfToProteinVariation
 from variation.hgvs_dup_del_mode import HGVSDupDelMode
+from variation.mane_cache import DEFAULT_MANE_CACHE_MAXSIZE, enable_mane_cache
 from variation.normalize import Normalize
+from variation.result_cache import ResultCache, get_data_version
+from variation.scheduler import (
+    DEFAULT_BULK_MAX_CONCURRENCY,
+    DEFAULT_INTERACTIVE_MAX_CONCURRENCY,
+    DEFAULT_UTA_MAX_CONCURRENCY,
+    LaneScheduler,
+    enable_fair_uta_access,
+)
+from variation.schemas import NormalizeService, ToVRSService
+from variation.schemas.classification_response_schema import ClassificationType
+from variation.schemas.gnomad_vcf_to_protein_schema import GnomadVcfToProteinService
+from variation.sequence_cache import DEFAULT_MAX_BYTES, enable_sequence_cache
+from variation.sequence_length_index import SequenceLengthIndex
 from variation.to_copy_number_variation import ToCopyNumberVariation
 from variation.to_vrs import ToVRS, VRSRepresentation
 from variation.tokenize import Tokenize
 from variation.tokenizers import GeneSymbol
+from variation.transcript_cache import (
+    DEFAULT_TRANSCRIPT_CACHE_MAXSIZE,
+    enable_transcript_cache,
+    get_mane_transcript_accessions,
+)
 from variation.translate import Translate
 from variation.validate import Validate
+from variation.validators.validator import (
+    DEFAULT_ACCESSION_MAX_CONCURRENCY,
+    DEFAULT_GENE_CACHE_MAXSIZE,
+)
 
 
 class QueryHandler:
@@ -23,25 +58,160 @@ class QueryHandler:
     def __init__(
         self,
         gene_query_handler: GeneQueryHandler | None = None,
+        gene_list_path: Path | None = None,
+        classification_types: Iterable[ClassificationType] | None = None,
+        accession_max_concurrency: int = DEFAULT_ACCESSION_MAX_CONCURRENCY,
+        mane_first: bool = False,
+        sequence_cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        sequence_length_index_path: Path | None = None,
+        alias_cache_max_bytes: int = DEFAULT_ALIAS_CACHE_MAX_BYTES,
+        alias_cache_preload: bool = False,
+        transcript_cache_maxsize: int = DEFAULT_TRANSCRIPT_CACHE_MAXSIZE,
+        gene_cache_maxsize: int = DEFAULT_GENE_CACHE_MAXSIZE,
+        load_gene_index: bool = False,
+        mane_cache_maxsize: int = DEFAULT_MANE_CACHE_MAXSIZE,
+        result_cache_path: Path | None = None,
+        coalesce_requests: bool = True,
+        seqrepo_max_workers: int = DEFAULT_SEQREPO_MAX_WORKERS,
+        gene_max_workers: int = DEFAULT_GENE_MAX_WORKERS,
+        interactive_max_concurrency: int = DEFAULT_INTERACTIVE_MAX_CONCURRENCY,
+        bulk_max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+        uta_max_concurrency: int = DEFAULT_UTA_MAX_CONCURRENCY,
     ) -> None:
         """Initialize QueryHandler instance.
         :param gene_query_handler: Gene normalizer query handler instance. If this is
             provided, will use a current instance. If this is not provided, will create
             a new instance.
+        :param gene_list_path: Path to file containing one gene symbol per line. If
+            provided, these genes will be loaded at initialization so that they are
+            tokenized without querying the gene normalizer.
+        :param classification_types: Classification types to support. If provided,
+            only the validators and translators for these types will be created. If not
+            provided, all classification types are supported.
+        :param accession_max_concurrency: Maximum number of candidate accessions to
+            validate at the same time for a query
+        :param mane_first: Whether or not `/normalize` should translate free text
+            protein and cDNA queries starting with MANE transcripts, then the longest
+            transcripts. Output is the same either way.
+        :param sequence_cache_max_bytes: Maximum number of residues of reference
+            sequence to cache in memory. If `0`, reference sequence is not cached.
+        :param sequence_length_index_path: Path to sequence length index file. If
+            provided, the index is loaded from this file, or built and saved to it if
+            the file does not exist or is for a different SeqRepo instance. Otherwise,
+            sequence lengths are only looked up as they are needed.
+        :param alias_cache_max_bytes: Maximum size in bytes of SeqRepo alias
+            translations to cache in memory. If `0`, alias translations are not cached.
+        :param alias_cache_preload: Whether or not to cache alias translations to
+            refget accessions for every `NC_` accession at initialization
+        :param transcript_cache_maxsize: Maximum number of UTA transcript CDS start
+            and end sites and chromosome assemblies to cache in memory. If `0`, these
+            are not cached.
+        :param gene_cache_maxsize: Maximum number of genomic accessions and gene
+            bounds to cache for genes in free text genomic queries. If `0`, these are
+            not cached.
+        :param load_gene_index: Whether or not to load Ensembl gene locations from the
+            gene normalizer into an in-memory index at initialization. If loaded, the
+            index is used to get gene bounds for free text genomic queries.
+        :param mane_cache_maxsize: Maximum number of MANE transcript and GRCh38
+            representations to cache in memory. If `0`, these are not cached.
+        :param result_cache_path: Path to SQLite database file to cache `/to_vrs`,
+            `/normalize` and `/gnomad_vcf_to_protein` responses in. If provided,
+            responses are cached on disk and shared with other processes using the
+            same file. Cached responses are only used with the same package, SeqRepo,
+            UTA and gene normalizer data versions.
+        :param coalesce_requests: Whether or not identical concurrent `/to_vrs`,
+            `/normalize` and `/gnomad_vcf_to_protein` requests should share a single
+            computation
+        :param seqrepo_max_workers: Maximum number of threads that fetch reference
+            sequence and translate aliases from SeqRepo for validators and
+            translators at the same time
+        :param gene_max_workers: Maximum number of threads that query the gene
+            normalizer for tokenizers, validators and the gnomAD VCF handler at the
+            same time. If `gene_query_handler` is not provided, each thread uses its
+            own gene normalizer database connection.
+        :param interactive_max_concurrency: Maximum number of `/to_vrs`, `/normalize`
+            and `/gnomad_vcf_to_protein` pipeline executions in the interactive lane
+            at the same time
+        :param bulk_max_concurrency: Maximum number of pipeline executions in the bulk
+            lane (used by batch endpoints) at the same time
+        :param uta_max_concurrency: Maximum number of UTA queries at the same time.
+            UTA queries, SeqRepo reads and gene normalizer queries are shared fairly
+            between the interactive and bulk lanes.
         """
         cool_seq_tool = CoolSeqTool()
         self.seqrepo_access = cool_seq_tool.seqrepo_access
+        self.sequence_cache = (
+            enable_sequence_cache(
+                self.seqrepo_access, max_bytes=sequence_cache_max_bytes
+            )
+            if sequence_cache_max_bytes
+            else None
+        )
+        self.alias_cache = (
+            enable_alias_cache(
+                self.seqrepo_access,
+                max_bytes=alias_cache_max_bytes,
+                preload=alias_cache_preload,
+            )
+            if alias_cache_max_bytes
+            else None
+        )
+        self.async_seqrepo_access = get_async_seqrepo_access(
+            self.seqrepo_access, max_workers=seqrepo_max_workers
+        )
+        if sequence_length_index_path:
+            self.sequence_length_index = SequenceLengthIndex.load_or_build(
+                self.seqrepo_access, sequence_length_index_path
+            )
+        else:
+            self.sequence_length_index = SequenceLengthIndex(self.seqrepo_access)
+
+        self.chromosome_accessions = ChromosomeAccessions(self.seqrepo_access)
 
-        if not gene_query_handler:
+        if gene_query_handler:
+            create_gene_query_handler = None
+        else:
             gene_query_handler = GeneQueryHandler(create_db())
 
+            def create_gene_query_handler() -> GeneQueryHandler:
+                return GeneQueryHandler(create_db())
+
+        self.async_gene_normalizer = get_async_gene_normalizer(
+            gene_query_handler,
+            max_workers=gene_max_workers,
+            create_gene_normalizer=create_gene_query_handler,
+        )
+        self.gene_index = (
+            GeneIntervalIndex.from_gene_normalizer(gene_query_handler)
+            if load_gene_index
+            else None
+        )
+
         vrs_representation = VRSRepresentation(self.seqrepo_access)
-        gene_symbol = GeneSymbol(gene_query_handler)
-        tokenizer = Tokenize(gene_symbol)
+        self.gene_symbol = GeneSymbol(
+            gene_query_handler,
+            gene_list_path=gene_list_path,
+            async_gene_normalizer=self.async_gene_normalizer,
+        )
+        tokenizer = Tokenize(self.gene_symbol)
         classifier = Classify()
         uta_db = cool_seq_tool.uta_db
+        self.uta_limiter = enable_fair_uta_access(
+            uta_db, max_concurrency=uta_max_concurrency
+        )
+        self.transcript_cache = (
+            enable_transcript_cache(uta_db, maxsize=transcript_cache_maxsize)
+            if transcript_cache_maxsize
+            else None
+        )
+        self.mane_transcript_mappings = cool_seq_tool.mane_transcript_mappings
         self.alignment_mapper = cool_seq_tool.alignment_mapper
         mane_transcript = cool_seq_tool.mane_transcript
+        self.mane_cache = (
+            enable_mane_cache(mane_transcript, maxsize=mane_cache_maxsize)
+            if mane_cache_maxsize
+            else None
+        )
         transcript_mappings = cool_seq_tool.transcript_mappings
         self.vrs_python_tlr = VrsPythonTranslator(data_proxy=self.seqrepo_access)
         liftover = cool_seq_tool.liftover
@@ -51,6 +221,12 @@ class QueryHandler:
             uta_db,
             gene_query_handler,
             liftover,
+            classification_types=classification_types,
+            accession_max_concurrency=accession_max_concurrency,
+            sequence_length_index=self.sequence_length_index,
+            chromosome_accessions=self.chromosome_accessions,
+            gene_cache_maxsize=gene_cache_maxsize,
+            gene_index=self.gene_index,
         )
         hgvs_dup_del_mode = HGVSDupDelMode(self.seqrepo_access)
         translator = Translate(
@@ -59,6 +235,7 @@ class QueryHandler:
             uta_db,
             vrs_representation,
             hgvs_dup_del_mode,
+            classification_types=classification_types,
         )
         to_vrs_params = [
             self.seqrepo_access,
@@ -68,10 +245,74 @@ class QueryHandler:
             translator,
         ]
         self.to_vrs_handler = ToVRS(*to_vrs_params)
-        self.normalize_handler = Normalize(*[*to_vrs_params, uta_db])
+        self.normalize_handler = Normalize(
+            *[*to_vrs_params, uta_db],
+            mane_transcript_mappings=self.mane_transcript_mappings,
+            mane_first=mane_first,
+            sequence_length_index=self.sequence_length_index,
+        )
         self.gnomad_vcf_to_protein_handler = GnomadVcfToProteinVariation(
             *[*to_vrs_params, mane_transcript, gene_query_handler]
         )
         self.to_copy_number_handler = ToCopyNumberVariation(
-            *[*to_vrs_params, gene_query_handler, uta_db, liftover]
+            *[*to_vrs_params, gene_query_handler, uta_db, liftover],
+            sequence_length_index=self.sequence_length_index,
+        )
+
+        self.scheduler = LaneScheduler(
+            interactive_max_concurrency=interactive_max_concurrency,
+            bulk_max_concurrency=bulk_max_concurrency,
         )
+        self.scheduler.schedule_method(self.to_vrs_handler, "to_vrs")
+        self.scheduler.schedule_method(self.normalize_handler, "normalize")
+        self.scheduler.schedule_method(
+            self.gnomad_vcf_to_protein_handler, "gnomad_vcf_to_protein"
+        )
+
+        if result_cache_path:
+            self.result_cache = ResultCache(
+                result_cache_path,
+                get_data_version(self.seqrepo_access, uta_db, gene_query_handler),
+            )
+            self.result_cache.cache_method(
+                self.to_vrs_handler, "to_vrs", ToVRSService, "search_term"
+            )
+            self.result_cache.cache_method(
+                self.normalize_handler,
+                "normalize",
+                NormalizeService,
+                "variation_query",
+            )
+            self.result_cache.cache_method(
+                self.gnomad_vcf_to_protein_handler,
+                "gnomad_vcf_to_protein",
+                GnomadVcfToProteinService,
+                "variation_query",
+            )
+        else:
+            self.result_cache = None
+
+        if coalesce_requests:
+            self.request_coalescer = RequestCoalescer()
+            self.request_coalescer.coalesce_method(
+                self.to_vrs_handler, "to_vrs", "search_term"
+            )
+            self.request_coalescer.coalesce_method(
+                self.normalize_handler, "normalize", "variation_query"
+            )
+            self.request_coalescer.coalesce_method(
+                self.gnomad_vcf_to_protein_handler,
+                "gnomad_vcf_to_protein",
+                "variation_query",
+            )
+        else:
+            self.request_coalescer = None
+
+    async def preload_mane_transcripts(self) -> None:
+        """Cache CDS start and end sites for every MANE transcript, if transcripts are
+        cached
+        """
+        if self.transcript_cache:
+            await self.transcript_cache.preload(
+                get_mane_transcript_accessions(self.mane_transcript_mappings)
+            )
@@ -0,0 +1,152 @@
+"""Module for getting canonical keys for queries."""
+
+import inspect
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, NamedTuple
+from urllib.parse import unquote
+
+from variation.schemas.classification_response_schema import (
+    Classification,
+    Nomenclature,
+)
+from variation.utils import get_aa1_codes
+
+if TYPE_CHECKING:
+    from variation.classify import Classify
+    from variation.tokenize import Tokenize
+
+# Protein classification fields that may use 3 letter AA codes
+AA_FIELDS = ("ref", "alt", "aa0", "aa1", "inserted_sequence")
+
+# Canonical query key already computed for the current call, with the tokenizer,
+# classifier and query it was computed for
+_current_query_key: ContextVar[tuple[object, object, str, str | None] | None] = (
+    ContextVar("query_key", default=None)
+)
+
+
+class QueryCall(NamedTuple):
+    """Call of a handler method whose first argument is a query"""
+
+    query: str  # Query
+    query_key: str | None  # Canonical key for the query, if it could be classified
+    arguments: dict[str, Any]  # Bound arguments, with the query key as the query
+
+
+def get_query_text_key(q: str) -> str:
+    """Get key for the text of a query. Queries with the same key are tokenized the
+    same way.
+
+    :param q: Query
+    :return: Unquoted query with whitespace collapsed to single spaces
+    """
+    return " ".join(unquote(q.strip()).split())
+
+
+def get_classification_key(classification: Classification) -> str:
+    """Get canonical key for a classification.
+
+    Classifications with the same key are validated and translated the same way, so
+    the key ignores the input text of tokens (gene symbols are represented by the
+    normalized gene symbol) and uses 1 letter AA codes for protein classifications.
+    For example, `BRAF V600E`, `braf v600e` and `BRAF Val600Glu` have the same key.
+
+    :param classification: Classification for a query
+    :return: Canonical key
+    """
+    exclude = {"gene_token": {"input_string", "gene"}}
+    if classification.nomenclature == Nomenclature.GNOMAD_VCF:
+        # gnomAD VCF tokens are used after classification, but their text is not
+        exclude["matching_tokens"] = {"__all__": {"token", "input_string"}}
+    else:
+        exclude["matching_tokens"] = True
+    data = classification.model_dump(mode="json", exclude=exclude)
+
+    if classification.classification_type.value.startswith("protein"):
+        for field in AA_FIELDS:
+            if data.get(field):
+                data[field] = get_aa1_codes(data[field]) or data[field]
+
+    return json.dumps(data, sort_keys=True)
+
+
+async def get_query_key(
+    tokenizer: "Tokenize", classifier: "Classify", q: str
+) -> str | None:
+    """Get canonical key for a query, without validating it. Gene normalizer lookups
+    run without blocking the event loop.
+
+    :param tokenizer: Tokenizer class for tokenizing
+    :param classifier: Classifier class for classifying tokens
+    :param q: Query
+    :return: Canonical key for the classification of `q`, if `q` could be tokenized
+        and classified. Else, `None`
+    """
+    warnings = []
+    query_text_key = get_query_text_key(q)
+    await tokenizer.prefetch_genes(query_text_key)
+    tokens = tokenizer.perform(query_text_key, warnings)
+    if warnings:
+        return None
+
+    classification = classifier.perform(tokens)
+    if not classification:
+        return None
+
+    return get_classification_key(classification)
+
+
+async def get_query_call(
+    handler: object, signature: inspect.Signature, args: tuple, kwargs: dict
+) -> QueryCall:
+    """Get the query, canonical query key and arguments for a call of a handler's
+    method.
+
+    If the query key was already computed for the same query by a wrapper further up
+    the call (see `use_query_call`), it is reused instead of tokenizing and
+    classifying the query again.
+
+    :param handler: Handler instance with `tokenizer` and `classifier` attributes
+    :param signature: Signature of the method. The first parameter must be the
+        query.
+    :param args: Positional arguments of the call
+    :param kwargs: Keyword arguments of the call
+    :return: Query, canonical query key and bound arguments (including defaults),
+        with the query key in place of the query
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    query_param = next(iter(signature.parameters))
+    query = arguments[query_param]
+
+    tokenizer = handler.tokenizer
+    classifier = handler.classifier
+    current = _current_query_key.get()
+    if current is not None and current[:3] == (tokenizer, classifier, query):
+        query_key = current[3]
+    else:
+        query_key = await get_query_key(tokenizer, classifier, query)
+
+    arguments[query_param] = query_key
+    return QueryCall(query, query_key, arguments)
+
+
+@contextmanager
+def use_query_call(handler: object, call: QueryCall) -> Iterator[None]:
+    """Share the query key of a call with wrappers called inside the context, and the
+    tasks it creates, so that the query is only tokenized and classified once
+
+    :param handler: Handler instance with `tokenizer` and `classifier` attributes
+    :param call: Call of one of the handler's methods
+    """
+    token = _current_query_key.set(
+        (handler.tokenizer, handler.classifier, call.query, call.query_key)
+    )
+    try:
+        yield
+    finally:
+        _current_query_key.reset(token)
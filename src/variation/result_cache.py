@@ -0,0 +1,225 @@
+"""Module for a persistent cache of service responses."""
+
+import datetime
+import functools
+import importlib.metadata
+import inspect
+import json
+import sqlite3
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from cool_seq_tool.handlers import SeqRepoAccess
+from cool_seq_tool.sources import UtaDatabase
+from gene.query import QueryHandler as GeneQueryHandler
+from gene.schemas import SourceName
+from pydantic import BaseModel
+
+from variation import __version__
+from variation.cache import CacheInfo
+from variation.query_key import get_query_call
+from variation.schemas.normalize_response_schema import ServiceMeta
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+def get_data_version(
+    seqrepo_access: SeqRepoAccess,
+    uta_db: UtaDatabase,
+    gene_normalizer: GeneQueryHandler,
+) -> str:
+    """Get version of the code and data releases that responses are computed from
+
+    :param seqrepo_access: Access to SeqRepo
+    :param uta_db: UTA database
+    :param gene_normalizer: Gene normalizer QueryHandler
+    :return: Version of package, cool-seq-tool, SeqRepo instance, UTA schema and gene
+        normalizer sources
+    """
+    versions = {
+        "variation-normalizer": __version__,
+        "cool-seq-tool": importlib.metadata.version("cool-seq-tool"),
+        "seqrepo": str(Path(seqrepo_access.sr._root_dir).resolve()),  # noqa: SLF001
+        "uta": uta_db.schema,
+        "gene": {
+            src.value: (gene_normalizer.db.get_source_metadata(src) or {}).get(
+                "version"
+            )
+            for src in SourceName
+        },
+    }
+    return json.dumps(versions, sort_keys=True)
+
+
+def has_variation(response: BaseModel) -> bool:
+    """Check whether a response has a variation
+
+    :param response: Service response
+    :return: `True` if `response` has a variation (or at least one variation)
+    """
+    return bool(
+        getattr(response, "variation", None) or getattr(response, "variations", None)
+    )
+
+
+def _json_default(value: Any) -> Any:  # noqa: ANN401
+    """Get JSON serializable value for cache keys
+
+    :param value: Value that is not JSON serializable by default
+    :return: JSON serializable value
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+class ResultCache:
+    """Cache of service responses in a SQLite database.
+
+    Responses are stored with the version of the code and data releases they were
+    computed from, and only responses for the current version are used. Since the
+    cache is stored on disk, it is shared by every worker process using the same path
+    and kept across restarts. Only responses with a variation are cached, so responses
+    for queries that failed, possibly because a service was unavailable, are computed
+    again.
+    """
+
+    def __init__(self, path: Path, version: str) -> None:
+        """Initialize the ResultCache class. Responses for other versions are removed.
+
+        :param path: Path to SQLite database file. Created if it does not exist.
+        :param version: Version of the code and data releases that responses are
+            computed from
+        """
+        self.path = path
+        self.version = version
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._conn = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "version TEXT NOT NULL, key TEXT NOT NULL, response TEXT NOT NULL, "
+                "PRIMARY KEY (version, key))"
+            )
+            self._conn.execute("DELETE FROM results WHERE version != ?", (version,))
+
+    def get(self, key: str, response_model: type[BaseModel]) -> BaseModel | None:
+        """Get cached response
+
+        :param key: Cache key
+        :param response_model: Response model to load response as
+        :return: Cached response with current service metadata if found. Else, `None`
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM results WHERE version = ? AND key = ?",
+                (self.version, key),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        response = response_model.model_validate_json(row[0])
+        response.service_meta_ = ServiceMeta(
+            version=__version__,
+            response_datetime=datetime.datetime.now(tz=datetime.UTC),
+        )
+        return response
+
+    def set(self, key: str, response: BaseModel) -> None:
+        """Cache a response, if it has a variation
+
+        :param key: Cache key
+        :param response: Response to cache
+        """
+        if not has_variation(response):
+            return
+
+        data = response.model_dump_json()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (version, key, response) "
+                "VALUES (?, ?, ?)",
+                (self.version, key, data),
+            )
+
+    def cache_method(
+        self,
+        handler: object,
+        name: str,
+        response_model: type[BaseModel],
+        query_field: str,
+    ) -> None:
+        """Cache responses for every call of a handler's method.
+
+        Responses are cached by the canonical key of the query (see
+        `variation.query_key.get_query_key`) and the other arguments, so queries that
+        only differ in case, whitespace or AA code style share a cached response.
+        Queries that can not be tokenized and classified are not cached.
+
+        :param handler: Handler instance with `tokenizer` and `classifier` attributes
+        :param name: Name of async method that returns a response. The first argument
+            must be the query.
+        :param response_model: Response model that method returns
+        :param query_field: Name of the response field that contains the query
+        """
+        method: Callable[..., Awaitable[BaseModel]] = getattr(handler, name)
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def _cached_method(*args, **kwargs) -> BaseModel:
+            call = await get_query_call(handler, signature, args, kwargs)
+            if call.query_key is None:
+                return await method(*args, **kwargs)
+
+            key = json.dumps(
+                [type(handler).__name__, name, call.arguments],
+                default=_json_default,
+                sort_keys=True,
+            )
+            response = self.get(key, response_model)
+            if response is None:
+                response = await method(*args, **kwargs)
+                self.set(key, response)
+            else:
+                setattr(response, query_field, call.query)
+            return response
+
+        setattr(handler, name, _cached_method)
+
+    def __len__(self) -> int:
+        """Return the number of cached responses for the current version"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM results WHERE version = ?", (self.version,)
+            ).fetchone()[0]
+
+    def cache_info(self) -> CacheInfo:
+        """Get cache statistics for this process
+
+        :return: Number of hits, misses, max size (`0`, since size is not limited)
+            and current size
+        """
+        return CacheInfo(self._hits, self._misses, 0, len(self))
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset statistics"""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._hits = 0
+            self._misses = 0
+
+    def close(self) -> None:
+        """Close database connection"""
+        self._conn.close()
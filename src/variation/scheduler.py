@@ -0,0 +1,258 @@
+"""Module for scheduling work in interactive and bulk priority lanes."""
+
+import asyncio
+import contextlib
+import functools
+import itertools
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, NamedTuple
+
+from cool_seq_tool.sources import UtaDatabase
+
+# Default maximum number of interactive pipeline executions at the same time
+DEFAULT_INTERACTIVE_MAX_CONCURRENCY = 64
+
+# Default maximum number of bulk pipeline executions at the same time
+DEFAULT_BULK_MAX_CONCURRENCY = 16
+
+# Default maximum number of UTA queries at the same time
+DEFAULT_UTA_MAX_CONCURRENCY = 10
+
+# Fair UTA access for each UtaDatabase instance
+_fair_uta_limiters: dict[UtaDatabase, "FairLimiter"] = {}
+
+
+class Lane(str, Enum):
+    """Define priority lanes for work"""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+_current_lane: ContextVar[Lane] = ContextVar("lane", default=Lane.INTERACTIVE)
+_in_lane_slot: ContextVar[bool] = ContextVar("in_lane_slot", default=False)
+
+
+def get_lane() -> Lane:
+    """Get the lane of the current request
+
+    :return: Lane set with `use_lane`. Defaults to the interactive lane.
+    """
+    return _current_lane.get()
+
+
+@contextmanager
+def use_lane(lane: Lane) -> Iterator[None]:
+    """Run work in a lane. Tasks created inside the context also use the lane.
+
+    :param lane: Lane to use
+    """
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+class LaneInfo(NamedTuple):
+    """Statistics for a lane"""
+
+    max_concurrency: int  # Maximum number of pipeline executions in progress
+    active: int  # Pipeline executions currently in progress
+    waiting: int  # Pipeline executions currently waiting for a slot
+
+
+class FairLimiter:
+    """Shares a fixed number of slots for a backend fairly between lanes.
+
+    When every slot is in use, waiting work is admitted in round robin order between
+    lanes (and in arrival order within each lane), so a lane with many waiting
+    requests can not starve the others.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the FairLimiter class
+
+        :param capacity: Number of slots
+        :raises ValueError: If `capacity` is less than 1
+        """
+        if capacity < 1:
+            msg = "`capacity` must be greater than 0"
+            raise ValueError(msg)
+
+        self.capacity = capacity
+        self._available = capacity
+        self._waiters: dict[Lane, deque[asyncio.Future]] = {
+            lane: deque() for lane in Lane
+        }
+        self._lanes = itertools.cycle(Lane)
+
+    async def acquire(self) -> None:
+        """Wait for a slot in the lane of the current request. Must be followed by
+        `release`.
+        """
+        if self._available and not any(self._waiters.values()):
+            self._available -= 1
+            return
+
+        waiters = self._waiters[get_lane()]
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over before cancellation
+                self.release()
+            else:
+                with contextlib.suppress(ValueError):
+                    waiters.remove(future)
+            raise
+
+    def release(self) -> None:
+        """Release a slot, handing it to the next lane with waiting work"""
+        for _ in range(len(Lane)):
+            waiters = self._waiters[next(self._lanes)]
+            while waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    return
+        self._available += 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot in the lane of the current request"""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def waiting(self) -> dict[Lane, int]:
+        """Get the amount of waiting work
+
+        :return: Number of waiting calls in each lane
+        """
+        return {lane: len(waiters) for lane, waiters in self._waiters.items()}
+
+
+class LaneScheduler:
+    """Gives each lane its own budget of concurrent pipeline executions.
+
+    Interactive lookups and bulk batch jobs run in separate lanes, so a large batch
+    only uses the bulk budget and does not delay interactive requests. Backends that
+    both lanes use (SeqRepo, UTA and the gene normalizer) are shared between lanes
+    with `FairLimiter`.
+    """
+
+    def __init__(
+        self,
+        interactive_max_concurrency: int = DEFAULT_INTERACTIVE_MAX_CONCURRENCY,
+        bulk_max_concurrency: int = DEFAULT_BULK_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize the LaneScheduler class
+
+        :param interactive_max_concurrency: Maximum number of pipeline executions in
+            the interactive lane at the same time
+        :param bulk_max_concurrency: Maximum number of pipeline executions in the bulk
+            lane at the same time
+        :raises ValueError: If a maximum concurrency is less than 1
+        """
+        self.max_concurrency = {
+            Lane.INTERACTIVE: interactive_max_concurrency,
+            Lane.BULK: bulk_max_concurrency,
+        }
+        if min(self.max_concurrency.values()) < 1:
+            msg = "`max_concurrency` must be greater than 0"
+            raise ValueError(msg)
+
+        self._semaphores = {
+            lane: asyncio.Semaphore(max_concurrency)
+            for lane, max_concurrency in self.max_concurrency.items()
+        }
+        self._active = dict.fromkeys(Lane, 0)
+        self._waiting = dict.fromkeys(Lane, 0)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot in the lane of the current request. Work that already holds a
+        slot (including tasks it created) does not take another one.
+        """
+        if _in_lane_slot.get():
+            yield
+            return
+
+        lane = get_lane()
+        self._waiting[lane] += 1
+        try:
+            await self._semaphores[lane].acquire()
+        finally:
+            self._waiting[lane] -= 1
+
+        self._active[lane] += 1
+        token = _in_lane_slot.set(True)
+        try:
+            yield
+        finally:
+            _in_lane_slot.reset(token)
+            self._active[lane] -= 1
+            self._semaphores[lane].release()
+
+    def schedule_method(self, handler: object, name: str) -> None:
+        """Run every call of a handler's method in a slot of the caller's lane
+
+        :param handler: Handler instance
+        :param name: Name of async method
+        """
+        method: Callable[..., Awaitable[Any]] = getattr(handler, name)
+
+        @functools.wraps(method)
+        async def _scheduled_method(*args, **kwargs) -> Any:  # noqa: ANN401
+            async with self.slot():
+                return await method(*args, **kwargs)
+
+        setattr(handler, name, _scheduled_method)
+
+    def lane_info(self) -> dict[Lane, LaneInfo]:
+        """Get lane statistics
+
+        :return: Concurrency limit and numbers of pipeline executions in progress and
+            waiting, for each lane
+        """
+        return {
+            lane: LaneInfo(max_concurrency, self._active[lane], self._waiting[lane])
+            for lane, max_concurrency in self.max_concurrency.items()
+        }
+
+
+def enable_fair_uta_access(
+    uta_db: UtaDatabase, max_concurrency: int = DEFAULT_UTA_MAX_CONCURRENCY
+) -> FairLimiter:
+    """Share UTA queries fairly between lanes
+
+    Wraps `uta_db.execute_query`, so every UTA query made through `uta_db` waits for
+    a slot. This is idempotent: calling it again for the same `uta_db` returns the
+    existing limiter.
+
+    :param uta_db: UTA database instance
+    :param max_concurrency: Maximum number of UTA queries at the same time. This
+        should not be more than the size of the UTA connection pool.
+    :return: Limiter for UTA queries
+    """
+    limiter = _fair_uta_limiters.get(uta_db)
+    if limiter is None:
+        limiter = FairLimiter(max_concurrency)
+        execute_query = uta_db.execute_query
+
+        async def _execute_query(*args, **kwargs) -> Any:  # noqa: ANN401
+            async with limiter.slot():
+                return await execute_query(*args, **kwargs)
+
+        uta_db.execute_query = _execute_query
+        _fair_uta_limiters[uta_db] = limiter
+    return limiter
@@ -0,0 +1,131 @@
+"""Module containing schemas for batch endpoints"""
+
+from typing import Literal
+
+from ga4gh.vrs import models
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
+
+from variation import __version__
+from variation.query_key import get_query_text_key
+from variation.schemas.normalize_response_schema import (
+    HGVSDupDelModeOption,
+    NormalizeService,
+    ServiceResponse,
+)
+from variation.schemas.service_schema import ClinVarAssembly
+
+
+class NormalizeQuery(BaseModel):
+    """Define a single query for the batch normalize endpoint"""
+
+    q: StrictStr = Field(
+        description="HGVS, gnomAD VCF or Free Text description on GRCh37 or GRCh38 assembly"
+    )
+    hgvs_dup_del_mode: HGVSDupDelModeOption | None = Field(
+        default=HGVSDupDelModeOption.DEFAULT,
+        description="This parameter determines how to interpret HGVS dup/del expressions in VRS.",
+    )
+    input_assembly: (
+        Literal[ClinVarAssembly.GRCH37] | Literal[ClinVarAssembly.GRCH38] | None
+    ) = Field(
+        default=None,
+        description="Assembly used for `q`. Only used when `q` is using genomic free text or gnomad vcf format",
+    )
+    baseline_copies: StrictInt | None = Field(
+        default=None,
+        description="Baseline copies for HGVS duplications and deletions represented as Copy Number Count Variation",
+    )
+    copy_change: models.CopyChange | None = Field(
+        default=None,
+        description="The copy change for HGVS duplications and deletions represented as Copy Number Change Variation.",
+    )
+
+    def dedup_key(self) -> tuple:
+        """Get key used to identify duplicate queries within a batch
+
+        :return: Tuple containing the query text key (see
+            `variation.query_key.get_query_text_key`) and the query options
+        """
+        return (
+            get_query_text_key(self.q),
+            self.hgvs_dup_del_mode,
+            self.input_assembly,
+            self.baseline_copies,
+            self.copy_change,
+        )
+
+
+class NormalizeBatchQuery(BaseModel):
+    """Define request body for the batch normalize endpoint"""
+
+    queries: list[NormalizeQuery]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "queries": [
+                    {"q": "BRAF V600E"},
+                    {"q": "NC_000007.13:g.140453136A>T", "input_assembly": "GRCh37"},
+                    {
+                        "q": "NC_000003.12:g.49531262dup",
+                        "hgvs_dup_del_mode": "copy_number_count",
+                        "baseline_copies": 2,
+                    },
+                ]
+            }
+        }
+    )
+
+
+class NormalizeBatchService(ServiceResponse):
+    """A response to normalizing a batch of variation queries. Results are returned in
+    the same order as the input queries, and each result contains its own warnings.
+    """
+
+    results: list[NormalizeService]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "results": [
+                    {
+                        "variation_query": "BRAF V600E",
+                        "variation": {
+                            "id": "ga4gh:VA.j4XnsLZcdzDIYa5pvvXM7t1wn9OITr0L",
+                            "digest": "j4XnsLZcdzDIYa5pvvXM7t1wn9OITr0L",
+                            "location": {
+                                "id": "ga4gh:SL.t-3DrWALhgLdXHsupI-e-M00aL3HgK3y",
+                                "digest": "t-3DrWALhgLdXHsupI-e-M00aL3HgK3y",
+                                "end": 600,
+                                "start": 599,
+                                "sequenceReference": {
+                                    "type": "SequenceReference",
+                                    "refgetAccession": "SQ.cQvw4UsHHRRlogxbWCB8W-mKD4AraM9y",
+                                },
+                                "type": "SequenceLocation",
+                            },
+                            "state": {
+                                "sequence": "E",
+                                "type": "LiteralSequenceExpression",
+                            },
+                            "type": "Allele",
+                        },
+                        "warnings": [],
+                        "service_meta_": {
+                            "name": "variation-normalizer",
+                            "version": __version__,
+                            "response_datetime": "2022-01-26T22:23:41.821673",
+                            "url": "https://github.com/cancervariants/variation-normalization",
+                        },
+                    }
+                ],
+                "warnings": [],
+                "service_meta_": {
+                    "name": "variation-normalizer",
+                    "version": __version__,
+                    "response_datetime": "2022-01-26T22:23:41.821673",
+                    "url": "https://github.com/cancervariants/variation-normalization",
+                },
+            }
+        }
+    )
@@ -0,0 +1,163 @@
+"""Module for caching reference sequence fetched from SeqRepo."""
+
+from typing import Any, Protocol
+
+from cool_seq_tool.handlers import SeqRepoAccess
+
+from variation.cache import MISSING, CacheInfo, TTLCache
+
+# Default number of residues in a cached block
+DEFAULT_BLOCK_SIZE = 16384
+
+# Default maximum number of residues cached (about 64 MB)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class SequenceStore(Protocol):
+    """SeqRepo sequence storage (`SeqRepo.sequences`)"""
+
+    def fetch(
+        self, seq_id: str, start: int | None = None, end: int | None = None
+    ) -> str:
+        """Fetch sequence for a SeqRepo sequence ID"""
+
+
+class SequenceBlockCache:
+    """Cache for SeqRepo sequence storage.
+
+    Sequences are fetched and cached in blocks of `block_size` residues, aligned to
+    multiples of `block_size`, per SeqRepo sequence ID. Overlapping and repeated
+    slices of a sequence are served from cached blocks, so the underlying bgzip file
+    is only read once per block. Least recently used blocks are evicted once more than
+    `max_bytes` residues are cached.
+
+    Requests without both a start and end, or that are not fully contained in the
+    sequence, are passed through to the underlying storage so that they behave the
+    same, including errors.
+    """
+
+    def __init__(
+        self,
+        sequences: SequenceStore,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the SequenceBlockCache class
+
+        :param sequences: SeqRepo sequence storage to fetch blocks from
+        :param block_size: Number of residues in a block
+        :param max_bytes: Maximum number of residues to cache
+        :raises ValueError: If `block_size` or `max_bytes` is less than 1
+        """
+        if block_size < 1:
+            msg = "`block_size` must be greater than 0"
+            raise ValueError(msg)
+        if max_bytes < 1:
+            msg = "`max_bytes` must be greater than 0"
+            raise ValueError(msg)
+
+        self.sequences = sequences
+        self.block_size = block_size
+        self._blocks = TTLCache(max_bytes, getsizeof=len)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Delegate other attributes to the underlying sequence storage"""
+        return getattr(self.sequences, name)
+
+    def fetch(
+        self, seq_id: str, start: int | None = None, end: int | None = None
+    ) -> str:
+        """Fetch sequence for a SeqRepo sequence ID
+
+        :param seq_id: SeqRepo sequence ID
+        :param start: Inter-residue start position
+        :param end: Inter-residue end position
+        :return: Sequence from `start` to `end`
+        """
+        if start is None or end is None or not 0 <= start < end:
+            return self.sequences.fetch(seq_id, start, end)
+
+        first_block = start // self.block_size
+        last_block = (end - 1) // self.block_size
+        blocks = []
+        for block in range(first_block, last_block + 1):
+            try:
+                seq = self._get_block(seq_id, block)
+            except Exception:
+                return self.sequences.fetch(seq_id, start, end)
+            blocks.append(seq)
+
+            if len(seq) < self.block_size:
+                # Reached end of sequence
+                break
+
+        offset = first_block * self.block_size
+        seq = "".join(blocks)[start - offset : end - offset]
+        if len(seq) != end - start:
+            # Out of range
+            return self.sequences.fetch(seq_id, start, end)
+        return seq
+
+    def _get_block(self, seq_id: str, block: int) -> str:
+        """Get block of sequence, from cache if possible
+
+        :param seq_id: SeqRepo sequence ID
+        :param block: Block index
+        :return: Sequence for block. Shorter than `block_size` if it is the last block
+            in the sequence.
+        """
+        key = (seq_id, block)
+        seq = self._blocks.get(key)
+        if seq is MISSING:
+            block_start = block * self.block_size
+            seq = self.sequences.fetch(
+                seq_id, block_start, block_start + self.block_size
+            )
+            self._blocks.set(key, seq)
+        return seq
+
+    def for_sequences(self, sequences: SequenceStore) -> "SequenceBlockCache":
+        """Get cache for other storage of the same SeqRepo instance (e.g. opened by
+        another thread) that shares cached blocks with this cache
+
+        :param sequences: SeqRepo sequence storage to fetch blocks from
+        :return: Sequence cache
+        """
+        cache = SequenceBlockCache(sequences, block_size=self.block_size)
+        cache._blocks = self._blocks
+        return cache
+
+    def cache_info(self) -> CacheInfo:
+        """Get cache statistics
+
+        :return: Number of block hits, block misses, maximum number of residues cached
+            and current number of residues cached
+        """
+        return self._blocks.cache_info()
+
+    def clear(self) -> None:
+        """Remove all cached blocks and reset statistics"""
+        self._blocks.clear()
+
+
+def enable_sequence_cache(
+    seqrepo_access: SeqRepoAccess,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> SequenceBlockCache:
+    """Cache blocks of reference sequence for every SeqRepo fetch made with
+    `seqrepo_access`, including `get_reference_sequence` and `sr[ac][start:end]`
+
+    :param seqrepo_access: Access to SeqRepo
+    :param block_size: Number of residues in a block
+    :param max_bytes: Maximum number of residues to cache
+    :return: Sequence cache. If `seqrepo_access` already has a sequence cache, it is
+        returned unchanged.
+    """
+    sequences = seqrepo_access.sr.sequences
+    if not isinstance(sequences, SequenceBlockCache):
+        sequences = SequenceBlockCache(
+            sequences, block_size=block_size, max_bytes=max_bytes
+        )
+        seqrepo_access.sr.sequences = sequences
+    return sequences
@@ -0,0 +1,156 @@
+"""Module for looking up sequence lengths without fetching sequence from SeqRepo."""
+
+import json
+import logging
+from pathlib import Path
+
+from cool_seq_tool.handlers import SeqRepoAccess
+
+_logger = logging.getLogger(__name__)
+
+# Accession prefixes to preload when building an index
+DEFAULT_PRELOAD_PREFIXES = ("NC_", "NM_", "NP_")
+
+
+class SequenceLengthIndex:
+    """Index of accession to sequence length.
+
+    Lengths come from SeqRepo sequence metadata, so checking whether positions exist on
+    an accession does not require fetching and decompressing its sequence. Lengths are
+    looked up the first time an accession is used, and can be preloaded and persisted
+    to disk. A persisted index is only loaded for the same SeqRepo instance it was built
+    from.
+    """
+
+    def __init__(self, seqrepo_access: SeqRepoAccess, path: Path | None = None) -> None:
+        """Initialize the SequenceLengthIndex class
+
+        :param seqrepo_access: Access to SeqRepo
+        :param path: Path to file to load and save index to
+        """
+        self.seqrepo_access = seqrepo_access
+        self.path = path
+        self._lengths: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of accessions in the index"""
+        return len(self._lengths)
+
+    @property
+    def seqrepo_root_dir(self) -> str:
+        """Return resolved SeqRepo root directory, which identifies the SeqRepo
+        instance lengths are from
+        """
+        return str(Path(self.seqrepo_access.sr._root_dir).resolve())  # noqa: SLF001
+
+    def get_length(self, ac: str) -> int | None:
+        """Get sequence length for an accession
+
+        :param ac: Accession
+        :return: Sequence length if accession is found in SeqRepo. Else, `None`
+        """
+        length = self._lengths.get(ac)
+        if length is None:
+            try:
+                length = self.seqrepo_access.get_metadata(ac)["length"]
+            except KeyError:
+                return None
+            self._lengths[ac] = length
+        return length
+
+    def slice_length(self, ac: str, start: int, end: int | None = None) -> int | None:
+        """Get length of `sr[ac][start:end]`, or `sr[ac][start]` if `end` is not
+        provided, without fetching sequence
+
+        :param ac: Accession
+        :param start: Inter-residue start position
+        :param end: Inter-residue end position
+        :return: Length of sequence SeqRepo would return. `None` if this cannot be
+            determined from the index, because the accession is not found or SeqRepo
+            would raise an error for the positions.
+        """
+        if start < 0 or (end is not None and end < start):
+            return None
+
+        length = self.get_length(ac)
+        if length is None:
+            return None
+
+        if end is None:
+            return 1 if start < length else 0
+        return max(min(end, length) - start, 0)
+
+    def preload(self, prefixes: tuple[str, ...] = DEFAULT_PRELOAD_PREFIXES) -> None:
+        """Add every current SeqRepo accession starting with one of `prefixes` to the
+        index
+
+        :param prefixes: Accession prefixes to preload
+        """
+        sr = self.seqrepo_access.sr
+        seq_lengths: dict[str, int] = {}
+        for prefix in prefixes:
+            for alias_rec in sr.aliases.find_aliases(alias=f"{prefix}%"):
+                ac = alias_rec["alias"]
+                if not ac.startswith(prefix):
+                    continue
+
+                seq_id = alias_rec["seq_id"]
+                if seq_id not in seq_lengths:
+                    seq_lengths[seq_id] = sr.sequences.fetch_seqinfo(seq_id)["len"]
+                self._lengths[ac] = seq_lengths[seq_id]
+
+    def load(self) -> bool:
+        """Load index from `path`
+
+        :return: `True` if index was loaded. `False` if `path` does not exist or the
+            index was built from a different SeqRepo instance
+        """
+        if not self.path or not self.path.exists():
+            return False
+
+        with self.path.open() as f:
+            data = json.load(f)
+        if data.get("seqrepo_root_dir") != self.seqrepo_root_dir:
+            _logger.info(
+                "Sequence length index at %s is for a different SeqRepo instance",
+                self.path,
+            )
+            return False
+
+        self._lengths.update(data["lengths"])
+        return True
+
+    def save(self) -> None:
+        """Save index to `path`
+
+        :raises ValueError: If `path` was not provided
+        """
+        if not self.path:
+            msg = "`path` is required to save the sequence length index"
+            raise ValueError(msg)
+
+        tmp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump(
+                {"seqrepo_root_dir": self.seqrepo_root_dir, "lengths": self._lengths},
+                f,
+            )
+        tmp_path.replace(self.path)
+
+    @classmethod
+    def load_or_build(
+        cls, seqrepo_access: SeqRepoAccess, path: Path
+    ) -> "SequenceLengthIndex":
+        """Load index from `path`. If it cannot be loaded, preload a new index and
+        save it to `path`.
+
+        :param seqrepo_access: Access to SeqRepo
+        :param path: Path to file to load and save index to
+        :return: Sequence length index
+        """
+        index = cls(seqrepo_access, path=path)
+        if not index.load():
+            _logger.info("Building sequence length index at %s", path)
+            index.preload()
+            index.save()
+        return index
@@ -39,6 +39,7 @@ from variation.schemas.normalize_response_schema import (
 from variation.schemas.service_schema import ClinVarAssembly
 from variation.schemas.token_response_schema import TokenType
 from variation.schemas.validation_response_schema import ValidationResult
+from variation.sequence_length_index import SequenceLengthIndex
 from variation.to_vrs import ToVRS
 from variation.tokenize import Tokenize
 from variation.translate import Translate
@@ -88,6 +89,7 @@ class ToCopyNumberVariation(ToVRS):
         gene_normalizer: GeneQueryHandler,
         uta: UtaDatabase,
         liftover: LiftOver,
+        sequence_length_index: SequenceLengthIndex | None = None,
     ) -> None:
         """Initialize theToCopyNumberVariation class
 
@@ -99,11 +101,15 @@ class ToCopyNumberVariation(ToVRS):
         :param gene_normalizer: Client for normalizing gene concepts
         :param uta: Access to UTA queries
         :param liftover: Instance to provide mapping between human genome assemblies
+        :param sequence_length_index: Index of sequence lengths. If provided, will be
+            used to check that positions exist on an accession instead of fetching
+            sequence.
         """
         super().__init__(seqrepo_access, tokenizer, classifier, validator, translator)
         self.gene_normalizer = gene_normalizer
         self.uta = uta
         self.liftover = liftover
+        self.sequence_length_index = sequence_length_index
 
     async def _get_valid_results(self, q: str) -> tuple[list[ValidationResult], list]:
         """Get valid results for to copy number variation endpoint
@@ -115,6 +121,7 @@ class ToCopyNumberVariation(ToVRS):
         warnings = []
 
         # Get tokens for input query
+        await self.tokenizer.prefetch_genes(unquote(q.strip()))
         tokens = self.tokenizer.perform(unquote(q.strip()), warnings)
         if not tokens:
             return valid_results, warnings
@@ -367,18 +374,23 @@ class ToCopyNumberVariation(ToVRS):
         :raises ToCopyNumberError: If position is not valid on accession or
             if accession is not found in seqrepo
         """
-        try:
-            ref = self.seqrepo_access.sr[accession][pos - 1]
-        except ValueError as e:
-            msg = f"SeqRepo ValueError: {str(e).replace('start', 'Position')}"
-            raise ToCopyNumberError(msg) from e
-        except KeyError as e:
-            msg = f"Accession not found in SeqRepo: {accession}"
-            raise ToCopyNumberError(msg) from e
-        else:
-            if ref == "":
-                msg = f"Position ({pos}) is not valid on {accession}"
-                raise ToCopyNumberError(msg) from None
+        ref_len = None
+        if self.sequence_length_index is not None:
+            ref_len = self.sequence_length_index.slice_length(accession, pos - 1)
+
+        if ref_len is None:
+            try:
+                ref_len = len(self.seqrepo_access.sr[accession][pos - 1])
+            except ValueError as e:
+                msg = f"SeqRepo ValueError: {str(e).replace('start', 'Position')}"
+                raise ToCopyNumberError(msg) from e
+            except KeyError as e:
+                msg = f"Accession not found in SeqRepo: {accession}"
+                raise ToCopyNumberError(msg) from e
+
+        if not ref_len:
+            msg = f"Position ({pos}) is not valid on {accession}"
+            raise ToCopyNumberError(msg) from None
 
     def _get_vrs_loc_start_or_end(
         self,
@@ -1,6 +1,10 @@
 """Module for to_vrs endpoint."""
 
+import asyncio
 import datetime
+import logging
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable
 from urllib.parse import unquote
 
 from cool_seq_tool.handlers import SeqRepoAccess
@@ -22,6 +26,14 @@ from variation.utils import get_vrs_loc_seq
 from variation.validate import Validate
 from variation.vrs_representation import VRSRepresentation
 
+_logger = logging.getLogger(__name__)
+
+# Default number of queries that can be processed at the same time in a batch
+DEFAULT_BATCH_MAX_CONCURRENCY = 10
+
+# Default number of valid results that can be translated at the same time for a query
+DEFAULT_TRANSLATION_MAX_CONCURRENCY = 10
+
 
 class ToVRS(VRSRepresentation):
     """The class for translating variation strings to VRS representations."""
@@ -57,9 +69,15 @@ class ToVRS(VRSRepresentation):
         baseline_copies: int | None = None,
         copy_change: models.CopyChange | None = None,
         do_liftover: bool = False,
+        max_concurrency: int = DEFAULT_TRANSLATION_MAX_CONCURRENCY,
+        translation_order: list[int] | None = None,
     ) -> tuple[list[TranslationResult], list[str]]:
         """Get translation results
 
+        Valid results are translated concurrently, with at most `max_concurrency`
+        translations running at the same time. Duplicate translations are removed with
+        `_get_unique_translations`.
+
         :param valid_results: List of valid results for a given input
         :param warnings: List of warnings
         :param endpoint_name: Name of endpoint that is being used
@@ -68,27 +86,100 @@ class ToVRS(VRSRepresentation):
         :param baseline_copies: The baseline copies for a copy number count variation
         :param copy_change: The copy change for a copy number change variation
         :param do_liftover: Whether or not to liftover to GRC3h8 assembly
-        :return: Tuple containing list of translations and list of warnings
+        :param max_concurrency: Maximum number of valid results to translate at the
+            same time
+        :param translation_order: Indexes of `valid_results`, in the order to start
+            translating them in. If not provided, uses the order of `valid_results`.
+            Does not change the order of the translations and warnings returned.
+        :raises ValueError: If `max_concurrency` is less than 1
+        :return: Tuple containing list of translations and list of warnings. Both are
+            in the same order as `valid_results`.
         """
+        if max_concurrency < 1:
+            msg = "`max_concurrency` must be greater than 0"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _translate(
+            valid_result: ValidationResult,
+        ) -> tuple[TranslationResult | None, list[str]]:
+            """Translate a single valid result once a slot is available
+
+            :param valid_result: Valid result to translate
+            :return: Tuple containing translation result (if successful) and warnings
+                for the valid result
+            """
+            tr_warnings = []
+            async with semaphore:
+                tr = await self.translator.perform(
+                    valid_result,
+                    tr_warnings,
+                    endpoint_name=endpoint_name,
+                    hgvs_dup_del_mode=hgvs_dup_del_mode,
+                    baseline_copies=baseline_copies,
+                    copy_change=copy_change,
+                    do_liftover=do_liftover,
+                )
+            return tr, tr_warnings
+
+        if translation_order is None:
+            translation_order = list(range(len(valid_results)))
+        ordered_results = await asyncio.gather(
+            *(_translate(valid_results[i]) for i in translation_order)
+        )
+        results = [None] * len(valid_results)
+        for i, result in zip(translation_order, ordered_results, strict=True):
+            results[i] = result
+
         translations = []
-        for valid_result in valid_results:
-            tr = await self.translator.perform(
-                valid_result,
-                warnings,
-                endpoint_name=endpoint_name,
-                hgvs_dup_del_mode=hgvs_dup_del_mode,
-                baseline_copies=baseline_copies,
-                copy_change=copy_change,
-                do_liftover=do_liftover,
-            )
-            if tr and tr not in translations:
+        for tr, tr_warnings in results:
+            warnings += tr_warnings
+            if tr:
                 translations.append(tr)
+        translations = self._get_unique_translations(translations)
 
         if not translations and not warnings:
             warnings.append("Unable to translate variation")
 
         return translations, warnings
 
+    @staticmethod
+    def _get_unique_translations(
+        translations: list[TranslationResult],
+    ) -> list[TranslationResult]:
+        """Get unique translation results
+
+        Translations with the same VRS ID, `vrs_seq_loc_ac` and `vrs_seq_loc_ac_status`
+        are only returned once, at the position of the first one. The one kept is the
+        one `Normalize._get_priority_translation_result` would prefer: where `og_ac` is
+        the same as `vrs_seq_loc_ac`, else the one with the greatest `og_ac`.
+
+        :param translations: List of translation results
+        :return: List of unique translation results
+        """
+
+        def _preference_key(tr: TranslationResult) -> tuple[bool, str, int]:
+            ac, _, version = (tr.og_ac or "").partition(".")
+            return (
+                tr.og_ac == tr.vrs_seq_loc_ac,
+                ac,
+                int(version) if version.isdigit() else -1,
+            )
+
+        unique_translations: dict[tuple, TranslationResult] = {}
+        for tr in translations:
+            key = (
+                (tr.vrs_variation or {}).get("id"),
+                tr.vrs_seq_loc_ac,
+                tr.vrs_seq_loc_ac_status,
+            )
+            prev_tr = unique_translations.get(key)
+            if prev_tr is None or _preference_key(tr) > _preference_key(prev_tr):
+                # Replacing a value keeps its original position
+                unique_translations[key] = tr
+        return list(unique_translations.values())
+
     def _get_vrs_variations(self, translations: list[TranslationResult]) -> list[dict]:
         """Get translated VRS Variations.
 
@@ -134,6 +225,7 @@ class ToVRS(VRSRepresentation):
         }
 
         # Get tokens for input query
+        await self.tokenizer.prefetch_genes(unquote(q.strip()))
         tokens = self.tokenizer.perform(unquote(q.strip()), warnings)
         if warnings:
             params["warnings"] = warnings
@@ -163,3 +255,60 @@ class ToVRS(VRSRepresentation):
         params["warnings"] = warnings
         params["variations"] = self._get_vrs_variations(translations)
         return ToVRSService(**params)
+
+    async def _to_vrs_with_warnings(self, q: str) -> ToVRSService:
+        """Get VRS representation for a query, without raising on unhandled exceptions
+
+        :param q: The variation to translate
+        :return: ToVRSService for `q`. If an unhandled exception occurs, the exception
+            will be logged and added as a warning.
+        """
+        try:
+            return await self.to_vrs(q)
+        except Exception:
+            _logger.exception("Unhandled exception translating %s", q)
+            return ToVRSService(
+                search_term=q,
+                variations=[],
+                warnings=["Unhandled exception. See logs for more details."],
+                service_meta_=ServiceMeta(
+                    version=__version__,
+                    response_datetime=datetime.datetime.now(tz=datetime.UTC),
+                ),
+            )
+
+    async def to_vrs_stream(
+        self,
+        queries: AsyncIterable[str],
+        max_concurrency: int = DEFAULT_BATCH_MAX_CONCURRENCY,
+    ) -> AsyncGenerator[ToVRSService, None]:
+        """Get VRS representations for a stream of queries.
+
+        Queries are consumed lazily and at most `max_concurrency` queries are
+        translated at the same time, so memory use does not depend on the number of
+        queries.
+
+        :param queries: Queries to translate (HGVS, gnomAD VCF, or free text) on GRCh37
+            or GRCh38 assembly
+        :param max_concurrency: Maximum number of queries to translate at the same time
+        :raises ValueError: If `max_concurrency` is less than 1
+        :return: Async generator yielding a ToVRSService for each query, in the same
+            order as `queries`
+        """
+        if max_concurrency < 1:
+            msg = "`max_concurrency` must be greater than 0"
+            raise ValueError(msg)
+
+        pending: deque[asyncio.Task] = deque()
+        try:
+            async for q in queries:
+                pending.append(asyncio.create_task(self._to_vrs_with_warnings(q)))
+                if len(pending) >= max_concurrency:
+                    yield await pending.popleft()
+
+            while pending:
+                yield await pending.popleft()
+        finally:
+            # Client went away or consumer stopped early
+            for task in pending:
+                task.cancel()
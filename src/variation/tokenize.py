@@ -68,6 +68,63 @@ class Tokenize:
             GenomicDuplication(),
         ]
 
+        gene_symbol_ix = self.tokenizers.index(self.gene_symbol)
+        self._pre_gene_tokenizers = self.tokenizers[:gene_symbol_ix]
+        self._post_gene_tokenizers = self.tokenizers[gene_symbol_ix + 1 :]
+
+    def _match_non_gene_term(self, term: str) -> tuple[Token | None, bool]:
+        """Return the highest priority token for a single term from the tokenizers
+        that do not query the gene normalizer
+
+        :param term: Term to tokenize
+        :return: Token if a match was found, and whether or not the gene normalizer
+            must be queried for the term
+        """
+        for tokenizer in self._pre_gene_tokenizers:
+            token = tokenizer.match(term)
+            if token:
+                return token, False
+
+        token = None
+        for tokenizer in self._post_gene_tokenizers:
+            token = tokenizer.match(term)
+            if token:
+                break
+
+        return token, not token or self.gene_symbol.could_match(term)
+
+    def _match_term(self, term: str) -> Token | None:
+        """Return the highest priority token for a single term
+
+        Tokenizers are tried in the order of ``self.tokenizers``. The gene normalizer
+        requires a database lookup, so tokenizers that come after ``self.gene_symbol``
+        are tried first, and the gene normalizer is only queried if no tokenizer
+        matched or if the term could also be a gene. This gives the same token as
+        trying every tokenizer in order.
+
+        :param term: Term to tokenize
+        :return: Token if a match was found
+        """
+        token, match_gene = self._match_non_gene_term(term)
+        if match_gene:
+            gene_token = self.gene_symbol.match(term)
+            if gene_token:
+                return gene_token
+
+        return token
+
+    async def prefetch_genes(self, search_string: str) -> None:
+        """Look up the terms in a search string that ``perform`` would query the gene
+        normalizer for, concurrently and without blocking the event loop. Results are
+        cached, so ``perform`` does not query the gene normalizer afterwards.
+
+        :param search_string: The input string to search on
+        """
+        terms = [
+            term for term in search_string.split() if self._match_non_gene_term(term)[1]
+        ]
+        await self.gene_symbol.prefetch(terms)
+
     def perform(self, search_string: str, warnings: list[str]) -> list[Token]:
         """Return a list of tokens for a given search string
 
@@ -82,21 +139,10 @@ class Tokenize:
             if not term:
                 continue
 
-            matched = False
-            for tokenizer in self.tokenizers:
-                res = tokenizer.match(term)
-                if res:
-                    if isinstance(res, list):
-                        for r in res:
-                            tokens.append(r)
-                            if not matched:
-                                matched = True
-                    else:
-                        tokens.append(res)
-                        matched = True
-                        break
-
-            if not matched:
+            token = self._match_term(term)
+            if token:
+                tokens.append(token)
+            else:
                 warnings.append(f"Unable to tokenize: {term}")
                 tokens.append(
                     Token(token=term, token_type=TokenType.UNKNOWN, input_string=term)
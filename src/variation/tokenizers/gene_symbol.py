@@ -1,20 +1,198 @@
 """Module for Gene Symbol tokenization."""
 
+import logging
+import threading
+from pathlib import Path
+
+from ga4gh.core.models import MappableConcept
 from gene.query import QueryHandler as GeneQueryHandler
+from gene.schemas import MatchType, NormalizeService
 
+from variation.async_gene import AsyncGeneNormalizer, get_async_gene_normalizer
+from variation.cache import MISSING, CacheInfo, TTLCache
 from variation.schemas.token_response_schema import GeneToken
 from variation.tokenizers.tokenizer import Tokenizer
 
+_logger = logging.getLogger(__name__)
+
+# Characters used in variant nomenclature that do not occur in gene symbols or aliases
+NON_GENE_CHARS = frozenset(">=_*?()")
+
+# Default number of gene normalizer results to cache
+DEFAULT_GENE_CACHE_SIZE = 10_000
+
+# Default number of seconds gene normalizer results are cached for
+DEFAULT_GENE_CACHE_TTL = 60 * 60 * 24
+
+# Gene extensions containing other terms that resolve to a gene
+_GENE_TERM_EXTENSIONS = {"aliases", "previous_symbols"}
+
 
 class GeneSymbol(Tokenizer):
     """Class for gene symbol tokenization."""
 
-    def __init__(self, gene_normalizer: GeneQueryHandler) -> None:
+    def __init__(
+        self,
+        gene_normalizer: GeneQueryHandler,
+        cache_size: int = DEFAULT_GENE_CACHE_SIZE,
+        cache_ttl: float | None = DEFAULT_GENE_CACHE_TTL,
+        gene_list_path: Path | None = None,
+        async_gene_normalizer: AsyncGeneNormalizer | None = None,
+    ) -> None:
         """Initialize the gene symbol tokenizer class.
 
         :param gene_normalizer: Instance to gene normalizer QueryHandler
+        :param cache_size: Maximum number of gene normalizer results to cache
+        :param cache_ttl: Number of seconds gene normalizer results are cached for. If
+            `None`, results do not expire.
+        :param gene_list_path: Path to file containing one gene symbol per line. If
+            provided, these genes (and their aliases and previous symbols) will be
+            loaded at initialization and never expire. See `preload`.
+        :param async_gene_normalizer: Async access to `gene_normalizer`, used by
+            `prefetch`. If not provided, the shared async access for
+            `gene_normalizer` is used.
         """
         self.gene_normalizer = gene_normalizer
+        self.async_gene_normalizer = async_gene_normalizer or get_async_gene_normalizer(
+            gene_normalizer
+        )
+        self._cache = TTLCache(cache_size, ttl=cache_ttl)
+        self._index: dict[str, MappableConcept | None] = {}
+        self._index_hits = 0
+        self._index_hits_lock = threading.Lock()
+
+        if gene_list_path:
+            self.preload(gene_list_path)
+
+    @staticmethod
+    def _get_key(input_string: str) -> str:
+        """Get cache key for an input string. The gene normalizer is case-insensitive.
+
+        :param input_string: Input string
+        :return: Cache key
+        """
+        return input_string.lower().strip()
+
+    @staticmethod
+    def _get_gene(norm_resp: NormalizeService) -> MappableConcept | None:
+        """Get gene from a gene normalizer response
+
+        :param norm_resp: Gene normalizer response
+        :return: Gene if match was found
+        """
+        if norm_resp.match_type != MatchType.NO_MATCH:
+            return norm_resp.gene
+        return None
+
+    def _normalize(self, input_string: str) -> MappableConcept | None:
+        """Get gene from the gene normalizer
+
+        :param input_string: Input string
+        :return: Gene if match was found
+        """
+        return self._get_gene(self.gene_normalizer.normalize(input_string))
+
+    async def prefetch(self, input_strings: list[str]) -> None:
+        """Cache gene normalizer results for input strings that are not in the gene
+        index or cache, so that `match` does not query the gene normalizer for them
+
+        Input strings are looked up concurrently on the thread pool of
+        `async_gene_normalizer`, without blocking the event loop.
+
+        :param input_strings: Input strings that may be matched
+        """
+        terms = {}
+        for input_string in input_strings:
+            key = self._get_key(input_string)
+            if (
+                key not in terms
+                and key not in self._index
+                and self._cache.peek(key) is MISSING
+            ):
+                terms[key] = input_string
+        if not terms:
+            return
+
+        norm_resps = await self.async_gene_normalizer.normalize_many(terms.values())
+        for key, input_string in terms.items():
+            self._cache.set(key, self._get_gene(norm_resps[input_string]))
+
+    def preload(self, gene_list_path: Path) -> None:
+        """Load genes from a file into the gene index, so that they are resolved
+        without querying the gene normalizer.
+
+        Aliases and previous symbols for each gene are also loaded. Each term is
+        normalized, so the index contains the same gene the gene normalizer would
+        return for that term.
+
+        :param gene_list_path: Path to file containing one gene symbol per line. Blank
+            lines and lines starting with `#` are ignored.
+        """
+        with gene_list_path.open() as f:
+            symbols = [
+                line.strip() for line in f if line.strip() and not line.startswith("#")
+            ]
+
+        for symbol in symbols:
+            terms = [symbol]
+            gene = self._index_term(symbol)
+            if gene:
+                for ext in gene.extensions or []:
+                    if ext.name in _GENE_TERM_EXTENSIONS and ext.value:
+                        terms.extend(ext.value)
+
+            for term in terms[1:]:
+                self._index_term(term)
+
+        _logger.info(
+            "Preloaded %s gene terms from %s", len(self._index), gene_list_path
+        )
+
+    def _index_term(self, term: str) -> MappableConcept | None:
+        """Add gene normalizer result for a term to the gene index
+
+        :param term: Gene symbol, alias or previous symbol
+        :return: Gene if match was found
+        """
+        key = self._get_key(term)
+        if key not in self._index:
+            self._index[key] = self._normalize(term)
+        return self._index[key]
+
+    def cache_info(self) -> CacheInfo:
+        """Get gene lookup statistics. Gene index hits are included in `hits`.
+
+        :return: Number of hits and misses, and cache size
+        """
+        info = self._cache.cache_info()
+        with self._index_hits_lock:
+            index_hits = self._index_hits
+        return info._replace(hits=info.hits + index_hits)
+
+    def could_match(self, input_string: str) -> bool:
+        """Determine whether the gene normalizer could match an input string, without
+        querying it
+
+        This is conservative: `False` is only returned when `input_string` can not be
+        a gene symbol, alias, or concept identifier, or when a previous lookup found no
+        match.
+
+        :param input_string: Input string
+        :return: `False` if gene normalizer will not find a match for `input_string`.
+            Otherwise, `True`
+        """
+        key = self._get_key(input_string)
+        gene = self._index.get(key, MISSING)
+        if gene is MISSING:
+            gene = self._cache.peek(key)
+        if gene is None:
+            return False
+
+        if ":" in input_string:
+            # Concept identifiers, such as `hgnc:1097`
+            return True
+
+        return NON_GENE_CHARS.isdisjoint(input_string)
 
     def match(self, input_string: str) -> GeneToken | None:
         """Return tokens that are genes
@@ -22,11 +200,18 @@ class GeneSymbol(Tokenizer):
         :param input_string: Input string
         :return: GeneToken if match was found
         """
-        norm_resp = self.gene_normalizer.normalize(input_string)
-        norm_match_type = norm_resp.match_type
+        key = self._get_key(input_string)
+        gene = self._index.get(key, MISSING)
+        if gene is MISSING:
+            gene = self._cache.get(key)
+            if gene is MISSING:
+                gene = self._normalize(input_string)
+                self._cache.set(key, gene)
+        else:
+            with self._index_hits_lock:
+                self._index_hits += 1
 
-        if norm_match_type != 0:
-            gene = norm_resp.gene
+        if gene:
             label = gene.name
             return GeneToken(
                 token=label,
@@ -0,0 +1,130 @@
+"""Module for caching per-accession metadata from UTA."""
+
+import asyncio
+from collections.abc import Iterable
+
+from cool_seq_tool.sources import ManeTranscriptMappings, UtaDatabase
+
+from variation.cache import AsyncLoadingCache, CacheInfo, TTLCache
+
+# Default maximum number of cached UTA lookups
+DEFAULT_TRANSCRIPT_CACHE_MAXSIZE = 100000
+
+# Default number of UTA lookups to make at the same time when preloading
+DEFAULT_PRELOAD_MAX_CONCURRENCY = 10
+
+
+def get_mane_transcript_accessions(
+    mane_transcript_mappings: ManeTranscriptMappings,
+) -> list[str]:
+    """Get RefSeq and Ensembl accessions for every MANE transcript
+
+    :param mane_transcript_mappings: MANE transcript mappings
+    :return: MANE transcript accessions
+    """
+    df = mane_transcript_mappings.df
+    return [
+        ac
+        for column in ("RefSeq_nuc", "Ensembl_nuc")
+        for ac in df[column].to_list()
+        if ac
+    ]
+
+
+class TranscriptMetadataCache:
+    """Cache for `UtaDatabase.get_cds_start_end` and `UtaDatabase.get_chr_assembly`.
+
+    Results, including accessions that are not found, are cached by accession. If a
+    lookup is already in progress for an accession, other lookups for the same
+    accession wait for its result instead of querying UTA again. Lookups that raise
+    are not cached. Least recently used results are evicted once more than `maxsize`
+    are cached.
+    """
+
+    def __init__(
+        self, uta_db: UtaDatabase, maxsize: int = DEFAULT_TRANSCRIPT_CACHE_MAXSIZE
+    ) -> None:
+        """Initialize the TranscriptMetadataCache class
+
+        :param uta_db: UTA database to look up metadata in
+        :param maxsize: Maximum number of cached lookups
+        :raises ValueError: If `maxsize` is less than 1
+        """
+        self.uta_db = uta_db
+        self._get_cds_start_end = uta_db.get_cds_start_end
+        self._get_chr_assembly = uta_db.get_chr_assembly
+        self._cache = TTLCache(maxsize)
+        self._loader = AsyncLoadingCache(self._cache)
+
+    async def get_cds_start_end(self, tx_ac: str) -> tuple[int, int] | None:
+        """Get coding start and end site for a transcript, from cache if possible
+
+        :param tx_ac: Transcript accession
+        :return: Coding start and end site, same as `UtaDatabase.get_cds_start_end`
+        """
+        return await self._loader.get(
+            ("get_cds_start_end", tx_ac), lambda: self._get_cds_start_end(tx_ac)
+        )
+
+    async def get_chr_assembly(self, ac: str) -> tuple[str, str] | None:
+        """Get chromosome and assembly for a genomic accession, from cache if possible
+
+        :param ac: Genomic accession
+        :return: Chromosome and assembly, same as `UtaDatabase.get_chr_assembly`
+        """
+        return await self._loader.get(
+            ("get_chr_assembly", ac), lambda: self._get_chr_assembly(ac)
+        )
+
+    async def preload(
+        self,
+        tx_acs: Iterable[str],
+        max_concurrency: int = DEFAULT_PRELOAD_MAX_CONCURRENCY,
+    ) -> None:
+        """Cache coding start and end sites for transcripts
+
+        :param tx_acs: Transcript accessions
+        :param max_concurrency: Maximum number of UTA lookups to make at the same time
+        :raises ValueError: If `max_concurrency` is less than 1
+        """
+        if max_concurrency < 1:
+            msg = "`max_concurrency` must be greater than 0"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _preload(tx_ac: str) -> None:
+            async with semaphore:
+                await self.get_cds_start_end(tx_ac)
+
+        await asyncio.gather(*(_preload(tx_ac) for tx_ac in tx_acs))
+
+    def cache_info(self) -> CacheInfo:
+        """Get cache statistics
+
+        :return: Number of hits, misses, max size and current size
+        """
+        return self._cache.cache_info()
+
+    def clear(self) -> None:
+        """Remove all cached results and reset statistics"""
+        self._cache.clear()
+
+
+def enable_transcript_cache(
+    uta_db: UtaDatabase, maxsize: int = DEFAULT_TRANSCRIPT_CACHE_MAXSIZE
+) -> TranscriptMetadataCache:
+    """Cache coding start and end sites and chromosome assemblies for every lookup
+    made with `uta_db`, including lookups made by cool-seq-tool
+
+    :param uta_db: UTA database
+    :param maxsize: Maximum number of cached lookups
+    :return: Transcript metadata cache. If `uta_db` already has a transcript metadata
+        cache, it is returned unchanged.
+    """
+    cache = getattr(uta_db.get_cds_start_end, "__self__", None)
+    if not isinstance(cache, TranscriptMetadataCache):
+        cache = TranscriptMetadataCache(uta_db, maxsize=maxsize)
+        uta_db.get_cds_start_end = cache.get_cds_start_end
+        uta_db.get_chr_assembly = cache.get_chr_assembly
+    return cache
@@ -1,6 +1,6 @@
 """Module for translation."""
 
-from typing import TYPE_CHECKING
+from collections.abc import Iterable
 
 from cool_seq_tool.handlers import SeqRepoAccess
 from cool_seq_tool.mappers import ManeTranscript
@@ -9,6 +9,7 @@ from ga4gh.vrs import models
 
 from variation.hgvs_dup_del_mode import HGVSDupDelMode
 from variation.schemas.app_schemas import Endpoint
+from variation.schemas.classification_response_schema import ClassificationType
 from variation.schemas.normalize_response_schema import HGVSDupDelModeOption
 from variation.schemas.translation_response_schema import TranslationResult
 from variation.schemas.validation_response_schema import ValidationResult
@@ -34,10 +35,35 @@ from variation.translators import (
     ProteinStopGain,
     ProteinSubstitution,
 )
+from variation.translators.translator import Translator
 from variation.vrs_representation import VRSRepresentation
 
-if TYPE_CHECKING:
-    from variation.translators.translator import Translator
+# Translator to use for each classification type
+TRANSLATORS: dict[ClassificationType, type[Translator]] = {
+    translator.classification_type: translator
+    for translator in (
+        ProteinSubstitution,
+        CdnaSubstitution,
+        GenomicSubstitution,
+        ProteinStopGain,
+        ProteinReferenceAgree,
+        CdnaReferenceAgree,
+        GenomicReferenceAgree,
+        ProteinDelIns,
+        CdnaDelIns,
+        GenomicDelIns,
+        ProteinDeletion,
+        CdnaDeletion,
+        GenomicDeletion,
+        GenomicDeletionAmbiguous,
+        ProteinInsertion,
+        CdnaInsertion,
+        GenomicInsertion,
+        GenomicDuplication,
+        GenomicDuplicationAmbiguous,
+        Amplification,
+    )
+}
 
 
 class Translate:
@@ -50,41 +76,27 @@ class Translate:
         uta: UtaDatabase,
         vrs: VRSRepresentation,
         hgvs_dup_del_mode: HGVSDupDelMode,
+        classification_types: Iterable[ClassificationType] | None = None,
     ) -> None:
         """Initialize the Translate class. Will create an instance variable,
-        `translators`, which is a list of Translator for supported variation types.
-
+        `translators`, which maps classification types to their Translator.
 
         :param seqrepo_access: Access to SeqRepo data
         :param mane_transcript: Access MANE Transcript information
         :param uta: Access to UTA queries
         :param vrs: Class for creating VRS objects
         :param hgvs_dup_del_mode: Class for interpreting HGVS duplications and deletions
+        :param classification_types: Classification types to create translators for.
+            If not provided, translators are created for all classification types.
+            Validation results of any other type will not be translated.
         """
         params = [seqrepo_access, mane_transcript, uta, vrs, hgvs_dup_del_mode]
-
-        self.translators: list[Translator] = [
-            ProteinSubstitution(*params),
-            CdnaSubstitution(*params),
-            GenomicSubstitution(*params),
-            ProteinStopGain(*params),
-            ProteinReferenceAgree(*params),
-            CdnaReferenceAgree(*params),
-            GenomicReferenceAgree(*params),
-            ProteinDelIns(*params),
-            CdnaDelIns(*params),
-            GenomicDelIns(*params),
-            ProteinDeletion(*params),
-            CdnaDeletion(*params),
-            GenomicDeletion(*params),
-            GenomicDeletionAmbiguous(*params),
-            ProteinInsertion(*params),
-            CdnaInsertion(*params),
-            GenomicInsertion(*params),
-            GenomicDuplication(*params),
-            GenomicDuplicationAmbiguous(*params),
-            Amplification(*params),
-        ]
+        if classification_types is None:
+            classification_types = TRANSLATORS
+        self.translators: dict[ClassificationType, Translator] = {
+            ClassificationType(t): TRANSLATORS[ClassificationType(t)](*params)
+            for t in classification_types
+        }
 
     async def perform(
         self,
@@ -109,20 +121,18 @@ class Translate:
             not successful, `None`
         """
         translation_result = None
-        for translator in self.translators:
-            if translator.can_translate(
-                validation_result.classification.classification_type
-            ):
-                result = await translator.translate(
-                    validation_result,
-                    warnings,
-                    endpoint_name=endpoint_name,
-                    hgvs_dup_del_mode=hgvs_dup_del_mode,
-                    baseline_copies=baseline_copies,
-                    copy_change=copy_change,
-                    do_liftover=do_liftover,
-                )
-                translation_result = result
-                break
+        translator = self.translators.get(
+            validation_result.classification.classification_type
+        )
+        if translator:
+            translation_result = await translator.translate(
+                validation_result,
+                warnings,
+                endpoint_name=endpoint_name,
+                hgvs_dup_del_mode=hgvs_dup_del_mode,
+                baseline_copies=baseline_copies,
+                copy_change=copy_change,
+                do_liftover=do_liftover,
+            )
 
         return translation_result
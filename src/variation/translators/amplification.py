@@ -15,14 +15,7 @@ from variation.utils import get_priority_sequence_location
 class Amplification(Translator):
     """The Amplification Translator class."""
 
-    def can_translate(self, classification_type: ClassificationType) -> bool:
-        """Determine if it's possible to translate a classification.
-
-        :param classification_type: Classification type found
-        :return: `True` if `classification_type` matches translator's classification
-            type. Otherwise, `False`
-        """
-        return classification_type == ClassificationType.AMPLIFICATION
+    classification_type = ClassificationType.AMPLIFICATION
 
     async def translate(
         self,
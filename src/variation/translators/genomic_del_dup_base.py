@@ -149,7 +149,7 @@ class GenomicDelDupTranslator(Translator):
                     and classification.nomenclature == Nomenclature.GNOMAD_VCF
                 ):
                     ref = classification.matching_tokens[0].ref
-                    invalid_ref_msg = self.validate_reference_sequence(
+                    invalid_ref_msg = await self.validate_reference_sequence(
                         ac,
                         pos0,
                         pos0 + (len(ref) - 1),
@@ -22,14 +22,7 @@ from variation.translators.translator import Translator
 class GenomicSubstitution(Translator):
     """The Genomic Substitution Translator class."""
 
-    def can_translate(self, classification_type: ClassificationType) -> bool:
-        """Determine if it's possible to translate a classification.
-
-        :param classification_type: Classification type found
-        :return: `True` if `classification_type` matches translator's classification
-            type. Otherwise, `False`
-        """
-        return classification_type == ClassificationType.GENOMIC_SUBSTITUTION
+    classification_type = ClassificationType.GENOMIC_SUBSTITUTION
 
     async def translate(
         self,
@@ -18,14 +18,7 @@ from variation.translators.translator import Translator
 class ProteinReferenceAgree(Translator):
     """The Protein Reference Agree Translator class."""
 
-    def can_translate(self, classification_type: ClassificationType) -> bool:
-        """Determine if it's possible to translate a classification.
-
-        :param classification_type: Classification type found
-        :return: `True` if `classification_type` matches translator's classification
-            type. Otherwise, `False`
-        """
-        return classification_type == ClassificationType.PROTEIN_REFERENCE_AGREE
+    classification_type = ClassificationType.PROTEIN_REFERENCE_AGREE
 
     async def translate(
         self,
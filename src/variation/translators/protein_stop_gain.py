@@ -18,14 +18,7 @@ from variation.translators.translator import Translator
 class ProteinStopGain(Translator):
     """The Protein Stop Gain Translator class."""
 
-    def can_translate(self, classification_type: ClassificationType) -> bool:
-        """Determine if it's possible to translate a classification.
-
-        :param classification_type: Classification type found
-        :return: `True` if `classification_type` matches translator's classification
-            type. Otherwise, `False`
-        """
-        return classification_type == ClassificationType.PROTEIN_STOP_GAIN
+    classification_type = ClassificationType.PROTEIN_STOP_GAIN
 
     async def translate(
         self,
@@ -9,6 +9,7 @@ from cool_seq_tool.sources import UtaDatabase
 from ga4gh.core.models import Extension
 from ga4gh.vrs import models
 
+from variation.async_seqrepo import get_async_seqrepo_access
 from variation.hgvs_dup_del_mode import HGVSDupDelMode
 from variation.schemas.app_schemas import Endpoint
 from variation.schemas.classification_response_schema import ClassificationType
@@ -25,6 +26,9 @@ from variation.vrs_representation import VRSRepresentation
 class Translator(ABC):
     """Class for translating to VRS representations"""
 
+    # Classification type this class translates. Set by each subclass.
+    classification_type: ClassificationType
+
     def __init__(
         self,
         seqrepo_access: SeqRepoAccess,
@@ -42,12 +46,12 @@ class Translator(ABC):
         :param hgvs_dup_del_mode: Class for interpreting HGVS duplications and deletions
         """
         self.seqrepo_access = seqrepo_access
+        self.async_seqrepo_access = get_async_seqrepo_access(seqrepo_access)
         self.uta = uta
         self.mane_transcript = mane_transcript
         self.vrs = vrs
         self.hgvs_dup_del_mode = hgvs_dup_del_mode
 
-    @abstractmethod
     def can_translate(self, classification_type: ClassificationType) -> bool:
         """Determine if it's possible to translate a classification.
 
@@ -55,6 +59,7 @@ class Translator(ABC):
         :return: `True` if `classification_type` matches translator's classification
             type. Otherwise, `False`
         """
+        return classification_type == self.classification_type
 
     @abstractmethod
     async def translate(
@@ -125,7 +130,7 @@ class Translator(ABC):
                         f"Inter-residue position {pos} out of index on {alt_ac} on gene, {gene_token.token}"
                     )
 
-    def validate_reference_sequence(
+    async def validate_reference_sequence(
         self,
         ac: str,
         start_pos: int,
@@ -144,7 +149,7 @@ class Translator(ABC):
         :param coordinate_type: Coordinate type for `start_pos` and `end_pos`
         :return: Invalid message if invalid. If valid, `None`
         """
-        actual_ref, err_msg = self.seqrepo_access.get_reference_sequence(
+        actual_ref, err_msg = await self.async_seqrepo_access.get_reference_sequence(
             ac, start=start_pos, end=end_pos, coordinate_type=coordinate_type
         )
 
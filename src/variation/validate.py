@@ -1,5 +1,6 @@
 """Module for Validation."""
 
+from collections.abc import Iterable
 from typing import Literal
 
 from cool_seq_tool.handlers import SeqRepoAccess
@@ -7,9 +8,19 @@ from cool_seq_tool.mappers import LiftOver
 from cool_seq_tool.sources import TranscriptMappings, UtaDatabase
 from gene.query import QueryHandler as GeneQueryHandler
 
-from variation.schemas.classification_response_schema import Classification
+from variation.cache import TTLCache
+from variation.chromosome_accessions import ChromosomeAccessions
+from variation.gene_index import GeneIntervalIndex
+from variation.schemas.classification_response_schema import (
+    Classification,
+    ClassificationType,
+)
 from variation.schemas.service_schema import ClinVarAssembly
-from variation.schemas.validation_response_schema import ValidationSummary
+from variation.schemas.validation_response_schema import (
+    ValidationResult,
+    ValidationSummary,
+)
+from variation.sequence_length_index import SequenceLengthIndex
 from variation.validators import (
     Amplification,
     CdnaDeletion,
@@ -32,7 +43,39 @@ from variation.validators import (
     ProteinStopGain,
     ProteinSubstitution,
 )
-from variation.validators.validator import GenomicValidator, Validator
+from variation.validators.validator import (
+    DEFAULT_ACCESSION_MAX_CONCURRENCY,
+    DEFAULT_GENE_CACHE_MAXSIZE,
+    GenomicValidator,
+    Validator,
+)
+
+# Validator to use for each classification type
+VALIDATORS: dict[ClassificationType, type[Validator]] = {
+    validator.classification_type: validator
+    for validator in (
+        ProteinSubstitution,
+        CdnaSubstitution,
+        GenomicSubstitution,
+        ProteinStopGain,
+        ProteinReferenceAgree,
+        CdnaReferenceAgree,
+        GenomicReferenceAgree,
+        ProteinDelIns,
+        CdnaDelIns,
+        GenomicDelIns,
+        ProteinDeletion,
+        CdnaDeletion,
+        GenomicDeletion,
+        GenomicDeletionAmbiguous,
+        ProteinInsertion,
+        CdnaInsertion,
+        GenomicInsertion,
+        GenomicDuplication,
+        GenomicDuplicationAmbiguous,
+        Amplification,
+    )
+}
 
 
 class Validate:
@@ -45,39 +88,54 @@ class Validate:
         uta: UtaDatabase,
         gene_normalizer: GeneQueryHandler,
         liftover: LiftOver,
+        classification_types: Iterable[ClassificationType] | None = None,
+        accession_max_concurrency: int = DEFAULT_ACCESSION_MAX_CONCURRENCY,
+        sequence_length_index: SequenceLengthIndex | None = None,
+        chromosome_accessions: ChromosomeAccessions | None = None,
+        gene_cache_maxsize: int = DEFAULT_GENE_CACHE_MAXSIZE,
+        gene_index: GeneIntervalIndex | None = None,
     ) -> None:
         """Initialize the validate class. Will create an instance variable,
-        `validators`, which is a list of Validators for supported variation types.
+        `validators`, which maps classification types to their Validator.
 
         :param seqrepo_access: Access to SeqRepo data
         :param transcript_mappings: Access to transcript mappings
         :param uta: Access to UTA queries
         :param gene_normalizer: Access to gene-normalizer
         :param liftover: Instance to provide mapping between human genome assemblies
+        :param classification_types: Classification types to create validators for.
+            If not provided, validators are created for all classification types.
+            Classifications of any other type will not be valid.
+        :param accession_max_concurrency: Maximum number of accessions to validate at
+            the same time for a classification
+        :param sequence_length_index: Index of sequence lengths for validators to check
+            that positions exist on an accession
+        :param chromosome_accessions: Table of chromosome to RefSeq genomic accession
+            for validators to get accessions for gnomAD VCF queries. If not provided,
+            will be created.
+        :param gene_cache_maxsize: Maximum number of genomic accessions and gene
+            bounds to cache for genes in free text genomic queries. If `0`, these are
+            not cached.
+        :param gene_index: Index of Ensembl gene locations for validators to get gene
+            bounds for free text genomic queries
         """
         params = [seqrepo_access, transcript_mappings, uta, gene_normalizer, liftover]
-        self.validators: list[Validator] = [
-            ProteinSubstitution(*params),
-            CdnaSubstitution(*params),
-            GenomicSubstitution(*params),
-            ProteinStopGain(*params),
-            ProteinReferenceAgree(*params),
-            CdnaReferenceAgree(*params),
-            GenomicReferenceAgree(*params),
-            ProteinDelIns(*params),
-            CdnaDelIns(*params),
-            GenomicDelIns(*params),
-            ProteinDeletion(*params),
-            CdnaDeletion(*params),
-            GenomicDeletion(*params),
-            GenomicDeletionAmbiguous(*params),
-            ProteinInsertion(*params),
-            CdnaInsertion(*params),
-            GenomicInsertion(*params),
-            GenomicDuplication(*params),
-            GenomicDuplicationAmbiguous(*params),
-            Amplification(*params),
-        ]
+        if classification_types is None:
+            classification_types = VALIDATORS
+        if chromosome_accessions is None:
+            chromosome_accessions = ChromosomeAccessions(seqrepo_access)
+        self.gene_cache = TTLCache(gene_cache_maxsize) if gene_cache_maxsize else None
+        self.validators: dict[ClassificationType, Validator] = {
+            ClassificationType(t): VALIDATORS[ClassificationType(t)](
+                *params,
+                max_concurrency=accession_max_concurrency,
+                sequence_length_index=sequence_length_index,
+                chromosome_accessions=chromosome_accessions,
+                gene_cache=self.gene_cache,
+                gene_index=gene_index,
+            )
+            for t in classification_types
+        }
 
     async def perform(
         self,
@@ -91,6 +149,40 @@ class Validate:
         :param classification: A classification for a list of tokens
         :param input_assembly: Assembly used for `q`. Only used when `q` is using
             genomic free text of gnomad vcf format
+        :return: Validation summary for classification containing valid and invalid
+            results. If there is no validator for the classification type, the summary
+            has no results and a warning.
+        """
+        validator = self.validators.get(classification.classification_type)
+        if not validator:
+            return ValidationSummary(
+                valid_results=[],
+                invalid_results=[],
+                warnings=[
+                    "Unsupported classification type: "
+                    f"{classification.classification_type.value}"
+                ],
+            )
+
+        if isinstance(validator, GenomicValidator):
+            validation_results = await validator.validate(
+                classification, input_assembly=input_assembly
+            )
+        else:
+            validation_results = await validator.validate(
+                classification,
+            )
+
+        return self.get_validation_summary(classification, validation_results)
+
+    @staticmethod
+    def get_validation_summary(
+        classification: Classification, validation_results: list[ValidationResult]
+    ) -> ValidationSummary:
+        """Get validation summary for a classification's validation results
+
+        :param classification: A classification for a list of tokens
+        :param validation_results: Validation results for `classification`
         :return: Validation summary for classification containing valid and invalid
             results
         """
@@ -100,31 +192,13 @@ class Validate:
         found_valid_result = False
         invalid_classification = None
 
-        for validator in self.validators:
-            if validator.validates_classification_type(
-                classification.classification_type
-            ):
-                if isinstance(validator, GenomicValidator):
-                    validation_results = await validator.validate(
-                        classification, input_assembly=input_assembly
-                    )
-                else:
-                    validation_results = await validator.validate(
-                        classification,
-                    )
-
-                for validation_result in validation_results:
-                    if validation_result.is_valid:
-                        found_valid_result = True
-                        valid_possibilities.append(validation_result)
-                    else:
-                        invalid_possibilities.append(validation_result)
-                        invalid_classification = (
-                            classification.classification_type.value
-                        )
-
-            if found_valid_result:
-                break
+        for validation_result in validation_results:
+            if validation_result.is_valid:
+                found_valid_result = True
+                valid_possibilities.append(validation_result)
+            else:
+                invalid_possibilities.append(validation_result)
+                invalid_classification = classification.classification_type.value
 
         if not found_valid_result:
             warnings = [
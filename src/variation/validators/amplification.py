@@ -12,6 +12,8 @@ from variation.validators.validator import Validator
 class Amplification(Validator):
     """The Insertion Validator Base class."""
 
+    classification_type = ClassificationType.AMPLIFICATION
+
     async def get_valid_invalid_results(
         self, classification: AmplificationClassification, accessions: list
     ) -> list[ValidationResult]:
@@ -28,17 +30,6 @@ class Amplification(Validator):
             )
         ]
 
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Check that classification type can be validated by validator.
-
-        :param ClassificationType classification_type: The type of variation
-        :return: `True` if classification_type matches validator's
-            classification type. `False` otherwise.
-        """
-        return classification_type == ClassificationType.AMPLIFICATION
-
     async def get_accessions(
         self, classification: Classification, errors: list
     ) -> list:
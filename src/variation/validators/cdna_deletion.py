@@ -13,6 +13,8 @@ from variation.validators.validator import Validator
 class CdnaDeletion(Validator):
     """The cDNA Deletion Validator class."""
 
+    classification_type = ClassificationType.CDNA_DELETION
+
     async def get_valid_invalid_results(
         self, classification: CdnaDeletionClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -35,9 +37,12 @@ class CdnaDeletion(Validator):
                 )
             ]
 
-        validation_results = []
+        async def _validate_accession(c_ac: str) -> ValidationResult:
+            """Validate a single accession
 
-        for c_ac in accessions:
+            :param c_ac: Accession to validate
+            :return: Validation result for accession
+            """
             errors = []
             cds_start, cds_start_err_msg = await self.get_cds_start(c_ac)
 
@@ -56,7 +61,7 @@ class CdnaDeletion(Validator):
                     else start
                 )
                 if classification.deleted_sequence:
-                    invalid_del_seq_msg = self.validate_reference_sequence(
+                    invalid_del_seq_msg = await self.validate_reference_sequence(
                         c_ac,
                         start,
                         end_pos=end,
@@ -67,7 +72,7 @@ class CdnaDeletion(Validator):
                         errors.append(invalid_del_seq_msg)
                 else:
                     # Validate accession and positions
-                    invalid_ac_pos_msg = self.validate_ac_and_pos(
+                    invalid_ac_pos_msg = await self.validate_ac_and_pos(
                         c_ac,
                         start,
                         end_pos=end,
@@ -75,23 +80,15 @@ class CdnaDeletion(Validator):
                     if invalid_ac_pos_msg:
                         errors.append(invalid_ac_pos_msg)
 
-            validation_results.append(
-                ValidationResult(
-                    accession=c_ac,
-                    classification=classification,
-                    cds_start=cds_start,
-                    is_valid=not errors,
-                    errors=errors,
-                )
+            return ValidationResult(
+                accession=c_ac,
+                classification=classification,
+                cds_start=cds_start,
+                is_valid=not errors,
+                errors=errors,
             )
 
-        return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is cdna deletion."""
-        return classification_type == ClassificationType.CDNA_DELETION
+        return await self.validate_accessions(accessions, _validate_accession)
 
     async def get_accessions(
         self, classification: Classification, errors: list
@@ -13,6 +13,8 @@ from variation.validators.validator import Validator
 class CdnaInsertion(Validator):
     """The Cdna Insertion Validator class."""
 
+    classification_type = ClassificationType.CDNA_INSERTION
+
     async def get_valid_invalid_results(
         self, classification: CdnaInsertionClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -35,9 +37,12 @@ class CdnaInsertion(Validator):
                 )
             ]
 
-        validation_results = []
+        async def _validate_accession(c_ac: str) -> ValidationResult:
+            """Validate a single accession
 
-        for c_ac in accessions:
+            :param c_ac: Accession to validate
+            :return: Validation result for accession
+            """
             errors = []
             cds_start, cds_start_err_msg = await self.get_cds_start(c_ac)
 
@@ -45,7 +50,7 @@ class CdnaInsertion(Validator):
                 errors.append(cds_start_err_msg)
             else:
                 # Validate accession and positions
-                invalid_ac_pos_msg = self.validate_ac_and_pos(
+                invalid_ac_pos_msg = await self.validate_ac_and_pos(
                     c_ac,
                     cds_start + classification.pos0,
                     end_pos=cds_start + classification.pos1,
@@ -53,23 +58,15 @@ class CdnaInsertion(Validator):
                 if invalid_ac_pos_msg:
                     errors.append(invalid_ac_pos_msg)
 
-            validation_results.append(
-                ValidationResult(
-                    accession=c_ac,
-                    classification=classification,
-                    cds_start=cds_start,
-                    is_valid=not errors,
-                    errors=errors,
-                )
+            return ValidationResult(
+                accession=c_ac,
+                classification=classification,
+                cds_start=cds_start,
+                is_valid=not errors,
+                errors=errors,
             )
 
-        return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is cdna insertion."""
-        return classification_type == ClassificationType.CDNA_INSERTION
+        return await self.validate_accessions(accessions, _validate_accession)
 
     async def get_accessions(
         self, classification: Classification, errors: list
@@ -13,6 +13,8 @@ from variation.validators.validator import Validator
 class CdnaReferenceAgree(Validator):
     """The Cdna Reference Agree Validator class."""
 
+    classification_type = ClassificationType.CDNA_REFERENCE_AGREE
+
     async def get_valid_invalid_results(
         self, classification: CdnaReferenceAgreeClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -22,38 +24,34 @@ class CdnaReferenceAgree(Validator):
         :param accessions: A list of accessions for a classification
         :return: List of validation results containing invalid and valid results
         """
-        validation_results = []
 
-        for c_ac in accessions:
+        async def _validate_accession(c_ac: str) -> ValidationResult:
+            """Validate a single accession
+
+            :param c_ac: Accession to validate
+            :return: Validation result for accession
+            """
             errors = []
             cds_start, cds_start_err_msg = await self.get_cds_start(c_ac)
 
             if cds_start_err_msg:
                 errors.append(cds_start_err_msg)
             else:
-                invalid_ac_pos_msg = self.validate_ac_and_pos(
+                invalid_ac_pos_msg = await self.validate_ac_and_pos(
                     c_ac, cds_start + classification.pos
                 )
                 if invalid_ac_pos_msg:
                     errors.append(invalid_ac_pos_msg)
 
-            validation_results.append(
-                ValidationResult(
-                    accession=c_ac,
-                    classification=classification,
-                    cds_start=cds_start,
-                    is_valid=not errors,
-                    errors=errors,
-                )
+            return ValidationResult(
+                accession=c_ac,
+                classification=classification,
+                cds_start=cds_start,
+                is_valid=not errors,
+                errors=errors,
             )
 
-        return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is cdna reference agree."""
-        return classification_type == ClassificationType.CDNA_REFERENCE_AGREE
+        return await self.validate_accessions(accessions, _validate_accession)
 
     async def get_accessions(
         self, classification: Classification, errors: list
@@ -12,6 +12,8 @@ from variation.validators.validator import GenomicValidator
 class GenomicDeletion(GenomicValidator):
     """The Genomic Deletion Validator class."""
 
+    classification_type = ClassificationType.GENOMIC_DELETION
+
     async def get_valid_invalid_results(
         self, classification: GenomicDeletionClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -34,12 +36,15 @@ class GenomicDeletion(GenomicValidator):
                 )
             ]
 
-        validation_results = []
+        async def _validate_accession(alt_ac: str) -> ValidationResult:
+            """Validate a single accession
 
-        for alt_ac in accessions:
+            :param alt_ac: Accession to validate
+            :return: Validation result for accession
+            """
             errors = []
 
-            invalid_ac_pos = self.validate_ac_and_pos(
+            invalid_ac_pos = await self.validate_ac_and_pos(
                 alt_ac, classification.pos0, end_pos=classification.pos1
             )
             if invalid_ac_pos:
@@ -54,7 +59,7 @@ class GenomicDeletion(GenomicValidator):
             ):
                 # Validate deleted sequence
                 # HGVS deleted sequence includes start and end
-                invalid_del_seq_message = self.validate_reference_sequence(
+                invalid_del_seq_message = await self.validate_reference_sequence(
                     alt_ac,
                     classification.pos0,
                     classification.pos1 if classification.pos1 else classification.pos0,
@@ -67,7 +72,7 @@ class GenomicDeletion(GenomicValidator):
             if not errors and classification.nomenclature == Nomenclature.GNOMAD_VCF:
                 # Validate reference sequence
                 ref = classification.matching_tokens[0].ref
-                validate_ref_msg = self.validate_reference_sequence(
+                validate_ref_msg = await self.validate_reference_sequence(
                     alt_ac,
                     classification.pos0 - 1,
                     end_pos=classification.pos0 + (len(ref) - 1),
@@ -88,19 +93,11 @@ class GenomicDeletion(GenomicValidator):
                 if invalid_gene_pos_msg:
                     errors.append(invalid_gene_pos_msg)
 
-            validation_results.append(
-                ValidationResult(
-                    accession=alt_ac,
-                    classification=classification,
-                    is_valid=not errors,
-                    errors=errors,
-                )
+            return ValidationResult(
+                accession=alt_ac,
+                classification=classification,
+                is_valid=not errors,
+                errors=errors,
             )
 
-        return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is genomic deletion"""
-        return classification_type == ClassificationType.GENOMIC_DELETION
+        return await self.validate_accessions(accessions, _validate_accession)
@@ -12,6 +12,8 @@ from variation.validators.validator import GenomicValidator
 class GenomicDeletionAmbiguous(GenomicValidator):
     """The Genomic Deletion Ambiguous Validator class."""
 
+    classification_type = ClassificationType.GENOMIC_DELETION_AMBIGUOUS
+
     async def get_valid_invalid_results(
         self,
         classification: GenomicDeletionAmbiguousClassification,
@@ -37,9 +39,12 @@ class GenomicDeletionAmbiguous(GenomicValidator):
                 )
             ]
 
-        validation_results = []
+        async def _validate_accession(alt_ac: str) -> ValidationResult:
+            """Validate a single accession
 
-        for alt_ac in accessions:
+            :param alt_ac: Accession to validate
+            :return: Validation result for accession
+            """
             errors = []
 
             if classification.ambiguous_type == AmbiguousType.AMBIGUOUS_1:
@@ -62,7 +67,7 @@ class GenomicDeletionAmbiguous(GenomicValidator):
                 )
 
             if start_pos is not None and end_pos is not None:
-                invalid_ac_pos = self.validate_ac_and_pos(
+                invalid_ac_pos = await self.validate_ac_and_pos(
                     alt_ac, start_pos, end_pos=end_pos
                 )
                 if invalid_ac_pos:
@@ -80,21 +85,11 @@ class GenomicDeletionAmbiguous(GenomicValidator):
                 if invalid_gene_pos_msg:
                     errors.append(invalid_gene_pos_msg)
 
-            validation_results.append(
-                ValidationResult(
-                    accession=alt_ac,
-                    classification=classification,
-                    is_valid=not errors,
-                    errors=errors,
-                )
+            return ValidationResult(
+                accession=alt_ac,
+                classification=classification,
+                is_valid=not errors,
+                errors=errors,
             )
 
-        return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is genomic deletion
-        ambiguous
-        """
-        return classification_type == ClassificationType.GENOMIC_DELETION_AMBIGUOUS
+        return await self.validate_accessions(accessions, _validate_accession)
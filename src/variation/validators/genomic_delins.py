@@ -12,6 +12,8 @@ from variation.validators.validator import GenomicValidator
 class GenomicDelIns(GenomicValidator):
     """The Genomic DelIns Validator class."""
 
+    classification_type = ClassificationType.GENOMIC_DELINS
+
     async def get_valid_invalid_results(
         self, classification: GenomicDelInsClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -46,7 +48,7 @@ class GenomicDelIns(GenomicValidator):
 
             if ref:
                 # gnomAD VCF provides reference, so we should validate this
-                invalid_ref_msg = self.validate_reference_sequence(
+                invalid_ref_msg = await self.validate_reference_sequence(
                     alt_ac,
                     classification.pos0,
                     classification.pos1 if classification.pos1 else classification.pos0,
@@ -56,7 +58,7 @@ class GenomicDelIns(GenomicValidator):
                     errors.append(invalid_ref_msg)
             else:
                 # Validate ac and pos
-                invalid_ac_pos = self.validate_ac_and_pos(
+                invalid_ac_pos = await self.validate_ac_and_pos(
                     alt_ac, classification.pos0, end_pos=classification.pos1
                 )
                 if invalid_ac_pos:
@@ -72,9 +74,3 @@ class GenomicDelIns(GenomicValidator):
             )
 
         return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is genomic delins"""
-        return classification_type == ClassificationType.GENOMIC_DELINS
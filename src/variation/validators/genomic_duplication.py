@@ -11,6 +11,8 @@ from variation.validators.validator import GenomicValidator
 class GenomicDuplication(GenomicValidator):
     """The Genomic Duplication Validator class."""
 
+    classification_type = ClassificationType.GENOMIC_DUPLICATION
+
     async def get_valid_invalid_results(
         self, classification: GenomicDuplicationClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -34,9 +36,12 @@ class GenomicDuplication(GenomicValidator):
                 )
             ]
 
-        validation_results = []
+        async def _validate_accession(alt_ac: str) -> ValidationResult:
+            """Validate a single accession
 
-        for alt_ac in accessions:
+            :param alt_ac: Accession to validate
+            :return: Validation result for accession
+            """
             errors = []
 
             if classification.gene_token:
@@ -50,25 +55,17 @@ class GenomicDuplication(GenomicValidator):
                     errors.append(invalid_gene_pos_msg)
 
             if not errors:
-                invalid_ac_pos = self.validate_ac_and_pos(
+                invalid_ac_pos = await self.validate_ac_and_pos(
                     alt_ac, classification.pos0, end_pos=classification.pos1
                 )
                 if invalid_ac_pos:
                     errors.append(invalid_ac_pos)
 
-            validation_results.append(
-                ValidationResult(
-                    accession=alt_ac,
-                    classification=classification,
-                    is_valid=not errors,
-                    errors=errors,
-                )
+            return ValidationResult(
+                accession=alt_ac,
+                classification=classification,
+                is_valid=not errors,
+                errors=errors,
             )
 
-        return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is genomic duplication"""
-        return classification_type == ClassificationType.GENOMIC_DUPLICATION
+        return await self.validate_accessions(accessions, _validate_accession)
@@ -12,6 +12,8 @@ from variation.validators.validator import GenomicValidator
 class GenomicInsertion(GenomicValidator):
     """The Genomic Insertion Validator class."""
 
+    classification_type = ClassificationType.GENOMIC_INSERTION
+
     async def get_valid_invalid_results(
         self, classification: GenomicInsertionClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -46,7 +48,7 @@ class GenomicInsertion(GenomicValidator):
 
             if ref:
                 # gnomAD VCF provides reference, so we should validate this
-                invalid_ref_msg = self.validate_reference_sequence(
+                invalid_ref_msg = await self.validate_reference_sequence(
                     alt_ac,
                     classification.pos0,
                     end_pos=classification.pos1,
@@ -56,7 +58,7 @@ class GenomicInsertion(GenomicValidator):
                     errors.append(invalid_ref_msg)
             else:
                 # Validate ac and pos
-                invalid_ac_pos_msg = self.validate_ac_and_pos(
+                invalid_ac_pos_msg = await self.validate_ac_and_pos(
                     alt_ac, classification.pos0, end_pos=classification.pos1
                 )
                 if invalid_ac_pos_msg:
@@ -72,9 +74,3 @@ class GenomicInsertion(GenomicValidator):
             )
 
         return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is genomic insertion"""
-        return classification_type == ClassificationType.GENOMIC_INSERTION
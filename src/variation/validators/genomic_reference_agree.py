@@ -12,6 +12,8 @@ from variation.validators.validator import GenomicValidator
 class GenomicReferenceAgree(GenomicValidator):
     """The Genomic Reference Agree Validator class."""
 
+    classification_type = ClassificationType.GENOMIC_REFERENCE_AGREE
+
     async def get_valid_invalid_results(
         self, classification: GenomicReferenceAgreeClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -31,13 +33,13 @@ class GenomicReferenceAgree(GenomicValidator):
                 ref = token.ref
                 start_pos = token.pos
                 end_pos = token.pos + (len(ref) - 1)
-                invalid_ref_msg = self.validate_reference_sequence(
+                invalid_ref_msg = await self.validate_reference_sequence(
                     alt_ac, start_pos, end_pos, ref
                 )
                 if invalid_ref_msg:
                     errors.append(invalid_ref_msg)
             else:
-                invalid_ac_pos_msg = self.validate_ac_and_pos(
+                invalid_ac_pos_msg = await self.validate_ac_and_pos(
                     alt_ac, classification.pos
                 )
                 if invalid_ac_pos_msg:
@@ -53,9 +55,3 @@ class GenomicReferenceAgree(GenomicValidator):
             )
 
         return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is genomic reference agree"""
-        return classification_type == ClassificationType.GENOMIC_REFERENCE_AGREE
@@ -12,6 +12,8 @@ from variation.validators.validator import GenomicValidator
 class GenomicSubstitution(GenomicValidator):
     """The Genomic Substitution Validator class."""
 
+    classification_type = ClassificationType.GENOMIC_SUBSTITUTION
+
     async def get_valid_invalid_results(
         self, classification: GenomicSubstitutionClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -32,7 +34,7 @@ class GenomicSubstitution(GenomicValidator):
         for alt_ac in accessions:
             errors = []
 
-            valid_ref_seq_msg = self.validate_reference_sequence(
+            valid_ref_seq_msg = await self.validate_reference_sequence(
                 alt_ac, classification.pos, end_pos, classification.ref
             )
             if valid_ref_seq_msg:
@@ -48,11 +50,3 @@ class GenomicSubstitution(GenomicValidator):
             )
 
         return validation_results
-
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is genomic
-        substitution.
-        """
-        return classification_type == ClassificationType.GENOMIC_SUBSTITUTION
@@ -13,6 +13,8 @@ from variation.validators.validator import Validator
 class ProteinDeletion(Validator):
     """The Protein Deletion Validator class."""
 
+    classification_type = ClassificationType.PROTEIN_DELETION
+
     async def get_valid_invalid_results(
         self, classification: ProteinDeletionClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -57,7 +59,7 @@ class ProteinDeletion(Validator):
             errors = []
 
             # Validate aa0 exists at pos0 on given protein accession
-            invalid_aa0_seq_msg = self.validate_reference_sequence(
+            invalid_aa0_seq_msg = await self.validate_reference_sequence(
                 p_ac, classification.pos0, classification.pos0, classification.aa0
             )
             if invalid_aa0_seq_msg:
@@ -65,7 +67,7 @@ class ProteinDeletion(Validator):
 
             # Validate aa1 exists at pos1
             if classification.aa1 and classification.pos1:
-                invalid_aa1_seq_msg = self.validate_reference_sequence(
+                invalid_aa1_seq_msg = await self.validate_reference_sequence(
                     p_ac, classification.pos1, classification.pos1, classification.aa1
                 )
 
@@ -83,7 +85,7 @@ class ProteinDeletion(Validator):
                 and classification.pos1 is not None
             ):
                 # HGVS deleted sequence includes start and end
-                invalid_del_seq_msg = self.validate_reference_sequence(
+                invalid_del_seq_msg = await self.validate_reference_sequence(
                     p_ac,
                     classification.pos0,
                     classification.pos1,
@@ -104,12 +106,6 @@ class ProteinDeletion(Validator):
 
         return validation_results
 
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is protein deletion."""
-        return classification_type == ClassificationType.PROTEIN_DELETION
-
     async def get_accessions(
         self, classification: Classification, errors: list
     ) -> list[str]:
@@ -13,6 +13,8 @@ from variation.validators.validator import Validator
 class ProteinDelIns(Validator):
     """The Protein DelIns Validator class."""
 
+    classification_type = ClassificationType.PROTEIN_DELINS
+
     async def get_valid_invalid_results(
         self, classification: ProteinDelInsClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -57,7 +59,7 @@ class ProteinDelIns(Validator):
             errors = []
 
             # Validate aa0 exists at pos0 on given
-            invalid_aa0_seq_msg = self.validate_reference_sequence(
+            invalid_aa0_seq_msg = await self.validate_reference_sequence(
                 p_ac, classification.pos0, classification.pos0, classification.aa0
             )
             if invalid_aa0_seq_msg:
@@ -65,7 +67,7 @@ class ProteinDelIns(Validator):
 
             # Validate aa1 exists at pos1
             if classification.aa1 and classification.pos1:
-                invalid_aa1_seq_msg = self.validate_reference_sequence(
+                invalid_aa1_seq_msg = await self.validate_reference_sequence(
                     p_ac, classification.pos1, classification.pos1, classification.aa1
                 )
 
@@ -83,12 +85,6 @@ class ProteinDelIns(Validator):
 
         return validation_results
 
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is protein delins."""
-        return classification_type == ClassificationType.PROTEIN_DELINS
-
     async def get_accessions(
         self, classification: Classification, errors: list
     ) -> list[str]:
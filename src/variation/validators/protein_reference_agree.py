@@ -13,6 +13,8 @@ from variation.validators.validator import Validator
 class ProteinReferenceAgree(Validator):
     """The Protein Reference Agree Validator class."""
 
+    classification_type = ClassificationType.PROTEIN_REFERENCE_AGREE
+
     async def get_valid_invalid_results(
         self, classification: ProteinReferenceAgreeClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -43,7 +45,7 @@ class ProteinReferenceAgree(Validator):
         for p_ac in accessions:
             errors = []
 
-            valid_ref_seq_msg = self.validate_reference_sequence(
+            valid_ref_seq_msg = await self.validate_reference_sequence(
                 p_ac, classification.pos, classification.pos, classification.ref
             )
             if valid_ref_seq_msg:
@@ -60,12 +62,6 @@ class ProteinReferenceAgree(Validator):
 
         return validation_results
 
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is protein reference agree."""
-        return classification_type == ClassificationType.PROTEIN_REFERENCE_AGREE
-
     async def get_accessions(
         self, classification: Classification, errors: list
     ) -> list[str]:
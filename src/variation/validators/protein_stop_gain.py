@@ -13,6 +13,8 @@ from variation.validators.validator import Validator
 class ProteinStopGain(Validator):
     """The Protein Stop Gain Validator class."""
 
+    classification_type = ClassificationType.PROTEIN_STOP_GAIN
+
     async def get_valid_invalid_results(
         self, classification: ProteinStopGainClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -46,7 +48,7 @@ class ProteinStopGain(Validator):
         for p_ac in accessions:
             errors = []
 
-            valid_ref_seq_msg = self.validate_reference_sequence(
+            valid_ref_seq_msg = await self.validate_reference_sequence(
                 p_ac, classification.pos, classification.pos, classification.ref
             )
             if valid_ref_seq_msg:
@@ -63,12 +65,6 @@ class ProteinStopGain(Validator):
 
         return validation_results
 
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is protein stop gain."""
-        return classification_type == ClassificationType.PROTEIN_STOP_GAIN
-
     async def get_accessions(
         self, classification: Classification, errors: list
     ) -> list[str]:
@@ -13,6 +13,8 @@ from variation.validators.validator import Validator
 class ProteinSubstitution(Validator):
     """The Protein Substitution Validator class."""
 
+    classification_type = ClassificationType.PROTEIN_SUBSTITUTION
+
     async def get_valid_invalid_results(
         self, classification: ProteinSubstitutionClassification, accessions: list[str]
     ) -> list[ValidationResult]:
@@ -43,7 +45,7 @@ class ProteinSubstitution(Validator):
         for p_ac in accessions:
             errors = []
 
-            valid_ref_seq_msg = self.validate_reference_sequence(
+            valid_ref_seq_msg = await self.validate_reference_sequence(
                 p_ac, classification.pos, classification.pos, classification.ref
             )
             if valid_ref_seq_msg:
@@ -60,12 +62,6 @@ class ProteinSubstitution(Validator):
 
         return validation_results
 
-    def validates_classification_type(
-        self, classification_type: ClassificationType
-    ) -> bool:
-        """Return whether or not the classification type is protein substitution."""
-        return classification_type == ClassificationType.PROTEIN_SUBSTITUTION
-
     async def get_accessions(
         self, classification: Classification, errors: list
     ) -> list[str]:
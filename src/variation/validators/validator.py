@@ -1,7 +1,9 @@
 """Module for Validation."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from typing import Literal
 
 from cool_seq_tool.handlers import SeqRepoAccess
@@ -11,6 +13,11 @@ from cool_seq_tool.sources import TranscriptMappings, UtaDatabase
 from gene.query import QueryHandler as GeneQueryHandler
 from gene.schemas import SourceName
 
+from variation.async_gene import get_async_gene_normalizer
+from variation.async_seqrepo import get_async_seqrepo_access
+from variation.cache import MISSING, TTLCache
+from variation.chromosome_accessions import ChromosomeAccessions
+from variation.gene_index import GeneIntervalIndex
 from variation.schemas.classification_response_schema import (
     AmbiguousType,
     Classification,
@@ -28,14 +35,25 @@ from variation.schemas.classification_response_schema import (
 from variation.schemas.service_schema import ClinVarAssembly
 from variation.schemas.token_response_schema import GeneToken
 from variation.schemas.validation_response_schema import ValidationResult
+from variation.sequence_length_index import SequenceLengthIndex
 from variation.utils import get_aa1_codes
 
 _logger = logging.getLogger(__name__)
 
+# Default number of accessions that can be validated at the same time for a query
+DEFAULT_ACCESSION_MAX_CONCURRENCY = 1
+
+# Default maximum number of gene accessions and gene bounds cached for free text
+# genomic queries
+DEFAULT_GENE_CACHE_MAXSIZE = 10000
+
 
 class Validator(ABC):
     """The Validator ABC."""
 
+    # Classification type this class validates. Set by each subclass.
+    classification_type: ClassificationType
+
     def __init__(
         self,
         seqrepo_access: SeqRepoAccess,
@@ -43,6 +61,11 @@ class Validator(ABC):
         uta: UtaDatabase,
         gene_normalizer: GeneQueryHandler,
         liftover: LiftOver,
+        max_concurrency: int = DEFAULT_ACCESSION_MAX_CONCURRENCY,
+        sequence_length_index: SequenceLengthIndex | None = None,
+        chromosome_accessions: ChromosomeAccessions | None = None,
+        gene_cache: TTLCache | None = None,
+        gene_index: GeneIntervalIndex | None = None,
     ) -> None:
         """Initialize the Validator ABC.
 
@@ -51,11 +74,35 @@ class Validator(ABC):
         :param uta: Access to UTA queries
         :param gene_normalizer: Access to gene-normalizer
         :param liftover: Instance to provide mapping between human genome assemblies
+        :param max_concurrency: Maximum number of accessions to validate at the same
+            time for a classification
+        :param sequence_length_index: Index of sequence lengths. If provided, will be
+            used to check that positions exist on an accession instead of fetching
+            sequence.
+        :param chromosome_accessions: Table of chromosome to RefSeq genomic accession.
+            If not provided, will be created the first time it is needed.
+        :param gene_cache: Cache for genomic accessions and gene bounds of genes in
+            free text genomic queries. If not provided, these are not cached.
+        :param gene_index: Index of Ensembl gene locations. If provided, will be used
+            to get gene bounds for free text genomic queries instead of searching the
+            gene normalizer.
+        :raises ValueError: If `max_concurrency` is less than 1
         """
+        if max_concurrency < 1:
+            msg = "`max_concurrency` must be greater than 0"
+            raise ValueError(msg)
+
+        self.max_concurrency = max_concurrency
+        self.sequence_length_index = sequence_length_index
+        self.chromosome_accessions = chromosome_accessions
+        self.gene_cache = gene_cache
+        self.gene_index = gene_index
         self.transcript_mappings = transcript_mappings
         self.seqrepo_access = seqrepo_access
+        self.async_seqrepo_access = get_async_seqrepo_access(seqrepo_access)
         self.uta = uta
         self.gene_normalizer = gene_normalizer
+        self.async_gene_normalizer = get_async_gene_normalizer(gene_normalizer)
         self.liftover = liftover
 
     @abstractmethod
@@ -72,7 +119,6 @@ class Validator(ABC):
         :return: List of accessions
         """
 
-    @abstractmethod
     def validates_classification_type(
         self, classification_type: ClassificationType
     ) -> bool:
@@ -82,6 +128,7 @@ class Validator(ABC):
         :return: `True` if classification_type matches validator's
             classification type. `False` otherwise.
         """
+        return classification_type == self.classification_type
 
     @abstractmethod
     async def get_valid_invalid_results(
@@ -94,6 +141,34 @@ class Validator(ABC):
         :return: List of validation results containing invalid and valid results
         """
 
+    async def validate_accessions(
+        self,
+        accessions: list[str],
+        validate_accession: Callable[[str], Awaitable[ValidationResult]],
+    ) -> list[ValidationResult]:
+        """Validate each accession, with at most `max_concurrency` accessions being
+        validated at the same time
+
+        :param accessions: A list of accessions for a classification
+        :param validate_accession: Coroutine function that validates a single accession
+        :return: List of validation results, in the same order as `accessions`
+        """
+        if self.max_concurrency == 1 or len(accessions) <= 1:
+            return [await validate_accession(ac) for ac in accessions]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _validate(ac: str) -> ValidationResult:
+            """Validate a single accession once a slot is available
+
+            :param ac: Accession to validate
+            :return: Validation result for accession
+            """
+            async with semaphore:
+                return await validate_accession(ac)
+
+        return await asyncio.gather(*(_validate(ac) for ac in accessions))
+
     async def validate(
         self,
         classification: Classification,
@@ -148,7 +223,7 @@ class Validator(ABC):
             )
         return accessions
 
-    def validate_reference_sequence(
+    async def validate_reference_sequence(
         self,
         ac: str,
         start_pos: int,
@@ -167,7 +242,7 @@ class Validator(ABC):
         :param coordinate_type: Coordinate type for `start_pos` and `end_pos`
         :return: Invalid message if invalid. If valid, `None`
         """
-        actual_ref, err_msg = self.seqrepo_access.get_reference_sequence(
+        actual_ref, err_msg = await self.async_seqrepo_access.get_reference_sequence(
             ac, start=start_pos, end=end_pos, coordinate_type=coordinate_type
         )
 
@@ -197,7 +272,7 @@ class Validator(ABC):
 
         return cds_start, msg
 
-    def validate_ac_and_pos(
+    async def validate_ac_and_pos(
         self,
         ac: str,
         start_pos: int,
@@ -218,16 +293,22 @@ class Validator(ABC):
 
         msg = None
         ref_len = None
-        try:
-            if end_pos:
-                ref_len = len(self.seqrepo_access.sr[ac][start_pos:end_pos])
-            else:
-                ref_len = len(self.seqrepo_access.sr[ac][start_pos])
-        except KeyError:
-            msg = f"Accession does not exist in SeqRepo: {ac}"
-        except ValueError as e:
-            msg = f"{e} on accession ({ac})"
-        else:
+        if self.sequence_length_index is not None:
+            ref_len = self.sequence_length_index.slice_length(
+                ac, start_pos, end=end_pos or None
+            )
+
+        if ref_len is None:
+            try:
+                ref_len = await self.async_seqrepo_access.slice_length(
+                    ac, start_pos, end=end_pos or None
+                )
+            except KeyError:
+                msg = f"Accession does not exist in SeqRepo: {ac}"
+            except ValueError as e:
+                msg = f"{e} on accession ({ac})"
+
+        if not msg:
             if end_pos:
                 if not ref_len or (end_pos - start_pos != ref_len):
                     msg = f"Positions ({start_pos}, {end_pos}) not valid on accession ({ac})"
@@ -342,24 +423,31 @@ class GenomicValidator(Validator):
         :param input_assembly: Assembly used for initial input query.
         :return: List of genomic RefSeq accessions
         """
-        nc_accessions = await self.uta.get_ac_from_gene(
-            classification.gene_token.matched_value
+        gene = classification.gene_token.matched_value
+        key = ("accessions", gene, input_assembly)
+        nc_accessions = (
+            self.gene_cache.get(key) if self.gene_cache is not None else MISSING
         )
+        if nc_accessions is MISSING:
+            nc_accessions = await self.uta.get_ac_from_gene(gene)
+
+            # If input assembly is provided, get the NC accession for that assembly
+            if input_assembly:
+                updated_nc_accessions = []
+                for alt_ac in nc_accessions:
+                    aliases, _ = await self.async_seqrepo_access.translate_identifier(
+                        alt_ac, input_assembly
+                    )
+                    if aliases:
+                        updated_nc_accessions.append(alt_ac)
+                        break
 
-        # If input assembly is provided, get the NC accession for that assembly
-        if input_assembly:
-            updated_nc_accessions = []
-            for alt_ac in nc_accessions:
-                aliases, _ = self.seqrepo_access.translate_identifier(
-                    alt_ac, input_assembly
-                )
-                if aliases:
-                    updated_nc_accessions.append(alt_ac)
-                    break
+                nc_accessions = updated_nc_accessions
 
-            nc_accessions = updated_nc_accessions
+            if self.gene_cache is not None:
+                self.gene_cache.set(key, nc_accessions)
 
-        return nc_accessions
+        return list(nc_accessions)
 
     def _get_gnomad_vcf_accessions(
         self,
@@ -373,42 +461,61 @@ class GenomicValidator(Validator):
         :param input_assembly: Assembly used for initial input query.
         :return: List of genomic RefSeq accessions
         """
-
-        def _get_nc_accession(identifier: str) -> str | None:
-            """Given an identifier (assembly+chr), return RefSeq genomic accession.
-
-            :param identifier: assembly+chr
-            :return: RefSeq genomic accession, if found
-            """
-            nc_accession = None
-            try:
-                translated_identifiers, _ = self.seqrepo_access.translate_identifier(
-                    identifier
-                )
-            except KeyError:
-                _logger.warning("Data Proxy unable to get metadata for %s", identifier)
-            else:
-                aliases = [
-                    a for a in translated_identifiers if a.startswith("refseq:NC_")
-                ]
-                if aliases:
-                    nc_accession = aliases[0].split(":")[-1]
-            return nc_accession
+        if self.chromosome_accessions is None:
+            self.chromosome_accessions = ChromosomeAccessions(self.seqrepo_access)
 
         gnomad_vcf_token = classification.matching_tokens[0]
-        chromosome = gnomad_vcf_token.chromosome
-        nc_accessions = []
+        return self.chromosome_accessions.get_accessions(
+            gnomad_vcf_token.chromosome, assembly=input_assembly
+        )
 
-        if input_assembly:
-            alt_ac = _get_nc_accession(f"{input_assembly.value}:{chromosome}")
-            if alt_ac:
-                nc_accessions.append(alt_ac)
+    async def _get_gene_bounds(self, gene: str, alt_ac: str) -> tuple[int, int] | str:
+        """Get Ensembl gene bounds for a gene on a genomic accession's assembly
+
+        :param gene: Gene symbol
+        :param alt_ac: Genomic accession
+        :return: Gene start and end positions if found. Else, error message
+        """
+        gene_start_end = {"start": None, "end": None}
+        gene_interval = self.gene_index.get_gene(gene) if self.gene_index else None
+        if gene_interval:
+            gene_start_end["start"] = gene_interval.start
+            gene_start_end["end"] = gene_interval.end - 1
         else:
-            for assembly in [ClinVarAssembly.GRCH38, ClinVarAssembly.GRCH37]:
-                alt_ac = _get_nc_accession(f"{assembly.value}:{chromosome}")
-                if alt_ac:
-                    nc_accessions.append(alt_ac)
-        return nc_accessions
+            resp = await self.async_gene_normalizer.search(
+                gene, incl=SourceName.ENSEMBL.value
+            )
+            if resp.source_matches:
+                ensembl_resp = resp.source_matches[SourceName.ENSEMBL]
+                if all(
+                    (
+                        ensembl_resp,
+                        ensembl_resp.records,
+                        ensembl_resp.records[0].locations,
+                    )
+                ):
+                    ensembl_loc = ensembl_resp.records[0].locations[0]
+                    gene_start_end["start"] = ensembl_loc.start
+                    gene_start_end["end"] = ensembl_loc.end - 1
+
+        if gene_start_end["start"] is None and gene_start_end["end"] is None:
+            return f"gene-normalizer unable to find Ensembl location for gene: {gene}"
+
+        assembly = await self.uta.get_chr_assembly(alt_ac)
+        if assembly:
+            # Not in GRCh38 assembly. Gene normalizer only uses 38, so we
+            # need to liftover to GRCh37 coords
+            chromosome, assembly = assembly
+            for key in gene_start_end:
+                gene_pos = gene_start_end[key]
+                gene_pos_liftover = self.liftover.get_liftover(
+                    chromosome, gene_pos, Assembly.GRCH37
+                )
+                if gene_pos_liftover is None or len(gene_pos_liftover) == 0:
+                    return f"{gene_pos} does not exist on {chromosome}"
+                gene_start_end[key] = gene_pos_liftover[1]
+
+        return gene_start_end["start"], gene_start_end["end"]
 
     async def _validate_gene_pos(
         self,
@@ -432,36 +539,18 @@ class GenomicValidator(Validator):
         :param coordinate_type: Coordinate type for positions
         :return: Invalid error message if invalid. Else, `None`
         """
-        gene_start_end = {"start": None, "end": None}
-        resp = self.gene_normalizer.search(gene, incl=SourceName.ENSEMBL.value)
-        if resp.source_matches:
-            ensembl_resp = resp.source_matches[SourceName.ENSEMBL]
-            if all(
-                (ensembl_resp, ensembl_resp.records, ensembl_resp.records[0].locations)
-            ):
-                ensembl_loc = ensembl_resp.records[0].locations[0]
-                gene_start_end["start"] = ensembl_loc.start
-                gene_start_end["end"] = ensembl_loc.end - 1
-
-        if gene_start_end["start"] is None and gene_start_end["end"] is None:
-            return f"gene-normalizer unable to find Ensembl location for gene: {gene}"
-
-        assembly = await self.uta.get_chr_assembly(alt_ac)
-        if assembly:
-            # Not in GRCh38 assembly. Gene normalizer only uses 38, so we
-            # need to liftover to GRCh37 coords
-            chromosome, assembly = assembly
-            for key in gene_start_end:
-                gene_pos = gene_start_end[key]
-                gene_pos_liftover = self.liftover.get_liftover(
-                    chromosome, gene_pos, Assembly.GRCH37
-                )
-                if gene_pos_liftover is None or len(gene_pos_liftover) == 0:
-                    return f"{gene_pos} does not exist on {chromosome}"
-                gene_start_end[key] = gene_pos_liftover[1]
-
-        gene_start = gene_start_end["start"]
-        gene_end = gene_start_end["end"]
+        key = ("gene_bounds", gene, alt_ac)
+        gene_bounds = (
+            self.gene_cache.get(key) if self.gene_cache is not None else MISSING
+        )
+        if gene_bounds is MISSING:
+            gene_bounds = await self._get_gene_bounds(gene, alt_ac)
+            if self.gene_cache is not None:
+                self.gene_cache.set(key, gene_bounds)
+
+        if isinstance(gene_bounds, str):
+            return gene_bounds
+        gene_start, gene_end = gene_bounds
 
         for pos in [pos0, pos1, pos2, pos3]:
             if pos not in ["?", None]:
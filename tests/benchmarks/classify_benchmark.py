@@ -0,0 +1,93 @@
+"""Micro-benchmark for classifying the tests/fixtures/classifiers.yml corpus.
+
+Compares `Classify.perform` against scanning every classifier with `can_classify`.
+Queries are tokenized once up front, so only classification is timed. Requires the
+same gene normalizer database as the test suite.
+
+Run from the project root with:
+
+    python -m tests.benchmarks.classify_benchmark
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+import yaml
+from gene.database import create_db
+from gene.query import QueryHandler as GeneQueryHandler
+from tests import PROJECT_ROOT
+
+from variation.classifiers import ProteinDelInsClassifier
+from variation.classify import Classify
+from variation.schemas.classification_response_schema import Classification
+from variation.schemas.token_response_schema import Token, TokenType
+from variation.tokenize import Tokenize
+from variation.tokenizers import GeneSymbol
+
+# Classifier scan order before the dispatch table, which listed ProteinDelIns twice
+LINEAR_CLASSIFIERS = [*Classify.classifiers[:8], ProteinDelInsClassifier()]
+LINEAR_CLASSIFIERS += Classify.classifiers[8:]
+
+
+def linear_perform(classify: Classify, tokens: list[Token]) -> Classification | None:
+    """Classify tokens by scanning every classifier
+
+    :param classify: Classify instance
+    :param tokens: List of tokens found
+    :return: Classification for a list of tokens if found
+    """
+    classification = None
+    if len(tokens) == 1:
+        token_type = tokens[0].token_type
+        if token_type == TokenType.HGVS:
+            classification = classify.hgvs_classifier.match(tokens[0])
+        elif token_type == TokenType.GNOMAD_VCF:
+            classification = classify.gnomad_vcf_classifier.match(tokens[0])
+    else:
+        for classifier in LINEAR_CLASSIFIERS:
+            if classifier.can_classify(tokens):
+                classification = classifier.match(tokens)
+                if classification:
+                    break
+    return classification
+
+
+def main() -> None:
+    """Run classification benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=200)
+    args = parser.parse_args()
+
+    with Path(f"{PROJECT_ROOT}/tests/fixtures/classifiers.yml").open() as stream:
+        fixtures = yaml.safe_load(stream)
+
+    queries = [
+        x["query"]
+        for fixture in fixtures.values()
+        for label in ("should_match", "should_not_match")
+        for x in fixture.get(label) or []
+    ]
+    tokenizer = Tokenize(GeneSymbol(GeneQueryHandler(create_db())))
+    all_tokens = [tokenizer.perform(q, []) for q in queries]
+
+    classify = Classify()
+    for query, tokens in zip(queries, all_tokens, strict=True):
+        assert classify.perform(tokens) == linear_perform(classify, tokens), query
+
+    def _run(perform) -> float:
+        return timeit.timeit(
+            lambda: [perform(tokens) for tokens in all_tokens], number=args.number
+        )
+
+    linear_time = _run(lambda tokens: linear_perform(classify, tokens))
+    dispatch_time = _run(classify.perform)
+    per_query = 1e6 / (args.number * len(all_tokens))
+    print(f"{len(queries)} queries x {args.number} rounds")  # noqa: T201
+    print(f"linear scan: {linear_time * per_query:.2f} us/query")  # noqa: T201
+    print(f"dispatch:    {dispatch_time * per_query:.2f} us/query")  # noqa: T201
+    print(f"speedup:     {linear_time / dispatch_time:.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
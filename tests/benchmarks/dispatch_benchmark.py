@@ -0,0 +1,121 @@
+"""Benchmark for validator and translator dispatch by classification type.
+
+Compares constructing `Validate` and `Translate` for every classification type against
+constructing them for a subset, and looking up the validator and translator for a
+classification type against scanning every instance with `validates_classification_type`
+and `can_translate`. Requires the same SeqRepo, UTA and gene normalizer databases as
+the test suite.
+
+Run from the project root with:
+
+    python -m tests.benchmarks.dispatch_benchmark
+"""
+
+import argparse
+import timeit
+
+from cool_seq_tool.app import CoolSeqTool
+from gene.database import create_db
+from gene.query import QueryHandler as GeneQueryHandler
+
+from variation.hgvs_dup_del_mode import HGVSDupDelMode
+from variation.schemas.classification_response_schema import ClassificationType
+from variation.translate import Translate
+from variation.translators.translator import Translator
+from variation.validate import Validate
+from variation.validators.validator import Validator
+from variation.vrs_representation import VRSRepresentation
+
+# Classification types supported by a protein-only deployment
+SUBSET = [
+    ClassificationType.PROTEIN_SUBSTITUTION,
+    ClassificationType.PROTEIN_STOP_GAIN,
+    ClassificationType.PROTEIN_REFERENCE_AGREE,
+]
+
+
+def linear_dispatch(
+    validators: list[Validator],
+    translators: list[Translator],
+    classification_type: ClassificationType,
+) -> tuple[Validator | None, Translator | None]:
+    """Get validator and translator for a classification type by scanning every
+    instance
+
+    :param validators: Validators, in priority order
+    :param translators: Translators, in priority order
+    :param classification_type: Classification type to get validator and translator
+        for
+    :return: Validator and translator for `classification_type`, if found
+    """
+    validator = next(
+        (v for v in validators if v.validates_classification_type(classification_type)),
+        None,
+    )
+    translator = next(
+        (t for t in translators if t.can_translate(classification_type)), None
+    )
+    return validator, translator
+
+
+def main() -> None:
+    """Run dispatch benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    cool_seq_tool = CoolSeqTool()
+    val_params = [
+        cool_seq_tool.seqrepo_access,
+        cool_seq_tool.transcript_mappings,
+        cool_seq_tool.uta_db,
+        GeneQueryHandler(create_db()),
+        cool_seq_tool.liftover,
+    ]
+    trans_params = [
+        cool_seq_tool.seqrepo_access,
+        cool_seq_tool.mane_transcript,
+        cool_seq_tool.uta_db,
+        VRSRepresentation(cool_seq_tool.seqrepo_access),
+        HGVSDupDelMode(cool_seq_tool.seqrepo_access),
+    ]
+
+    def _init(classification_types: list[ClassificationType] | None) -> None:
+        Validate(*val_params, classification_types=classification_types)
+        Translate(*trans_params, classification_types=classification_types)
+
+    init_number = max(args.number // 10, 1)
+    all_init_time = timeit.timeit(lambda: _init(None), number=init_number)
+    subset_init_time = timeit.timeit(lambda: _init(SUBSET), number=init_number)
+
+    validate = Validate(*val_params)
+    translate = Translate(*trans_params)
+    validators = list(validate.validators.values())
+    translators = list(translate.translators.values())
+    classification_types = list(ClassificationType)
+    for classification_type in classification_types:
+        assert linear_dispatch(validators, translators, classification_type) == (
+            validate.validators.get(classification_type),
+            translate.translators.get(classification_type),
+        ), classification_type
+
+    def _run(dispatch) -> float:
+        return timeit.timeit(
+            lambda: [dispatch(t) for t in classification_types], number=args.number
+        )
+
+    linear_time = _run(lambda t: linear_dispatch(validators, translators, t))
+    dispatch_time = _run(
+        lambda t: (validate.validators.get(t), translate.translators.get(t))
+    )
+    per_init = 1e6 / init_number
+    per_query = 1e6 / (args.number * len(classification_types))
+    print(f"init, all types:  {all_init_time * per_init:.2f} us")  # noqa: T201
+    print(f"init, {len(SUBSET)} types:    {subset_init_time * per_init:.2f} us")  # noqa: T201
+    print(f"linear scan: {linear_time * per_query:.3f} us/query")  # noqa: T201
+    print(f"dispatch:    {dispatch_time * per_query:.3f} us/query")  # noqa: T201
+    print(f"speedup:     {linear_time / dispatch_time:.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """Create methods used throughout tests."""
 
+import asyncio
 import contextlib
+import datetime
 import logging
 
 import pytest
@@ -9,9 +11,16 @@ from ga4gh.vrs import models
 from gene.database.dynamodb import DynamoDbDatabase
 from gene.query import QueryHandler as GeneQueryHandler
 
+from variation import __version__
 from variation.classify import Classify
 from variation.query import QueryHandler
-from variation.schemas.normalize_response_schema import NormalizeService
+from variation.query_key import get_query_text_key
+from variation.schemas.normalize_response_schema import (
+    HGVSDupDelModeOption,
+    NormalizeService,
+    ServiceMeta,
+    ServiceResponse,
+)
 from variation.tokenize import Tokenize
 from variation.tokenizers import GeneSymbol
 
@@ -43,6 +52,67 @@ def pytest_configure(config):
         logging.getLogger("asyncio").setLevel(logging.INFO)
 
 
+class FakeService(ServiceResponse):
+    """Service response with an optional variation"""
+
+    variation_query: str
+    variation: dict | None = None
+
+
+class FakeNormalize:
+    """Normalize handler that counts calls. Queries starting with `invalid` have no
+    variation, and the query `error` raises an exception.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the FakeNormalize class"""
+        self.tokenizer = None
+        self.classifier = None
+        self.n_calls = 0
+
+    async def normalize(
+        self, q, hgvs_dup_del_mode=HGVSDupDelModeOption.DEFAULT, baseline_copies=None
+    ):
+        """Normalize a query"""
+        self.n_calls += 1
+        await asyncio.sleep(0.01)
+        if q == "error":
+            msg = "connection lost"
+            raise ConnectionError(msg)
+
+        valid = not q.lower().startswith("invalid")
+        return FakeService(
+            variation_query=q,
+            variation=(
+                {"mode": hgvs_dup_del_mode.value, "copies": baseline_copies}
+                if valid
+                else None
+            ),
+            warnings=[] if valid else [f"Unable to translate {q.strip()}"],
+            service_meta_=ServiceMeta(
+                version=__version__,
+                response_datetime=datetime.datetime(2020, 1, 1, tzinfo=datetime.UTC),
+            ),
+        )
+
+
+@pytest.fixture
+def query_keys(monkeypatch):
+    """Use case-insensitive query text keys as canonical query keys. Queries starting
+    with `?` can not be classified.
+
+    :return: Queries that canonical query keys were computed for
+    """
+    queries = []
+
+    async def _get_query_key(_tokenizer, _classifier, q):
+        queries.append(q)
+        return None if q.startswith("?") else get_query_text_key(q).upper()
+
+    monkeypatch.setattr("variation.query_key.get_query_key", _get_query_key)
+    return queries
+
+
 @pytest.fixture(scope="session")
 def test_tokenizer():
     """Create test fixture for tokenizer"""
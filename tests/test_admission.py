@@ -0,0 +1,110 @@
+"""Module for testing admission control"""
+
+import asyncio
+import json
+
+import pytest
+
+from variation.admission import (
+    AdmissionController,
+    AdmissionControlMiddleware,
+    AdmissionError,
+    create_admission_controllers,
+)
+
+
+async def test_admission_controller():
+    """Test that requests wait in a bounded queue and are rejected when saturated"""
+    controller = AdmissionController(2, max_queue_size=1, queue_timeout=0.05)
+    assert controller.retry_after == 1
+
+    await controller.acquire()
+    await controller.acquire()
+    assert controller.admission_info() == (2, 2, 0, 2, 0, 0)
+
+    # Requests wait for a request to complete
+    waiting = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert controller.admission_info().queued == 1
+
+    # Requests are rejected when the queue is full
+    with pytest.raises(AdmissionError, match="Too many requests") as e:
+        await controller.acquire()
+    assert e.value.retry_after == 1
+
+    controller.release()
+    await waiting
+    assert controller.admission_info() == (2, 2, 0, 3, 1, 0)
+
+    # Requests are rejected when they wait too long
+    with pytest.raises(AdmissionError, match="Timed out"):
+        await controller.acquire()
+    assert controller.admission_info() == (2, 2, 0, 3, 1, 1)
+
+    controller.release()
+    controller.release()
+    await controller.acquire()
+    assert controller.admission_info() == (2, 1, 0, 4, 1, 1)
+
+    with pytest.raises(ValueError, match="`max_concurrency` must be greater than 0"):
+        AdmissionController(0)
+
+
+async def _call(app, path):
+    """Call an ASGI app and return the response status, headers and body"""
+    scope = {"type": "http", "method": "GET", "path": path, "headers": []}
+    messages = []
+
+    async def _receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def _send(message):
+        messages.append(message)
+
+    await app(scope, _receive, _send)
+    headers = dict(messages[0]["headers"])
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return messages[0]["status"], headers, body
+
+
+async def test_admission_control_middleware():
+    """Test that endpoints are limited separately and saturated endpoints get 503"""
+    release = asyncio.Event()
+
+    async def _app(scope, _receive, send):
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": scope["path"].encode()})
+
+    controllers = create_admission_controllers(
+        ["/variation/normalize", "/variation/batch/normalize"],
+        1,
+        max_queue_size=0,
+        queue_timeout=2.5,
+    )
+    app = AdmissionControlMiddleware(_app, controllers)
+
+    in_progress = [
+        asyncio.create_task(_call(app, "/variation/normalize")),
+        asyncio.create_task(_call(app, "/variation/batch/normalize")),
+        asyncio.create_task(_call(app, "/variation/to_vrs")),
+    ]
+    await asyncio.sleep(0)
+
+    status, headers, body = await _call(app, "/variation/normalize")
+    assert status == 503
+    assert headers[b"retry-after"] == b"3"
+    assert "Too many requests" in json.loads(body)["detail"]
+
+    release.set()
+    resps = await asyncio.gather(*in_progress)
+    assert [r[0] for r in resps] == [200, 200, 200]
+    assert controllers["/variation/normalize"].admission_info() == (1, 0, 0, 1, 1, 0)
+    assert controllers["/variation/batch/normalize"].admission_info() == (
+        1,
+        0,
+        0,
+        1,
+        0,
+        0,
+    )
@@ -0,0 +1,125 @@
+"""Module for testing the SeqRepo alias translation cache"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from variation.alias_cache import AliasTranslationCache, enable_alias_cache
+from variation.utils import get_assembly, get_refget_accession
+
+ALIASES = {
+    "NC_000007.14": ["ga4gh:SQ.F-LrLMe1SRpfUZHkQmvkVKFEGaoDeHul", "GRCh38:7"],
+    "NP_004324.2": ["ga4gh:SQ.cQvw4UsHHRRlogxbWCB8W-mKD4AraM9y"],
+}
+
+
+class FakeSeqRepoAccess:
+    """SeqRepo access that counts alias translations"""
+
+    def __init__(self, root_dir: str) -> None:
+        """Initialize the FakeSeqRepoAccess class"""
+        self.n_translations = 0
+        alias_recs = [{"alias": ac} for ac in ALIASES]
+        self.sr = SimpleNamespace(
+            _root_dir=root_dir,
+            aliases=SimpleNamespace(
+                find_aliases=lambda alias: [
+                    rec for rec in alias_recs if rec["alias"].startswith(alias[:-1])
+                ]
+            ),
+        )
+
+    def translate_identifier(self, ac, target_namespaces=None):
+        """Return list of identifiers for accession"""
+        self.n_translations += 1
+        if ac not in ALIASES:
+            return [], f"SeqRepo unable to get translated identifiers for {ac}"
+        return [
+            a
+            for a in ALIASES[ac]
+            if not target_namespaces or a.split(":")[0] in target_namespaces
+        ], None
+
+    def translate_sequence_identifier(self, identifier, namespace=None):
+        """Return identifiers for a sequence identifier"""
+        self.n_translations += 1
+        if identifier not in ALIASES:
+            raise KeyError(identifier)
+        return [
+            a for a in ALIASES[identifier] if not namespace or a.startswith(namespace)
+        ]
+
+
+def test_alias_translation_cache(tmp_path):
+    """Test that alias translations are served from cache"""
+    seqrepo_access = FakeSeqRepoAccess(str(tmp_path))
+    cache = enable_alias_cache(seqrepo_access)
+    assert enable_alias_cache(seqrepo_access) is cache
+
+    for _ in range(2):
+        assert get_assembly(seqrepo_access, "NC_000007.14") == ("GRCh38", None)
+        assert seqrepo_access.translate_identifier("NM_999999.9") == (
+            [],
+            "SeqRepo unable to get translated identifiers for NM_999999.9",
+        )
+        warnings = []
+        assert (
+            get_refget_accession(seqrepo_access, "NP_004324.2", warnings)
+            == "SQ.cQvw4UsHHRRlogxbWCB8W-mKD4AraM9y"
+        )
+        assert get_refget_accession(seqrepo_access, "NP_999999.9", warnings) is None
+        assert warnings == ["'NP_999999.9'"]
+    assert seqrepo_access.n_translations == 5
+    assert cache.cache_info().hits == 5
+    assert cache.memory_usage() > 0
+
+    # Cached lists are not changed by callers
+    aliases, _ = seqrepo_access.translate_identifier("NC_000007.14")
+    aliases.clear()
+    assert (
+        seqrepo_access.translate_identifier("NC_000007.14")[0]
+        == ALIASES["NC_000007.14"]
+    )
+
+    # Caches for the same SeqRepo instance share translations
+    other = FakeSeqRepoAccess(str(tmp_path))
+    enable_alias_cache(other)
+    other.translate_identifier("NM_999999.9")
+    assert other.n_translations == 0
+
+    # Caches for other SeqRepo instances do not
+    other = FakeSeqRepoAccess(str(tmp_path / "other"))
+    enable_alias_cache(other)
+    other.translate_identifier("NM_999999.9")
+    assert other.n_translations == 1
+
+    cache.clear()
+    assert cache.memory_usage() == 0
+
+
+def test_alias_translation_cache_preload(tmp_path):
+    """Test that translations to refget accessions are preloaded"""
+    seqrepo_access = FakeSeqRepoAccess(str(tmp_path))
+    cache = enable_alias_cache(seqrepo_access, preload=True)
+    n_translations = seqrepo_access.n_translations
+    assert n_translations
+
+    # Only genomic accessions are preloaded by default
+    ac = "NC_000007.14"
+    assert seqrepo_access.translate_identifier(ac, "ga4gh")[0] == ALIASES[ac][:1]
+    assert get_refget_accession(seqrepo_access, ac, [])
+    assert seqrepo_access.n_translations == n_translations
+    assert cache.cache_info().misses == n_translations
+
+    cache.preload(prefixes=("NP_",))
+    n_translations = seqrepo_access.n_translations
+    ac = "NP_004324.2"
+    assert seqrepo_access.translate_identifier(ac, "ga4gh")[0] == ALIASES[ac][:1]
+    assert get_refget_accession(seqrepo_access, ac, [])
+    assert seqrepo_access.n_translations == n_translations
+
+
+def test_alias_translation_cache_invalid(tmp_path):
+    """Test that invalid cache parameters raise"""
+    with pytest.raises(ValueError, match="`max_bytes` must be greater than 0"):
+        AliasTranslationCache(FakeSeqRepoAccess(str(tmp_path)), max_bytes=0)
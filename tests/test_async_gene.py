@@ -0,0 +1,143 @@
+"""Module for testing async gene normalizer access"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from ga4gh.core.models import MappableConcept
+from gene.schemas import MatchType
+
+from variation.async_gene import AsyncGeneNormalizer, get_async_gene_normalizer
+from variation.schemas.token_response_schema import TokenType
+from variation.tokenize import Tokenize
+from variation.tokenizers import GeneSymbol
+
+
+class FakeGeneNormalizer:
+    """Gene normalizer that counts queries and records the threads it is used from"""
+
+    def __init__(self, delay: float = 0) -> None:
+        """Initialize the FakeGeneNormalizer class"""
+        self.delay = delay
+        self.queries = []
+        self.threads = set()
+        self.n_running = 0
+        self.max_running = 0
+
+    def _query(self, query):
+        """Record a query"""
+        self.queries.append(query)
+        self.threads.add(threading.current_thread())
+        self.n_running += 1
+        self.max_running = max(self.max_running, self.n_running)
+        time.sleep(self.delay)
+        self.n_running -= 1
+
+    def normalize(self, query):
+        """Normalize a gene query"""
+        self._query(query)
+        if query.upper() != "BRAF":
+            return SimpleNamespace(match_type=MatchType.NO_MATCH, gene=None)
+        return SimpleNamespace(
+            match_type=MatchType.SYMBOL,
+            gene=MappableConcept(conceptType="Gene", name="BRAF"),
+        )
+
+    def search(self, query, incl=""):
+        """Search sources for a gene query"""
+        self._query(query)
+        return SimpleNamespace(query=query, incl=incl)
+
+
+async def test_async_gene_normalizer():
+    """Test that the gene normalizer is queried from worker threads without blocking
+    the loop
+    """
+    gene_normalizers = []
+
+    def _create_gene_normalizer():
+        gene_normalizers.append(FakeGeneNormalizer(delay=0.05))
+        return gene_normalizers[-1]
+
+    async_gn = AsyncGeneNormalizer(
+        FakeGeneNormalizer(),
+        max_workers=2,
+        create_gene_normalizer=_create_gene_normalizer,
+    )
+    assert (await async_gn.normalize("braf")).gene.name == "BRAF"
+    assert (await async_gn.search("BRAF", incl="ensembl")).incl == "ensembl"
+
+    # Slow queries run at the same time, up to `max_workers`, and the loop keeps
+    # running
+    ticks = 0
+
+    async def _tick() -> None:
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    start = time.perf_counter()
+    resps, _ = await asyncio.gather(
+        async_gn.normalize_many(["BRAF", "KRAS", "BRAF", "TP53", "EGFR"]), _tick()
+    )
+    assert time.perf_counter() - start < 0.18
+    assert ticks == 5
+    assert list(resps) == ["BRAF", "KRAS", "TP53", "EGFR"]
+    assert resps["BRAF"].gene.name == "BRAF"
+    assert resps["KRAS"].gene is None
+
+    # Each thread creates its own gene normalizer once, and only uses it from that
+    # thread
+    assert len(gene_normalizers) <= 2
+    assert all(len(gn.threads) == 1 for gn in gene_normalizers)
+    assert sum(len(gn.queries) for gn in gene_normalizers) == 6
+    async_gn.close()
+
+    with pytest.raises(ValueError, match="`max_workers` must be greater than 0"):
+        AsyncGeneNormalizer(FakeGeneNormalizer(), max_workers=0)
+
+
+async def test_async_gene_normalizer_shared():
+    """Test that queries using a shared gene normalizer run one at a time"""
+    gene_normalizer = FakeGeneNormalizer(delay=0.01)
+    async_gn = AsyncGeneNormalizer(gene_normalizer, max_workers=4)
+    await async_gn.normalize_many(["BRAF", "KRAS", "TP53", "EGFR"])
+    assert len(gene_normalizer.queries) == 4
+    assert gene_normalizer.max_running == 1
+    async_gn.close()
+
+
+def test_get_async_gene_normalizer():
+    """Test that async gene normalizer access is shared for a gene normalizer"""
+    gene_normalizer = FakeGeneNormalizer()
+    async_gn = get_async_gene_normalizer(gene_normalizer, max_workers=3)
+    assert async_gn.max_workers == 3
+    assert get_async_gene_normalizer(gene_normalizer) is async_gn
+    assert get_async_gene_normalizer(gene_normalizer, max_workers=3) is async_gn
+    with pytest.raises(ValueError, match="already uses 3 workers, not 4"):
+        get_async_gene_normalizer(gene_normalizer, max_workers=4)
+    assert get_async_gene_normalizer(FakeGeneNormalizer()) is not async_gn
+
+
+async def test_prefetch_genes():
+    """Test that gene symbols are looked up before tokenizing"""
+    gene_normalizer = FakeGeneNormalizer()
+    tokenizer = Tokenize(GeneSymbol(gene_normalizer))
+
+    await tokenizer.prefetch_genes("braf V600E NP_004324.2:p.V600E BRAF")
+    assert sorted(gene_normalizer.queries) == ["V600E", "braf"]
+
+    # Cached terms are not looked up again, and tokenizing does not query the gene
+    # normalizer
+    await tokenizer.prefetch_genes("BRAF V600E")
+    warnings = []
+    tokens = tokenizer.perform("BRAF V600E", warnings)
+    assert not warnings
+    assert [t.token_type for t in tokens] == [
+        TokenType.GENE,
+        TokenType.PROTEIN_SUBSTITUTION,
+    ]
+    assert len(gene_normalizer.queries) == 2
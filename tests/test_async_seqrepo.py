@@ -0,0 +1,123 @@
+"""Module for testing async SeqRepo access"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from variation.async_seqrepo import AsyncSeqRepoAccess, get_async_seqrepo_access
+
+SEQUENCE = "MAALSGGGGGGAEPGQALFNGDMEPEAGAGAGAAASSAADPAIPEEVWNIKQMIKLTQEHIEALLDKFGG"
+
+
+class FakeSeqRepoAccess:
+    """SeqRepo access that records the thread it is used from"""
+
+    def __init__(self) -> None:
+        """Initialize the FakeSeqRepoAccess class"""
+        self.thread = None
+        self.sr = {"NP_004324.2": SEQUENCE}
+
+    def _check_thread(self) -> None:
+        """Check that instance is only used from one thread"""
+        if self.thread is None:
+            self.thread = threading.current_thread()
+        assert self.thread is threading.current_thread()
+
+    def get_reference_sequence(self, ac, start=None, end=None, **_kwargs):
+        """Get reference sequence for an accession"""
+        self._check_thread()
+        time.sleep(0.05)
+        if ac not in self.sr:
+            return "", f"Accession, {ac}, not found in SeqRepo"
+        return self.sr[ac][start - 1 : end], None
+
+    def translate_identifier(self, ac, target_namespaces=None):
+        """Return list of identifiers for accession"""
+        self._check_thread()
+        return [f"{target_namespaces}:{ac}"], None
+
+    def translate_sequence_identifier(self, identifier, namespace=None):
+        """Translate a sequence identifier"""
+        self._check_thread()
+        if identifier not in self.sr:
+            raise KeyError(identifier)
+        return [f"{namespace}:{identifier}"]
+
+
+class FakeAsyncSeqRepoAccess(AsyncSeqRepoAccess):
+    """Async SeqRepo access that creates fake SeqRepo access for each thread"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the FakeAsyncSeqRepoAccess class"""
+        super().__init__(*args, **kwargs)
+        self.thread_seqrepo_accesses = []
+
+    def _create_seqrepo_access(self):
+        """Create fake SeqRepo access for the current thread"""
+        seqrepo_access = FakeSeqRepoAccess()
+        self.thread_seqrepo_accesses.append(seqrepo_access)
+        return seqrepo_access
+
+
+async def test_async_seqrepo_access():
+    """Test that SeqRepo is accessed from worker threads without blocking the loop"""
+    async_sr = FakeAsyncSeqRepoAccess(FakeSeqRepoAccess(), max_workers=2)
+
+    assert await async_sr.get_reference_sequence("NP_004324.2", 1, 4) == (
+        "MAAL",
+        None,
+    )
+    assert await async_sr.get_reference_sequence("NP_999999.9", 1, 1) == (
+        "",
+        "Accession, NP_999999.9, not found in SeqRepo",
+    )
+    assert await async_sr.translate_identifier("NP_004324.2", "ga4gh") == (
+        ["ga4gh:NP_004324.2"],
+        None,
+    )
+    assert await async_sr.translate_sequence_identifier("NP_004324.2", "ga4gh") == [
+        "ga4gh:NP_004324.2"
+    ]
+    with pytest.raises(KeyError):
+        await async_sr.translate_sequence_identifier("NP_999999.9")
+    assert await async_sr.slice_length("NP_004324.2", 10) == 1
+    assert await async_sr.slice_length("NP_004324.2", 10, 20) == 10
+    with pytest.raises(KeyError):
+        await async_sr.slice_length("NP_999999.9", 10, 20)
+
+    # Slow calls run at the same time, up to `max_workers`, and the loop keeps running
+    ticks = 0
+
+    async def _tick() -> None:
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(async_sr.get_reference_sequence("NP_004324.2", 1, 10) for _ in range(4)),
+        _tick(),
+    )
+    assert time.perf_counter() - start < 0.18
+    assert ticks == 5
+    assert len(async_sr.thread_seqrepo_accesses) <= 2
+
+    async_sr.close()
+
+    with pytest.raises(ValueError, match="`max_workers` must be greater than 0"):
+        AsyncSeqRepoAccess(FakeSeqRepoAccess(), max_workers=0)
+
+
+def test_get_async_seqrepo_access():
+    """Test that async SeqRepo access is shared for a SeqRepo access instance"""
+    seqrepo_access = FakeSeqRepoAccess()
+    async_sr = get_async_seqrepo_access(seqrepo_access, max_workers=3)
+    assert async_sr.max_workers == 3
+    assert get_async_seqrepo_access(seqrepo_access) is async_sr
+    assert get_async_seqrepo_access(seqrepo_access, max_workers=3) is async_sr
+    with pytest.raises(ValueError, match="already uses 3 workers, not 4"):
+        get_async_seqrepo_access(seqrepo_access, max_workers=4)
+    assert get_async_seqrepo_access(FakeSeqRepoAccess()) is not async_sr
@@ -0,0 +1,83 @@
+"""Module for testing in-memory caches"""
+
+import pytest
+
+from variation.cache import MISSING, CacheInfo, TTLCache
+
+
+class FakeTimer:
+    """Timer that only advances when told to"""
+
+    def __init__(self) -> None:
+        """Initialize the FakeTimer class"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time"""
+        return self.now
+
+
+def test_ttl_cache_lru():
+    """Test that least recently used entries are evicted first"""
+    cache = TTLCache(2)
+    cache.set("a", 1)
+    cache.set("b", None)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.cache_info() == CacheInfo(hits=5, misses=1, maxsize=2, currsize=2)
+
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_ttl_cache_expiry():
+    """Test that entries expire after the time to live"""
+    timer = FakeTimer()
+    cache = TTLCache(10, ttl=5, timer=timer)
+    cache.set("a", 1)
+
+    timer.now = 4.9
+    assert cache.peek("a") == 1
+    assert cache.get("a") == 1
+
+    timer.now = 5
+    assert cache.peek("a") is MISSING
+    assert cache.get("a", default=None) is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_invalid():
+    """Test that invalid cache parameters raise"""
+    with pytest.raises(ValueError, match="`maxsize` must be greater than 0"):
+        TTLCache(0)
+
+    with pytest.raises(ValueError, match="`ttl` must be greater than 0"):
+        TTLCache(1, ttl=0)
+
+
+def test_ttl_cache_getsizeof():
+    """Test that entries are evicted by total size when `getsizeof` is provided"""
+    cache = TTLCache(10, getsizeof=len)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb")
+    assert cache.cache_info().currsize == 8
+
+    cache.set("a", "aa")
+    assert cache.cache_info().currsize == 6
+
+    cache.set("c", "cccccc")
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == "aa"
+    assert cache.get("c") == "cccccc"
+    assert cache.cache_info().currsize == 8
+
+    # Values larger than the cache are not cached
+    cache.set("d", "d" * 11)
+    assert cache.get("d") is MISSING
+    assert cache.cache_info().currsize == 8
@@ -0,0 +1,29 @@
+"""Module for testing the chromosome to RefSeq genomic accession table"""
+
+from variation.chromosome_accessions import ChromosomeAccessions
+from variation.schemas.service_schema import ClinVarAssembly
+
+
+def test_chromosome_accessions(test_cool_seq_tool):
+    """Test that chromosome accessions are looked up from the table"""
+    chromosome_accessions = ChromosomeAccessions(test_cool_seq_tool.seqrepo_access)
+    assert len(chromosome_accessions) == 48
+
+    assert (
+        chromosome_accessions.get_accession("7", ClinVarAssembly.GRCH38)
+        == "NC_000007.14"
+    )
+    assert (
+        chromosome_accessions.get_accession("X", ClinVarAssembly.GRCH37)
+        == "NC_000023.10"
+    )
+    assert chromosome_accessions.get_accession("Z", ClinVarAssembly.GRCH38) is None
+
+    assert chromosome_accessions.get_accessions("7") == [
+        "NC_000007.14",
+        "NC_000007.13",
+    ]
+    assert chromosome_accessions.get_accessions(
+        "Y", assembly=ClinVarAssembly.GRCH38
+    ) == ["NC_000024.10"]
+    assert chromosome_accessions.get_accessions("Z") == []
@@ -0,0 +1,84 @@
+"""Module for testing request coalescing"""
+
+import asyncio
+
+import pytest
+
+from tests.conftest import FakeNormalize, FakeService
+from variation.coalesce import RequestCoalescer
+from variation.result_cache import ResultCache
+from variation.schemas.normalize_response_schema import HGVSDupDelModeOption
+
+
+@pytest.mark.usefixtures("query_keys")
+async def test_request_coalescer():
+    """Test that identical concurrent requests share a single computation"""
+    handler = FakeNormalize()
+    coalescer = RequestCoalescer()
+    coalescer.coalesce_method(handler, "normalize", "variation_query")
+
+    queries = ["BRAF V600E", "braf v600e", " BRAF  V600E"]
+    resps = await asyncio.gather(*(handler.normalize(q) for q in queries))
+    assert [r.variation_query for r in resps] == queries
+    assert all(r.variation == {"mode": "default", "copies": None} for r in resps)
+    assert handler.n_calls == 1
+    assert coalescer.coalescing_info() == (3, 2, 0)
+
+    # Options are part of the key
+    resps = await asyncio.gather(
+        handler.normalize("BRAF V600E", baseline_copies=2),
+        handler.normalize("BRAF V600E", HGVSDupDelModeOption.DEFAULT, 2),
+        handler.normalize("BRAF V600E", baseline_copies=3),
+    )
+    assert [r.variation["copies"] for r in resps] == [2, 2, 3]
+    assert handler.n_calls == 3
+
+    # Requests that are not in progress at the same time are not coalesced
+    await handler.normalize("BRAF V600E")
+    assert handler.n_calls == 4
+
+    # Responses without a variation are only shared with the same query text
+    resps = await asyncio.gather(
+        handler.normalize("invalid"),
+        handler.normalize(" invalid "),
+        handler.normalize("INVALID"),
+    )
+    assert [r.warnings for r in resps] == [
+        ["Unable to translate invalid"],
+        ["Unable to translate invalid"],
+        ["Unable to translate INVALID"],
+    ]
+    assert handler.n_calls == 6
+
+    # Queries that can not be classified are not coalesced
+    await asyncio.gather(handler.normalize("?"), handler.normalize("?"))
+    assert handler.n_calls == 8
+
+    # Errors are raised for every identical request
+    resps = await asyncio.gather(
+        handler.normalize("error"), handler.normalize("error"), return_exceptions=True
+    )
+    assert all(isinstance(r, ConnectionError) for r in resps)
+    assert handler.n_calls == 9
+    assert coalescer.coalescing_info() == (12, 5, 0)
+
+
+async def test_request_coalescer_result_cache(tmp_path, query_keys):
+    """Test that the query key is computed once when coalescing cached calls"""
+    handler = FakeNormalize()
+    ResultCache(tmp_path / "results.db", "v1").cache_method(
+        handler, "normalize", FakeService, "variation_query"
+    )
+    RequestCoalescer().coalesce_method(handler, "normalize", "variation_query")
+
+    resps = await asyncio.gather(
+        handler.normalize("BRAF V600E"), handler.normalize("braf v600e")
+    )
+    assert [r.variation_query for r in resps] == ["BRAF V600E", "braf v600e"]
+    assert handler.n_calls == 1
+    assert query_keys == ["BRAF V600E", "braf v600e"]
+
+    resp = await handler.normalize(" BRAF  V600E")
+    assert resp.variation_query == " BRAF  V600E"
+    assert handler.n_calls == 1
+    assert len(query_keys) == 3
@@ -0,0 +1,60 @@
+"""Module for testing the gene interval index"""
+
+import random
+
+from variation.gene_index import GeneInterval, GeneIntervalIndex
+
+CHR7 = "SQ.F-LrLMe1SRpfUZHkQmvkVKFEGaoDeHul"
+CHR3 = "SQ.Zu7h9AggXxhTaGVsy7h_EZSChSZGcmgX"
+
+
+def test_gene_interval_index():
+    """Test that genes are looked up by symbol and position"""
+    egfr = GeneInterval("EGFR", CHR7, 55019016, 55211628)
+    egfr_as1 = GeneInterval("EGFR-AS1", CHR7, 55179749, 55188934)
+    braf = GeneInterval("BRAF", CHR7, 140719326, 140924929)
+    vhl = GeneInterval("VHL", CHR3, 10141777, 10153667)
+    index = GeneIntervalIndex(
+        [
+            braf,
+            egfr,
+            egfr_as1,
+            vhl,
+            GeneInterval("DUP", CHR3, 1, 10),
+            GeneInterval("DUP", CHR3, 20, 30),
+        ]
+    )
+    assert len(index) == 6
+
+    assert index.get_gene("egfr") == egfr
+    assert index.get_gene("VHL") == vhl
+    assert index.get_gene("DUP") is None
+    assert index.get_gene("unknown") is None
+
+    assert index.get_genes(CHR7, 55191821) == [egfr]
+    assert index.get_genes(CHR7, 55180000) == [egfr, egfr_as1]
+    assert index.get_genes(CHR7, 55019016) == [egfr]
+    assert index.get_genes(CHR7, 55211628) == []
+    assert index.get_genes(CHR7, 140753335) == [braf]
+    assert index.get_genes(CHR3, 10141777) == [vhl]
+    assert index.get_genes("SQ.unknown", 10141777) == []
+
+
+def test_gene_interval_index_brute_force():
+    """Test that genes containing a position match a linear scan"""
+    rng = random.Random(0)  # noqa: S311
+    intervals = []
+    for i in range(500):
+        start = rng.randrange(0, 100000)
+        intervals.append(
+            GeneInterval(f"G{i}", CHR7, start, start + rng.randrange(1, 5000))
+        )
+    index = GeneIntervalIndex(intervals)
+
+    for _ in range(500):
+        pos = rng.randrange(0, 110000)
+        expected = sorted(
+            (i for i in intervals if i.start <= pos < i.end),
+            key=lambda i: (i.start, i.end),
+        )
+        assert index.get_genes(CHR7, pos) == expected, pos
@@ -0,0 +1,89 @@
+"""Module for testing the gene symbol tokenizer"""
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from ga4gh.core.models import Extension, MappableConcept
+from gene.schemas import MatchType
+
+from variation.tokenizers import GeneSymbol
+
+BRAF = MappableConcept(
+    conceptType="Gene",
+    name="BRAF",
+    extensions=[
+        Extension(name="aliases", value=["BRAF1"]),
+        Extension(name="previous_symbols", value=["B-RAF"]),
+    ],
+)
+
+
+class FakeGeneNormalizer:
+    """Gene normalizer that counts queries"""
+
+    def __init__(self) -> None:
+        """Initialize the FakeGeneNormalizer class"""
+        self.queries = []
+
+    def normalize(self, query):
+        """Normalize a gene query"""
+        self.queries.append(query)
+        if query.upper() not in {"BRAF", "BRAF1", "B-RAF"}:
+            return SimpleNamespace(match_type=MatchType.NO_MATCH, gene=None)
+        return SimpleNamespace(match_type=MatchType.SYMBOL, gene=BRAF)
+
+
+def test_gene_symbol_cache():
+    """Test that gene normalizer results are cached"""
+    gene_normalizer = FakeGeneNormalizer()
+    tokenizer = GeneSymbol(gene_normalizer)
+
+    gene_token = tokenizer.match("BRAF")
+    assert (gene_token.token, gene_token.matched_value) == ("BRAF", "BRAF")
+    assert gene_token.gene == BRAF
+    assert tokenizer.match("braf ").input_string == "braf "
+    assert gene_normalizer.queries == ["BRAF"]
+
+    # No match is cached too
+    assert tokenizer.match("V600E") is None
+    assert tokenizer.match("v600e") is None
+    assert gene_normalizer.queries == ["BRAF", "V600E"]
+    assert tokenizer.cache_info() == (2, 2, 10_000, 2)
+
+    assert tokenizer.could_match("BRAF")
+    assert not tokenizer.could_match("V600E")
+    assert not tokenizer.could_match("1799T>A")
+    assert tokenizer.could_match("hgnc:1097")
+    assert tokenizer.cache_info() == (2, 2, 10_000, 2)
+
+
+def test_gene_symbol_preload(tmp_path):
+    """Test that preloaded genes, aliases and previous symbols are index hits"""
+    gene_list_path = tmp_path / "genes.txt"
+    gene_list_path.write_text("# Genes\n\nBRAF\nUNKNOWN\n")
+    gene_normalizer = FakeGeneNormalizer()
+    tokenizer = GeneSymbol(gene_normalizer, gene_list_path=gene_list_path)
+    assert gene_normalizer.queries == ["BRAF", "BRAF1", "B-RAF", "UNKNOWN"]
+
+    assert tokenizer.match("braf1").gene == BRAF
+    assert tokenizer.match("B-RAF").gene == BRAF
+    assert tokenizer.match("Unknown") is None
+    assert not tokenizer.could_match("unknown")
+    assert len(gene_normalizer.queries) == 4
+    assert tokenizer.cache_info() == (3, 0, 10_000, 0)
+
+    # Terms that are not preloaded use the cache
+    assert tokenizer.match("KRAS") is None
+    assert tokenizer.cache_info() == (3, 1, 10_000, 1)
+
+
+def test_gene_symbol_index_hits_threads(tmp_path):
+    """Test that index hits are counted correctly from multiple threads"""
+    gene_list_path = tmp_path / "genes.txt"
+    gene_list_path.write_text("BRAF\n")
+    tokenizer = GeneSymbol(FakeGeneNormalizer(), gene_list_path=gene_list_path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(tokenizer.match, ["BRAF"] * 1000))
+    assert all(token.gene == BRAF for token in tokens)
+    assert tokenizer.cache_info().hits == 1000
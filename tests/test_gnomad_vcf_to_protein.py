@@ -1,9 +1,12 @@
 """Module for testing gnomad_vcf_to_protein works correctly"""
 
+import gzip
+
 import pytest
 from ga4gh.vrs import models
 
 from tests.conftest import assertion_checks
+from variation.gnomad_vcf_to_protein_variation import get_gnomad_vcf_queries
 from variation.schemas.service_schema import ClinVarAssembly
 
 
@@ -580,3 +583,76 @@ async def test_liftover_failure(monkeypatch, test_handler):
     assert resp.warnings == [
         "Unable to liftover 1-27755669-A-C to GRCh38 representation"
     ]
+
+
+def test_get_gnomad_vcf_queries():
+    """Test that VCF records are split into one query per ALT allele"""
+    assert get_gnomad_vcf_queries("##fileformat=VCFv4.2\n") == []
+    assert get_gnomad_vcf_queries("#CHROM\tPOS\tID\tREF\tALT\n") == []
+    assert get_gnomad_vcf_queries("7\t140753336\trs1\tA\tT,G,*\t.\t.\t.\n") == [
+        "7-140753336-A-T",
+        "7-140753336-A-G",
+    ]
+    assert get_gnomad_vcf_queries("7\t140753336\t.\tA\t.\n") == []
+
+
+@pytest.mark.asyncio
+async def test_gnomad_vcf_file_to_protein(tmp_path, test_handler):
+    """Test that bulk mode matches single query results, in file order"""
+    vcf_path = tmp_path / "test.vcf.gz"
+    with gzip.open(vcf_path, "wt") as f:
+        f.write("##fileformat=VCFv4.2\n")
+        f.write("#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n")
+        f.write("7\t140753335\t.\tC\tA\t.\t.\t.\n")
+        f.write("7\t140753336\t.\tA\tT,G\t.\t.\t.\n")
+        f.write("7\t140753337\t.\tC\tA\t.\t.\t.\n")
+        f.write("20\t2\t.\tTC\tTG\t.\t.\t.\n")
+
+    expected_queries = [
+        "7-140753335-C-A",
+        "7-140753336-A-T",
+        "7-140753336-A-G",
+        "7-140753337-C-A",
+        "20-2-TC-TG",
+    ]
+    resps = [
+        resp
+        async for resp in test_handler.gnomad_vcf_file_to_protein(
+            vcf_path, chunk_size=3
+        )
+    ]
+    assert [resp.variation_query for resp in resps] == expected_queries
+
+    for resp in resps:
+        expected = await test_handler.gnomad_vcf_to_protein(resp.variation_query)
+        assert resp.variation == expected.variation
+        assert resp.gene_context == expected.gene_context
+        assert resp.warnings == expected.warnings
+
+
+@pytest.mark.asyncio
+async def test_gnomad_vcf_records_isolated(monkeypatch, test_handler):
+    """Test that an unhandled exception for a record does not affect the others"""
+    get_mane_c_p = test_handler._get_mane_c_p
+
+    async def mock_get_mane_c_p(change):
+        if change.start == 140753336:
+            msg = "Unexpected error"
+            raise RuntimeError(msg)
+        return await get_mane_c_p(change)
+
+    monkeypatch.setattr(test_handler, "_get_mane_c_p", mock_get_mane_c_p)
+
+    vcf_queries = ["7-140753335-C-A", "7-140753336-A-T", "7-140753337-C-A"]
+    resps = [
+        resp async for resp in test_handler.gnomad_vcf_records_to_protein(vcf_queries)
+    ]
+    assert [resp.variation_query for resp in resps] == vcf_queries
+    assert resps[1].variation is None
+    assert resps[1].warnings == ["Unhandled exception. See logs for more details."]
+
+    monkeypatch.undo()
+    for resp in (resps[0], resps[2]):
+        expected = await test_handler.gnomad_vcf_to_protein(resp.variation_query)
+        assert resp.variation == expected.variation
+        assert resp.warnings == expected.warnings
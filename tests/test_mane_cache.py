@@ -0,0 +1,123 @@
+"""Module for testing the MANE transcript cache"""
+
+import asyncio
+
+from cool_seq_tool.schemas import AnnotationLayer, CoordinateType
+
+from variation.mane_cache import enable_mane_cache
+
+
+class FakeManeTranscript:
+    """MANE transcript mapper that counts calls"""
+
+    def __init__(self) -> None:
+        """Initialize the FakeManeTranscript class"""
+        self.n_calls = 0
+
+    async def get_mane_transcript(
+        self,
+        ac,
+        start_pos,
+        end_pos,
+        start_annotation_layer,  # noqa: ARG002
+        gene=None,  # noqa: ARG002
+        ref=None,  # noqa: ARG002
+        try_longest_compatible=False,  # noqa: ARG002
+        coordinate_type=CoordinateType.RESIDUE,  # noqa: ARG002
+    ):
+        """Get MANE transcript representation"""
+        self.n_calls += 1
+        await asyncio.sleep(0.01)
+        if ac == "NP_999999.9":
+            return None
+        return {"refseq": "NP_004324.2", "pos": [start_pos - 1, end_pos]}
+
+    async def g_to_grch38(
+        self,
+        ac,  # noqa: ARG002
+        start_pos,
+        end_pos,
+        get_mane_genes=False,  # noqa: ARG002
+    ):
+        """Get GRCh38 representation"""
+        self.n_calls += 1
+        return {"ac": "NC_000007.14", "pos": [start_pos, end_pos]}
+
+    async def grch38_to_mane_c_p(
+        self,
+        alt_ac,  # noqa: ARG002
+        start_pos,  # noqa: ARG002
+        end_pos,  # noqa: ARG002
+        gene=None,  # noqa: ARG002
+    ):
+        """Get MANE cDNA and protein representation"""
+        self.n_calls += 1
+
+
+async def test_mane_transcript_cache():
+    """Test that MANE transcript results are cached by every argument"""
+    mane_transcript = FakeManeTranscript()
+    cache = enable_mane_cache(mane_transcript)
+    assert enable_mane_cache(mane_transcript) is cache
+
+    resp = await asyncio.gather(
+        mane_transcript.get_mane_transcript(
+            "NP_004324.2",
+            600,
+            600,
+            AnnotationLayer.PROTEIN,
+            try_longest_compatible=True,
+        ),
+        mane_transcript.get_mane_transcript(
+            ac="NP_004324.2",
+            start_pos=600,
+            end_pos=600,
+            start_annotation_layer=AnnotationLayer.PROTEIN,
+            try_longest_compatible=True,
+            coordinate_type=CoordinateType.RESIDUE,
+        ),
+    )
+    assert resp[0] == resp[1] == {"refseq": "NP_004324.2", "pos": [599, 600]}
+    assert mane_transcript.n_calls == 1
+
+    # Cached results can not be changed by callers
+    resp[0]["pos"].clear()
+    assert (
+        await mane_transcript.get_mane_transcript(
+            "NP_004324.2",
+            600,
+            600,
+            AnnotationLayer.PROTEIN,
+            try_longest_compatible=True,
+        )
+    )["pos"] == [599, 600]
+    assert mane_transcript.n_calls == 1
+
+    # Any different argument is a different result
+    await mane_transcript.get_mane_transcript(
+        "NP_004324.2", 600, 600, AnnotationLayer.PROTEIN
+    )
+    await mane_transcript.get_mane_transcript(
+        "NP_004324.2", 600, 600, AnnotationLayer.PROTEIN, ref="V"
+    )
+    assert mane_transcript.n_calls == 3
+
+    for _ in range(2):
+        assert (
+            await mane_transcript.get_mane_transcript(
+                "NP_999999.9", 600, 600, AnnotationLayer.PROTEIN
+            )
+            is None
+        )
+        assert await mane_transcript.g_to_grch38(
+            "NC_000007.13", 140453136, 140453136, get_mane_genes=True
+        ) == {"ac": "NC_000007.14", "pos": [140453136, 140453136]}
+    assert mane_transcript.n_calls == 5
+    assert cache.cache_info().hits == 3
+
+    # Changing the version invalidates cached results
+    cache.set_version("new")
+    await mane_transcript.g_to_grch38(
+        "NC_000007.13", 140453136, 140453136, get_mane_genes=True
+    )
+    assert mane_transcript.n_calls == 6
@@ -8,6 +8,9 @@ from ga4gh.vrs import models
 from tests.conftest import assertion_checks, cnv_assertion_checks
 from variation.main import normalize as normalize_get_response
 from variation.main import to_vrs as to_vrs_get_response
+from variation.normalize import Normalize
+from variation.schemas.app_schemas import Endpoint
+from variation.schemas.batch_schema import NormalizeQuery
 from variation.schemas.normalize_response_schema import HGVSDupDelModeOption
 from variation.schemas.service_schema import ClinVarAssembly
 
@@ -1055,6 +1058,123 @@ async def test_no_matches(test_handler):
         assert resp.variation is None
 
 
+@pytest.mark.asyncio
+async def test_normalize_many(test_handler, braf_v600e):
+    """Test that batch normalization returns results in input order"""
+    queries = [
+        NormalizeQuery(q="BRAF V600E"),
+        NormalizeQuery(q="braf v600e"),
+        NormalizeQuery(q=" BRAF V600E "),
+        NormalizeQuery(q="BRAF V600E", hgvs_dup_del_mode=HGVSDupDelModeOption.ALLELE),
+    ]
+    resps = await test_handler.normalize_many(queries, max_concurrency=2)
+    assert [r.variation_query for r in resps] == [q.q for q in queries]
+
+    assertion_checks(resps[0], braf_v600e)
+    assert resps[1].variation is None
+    assertion_checks(resps[2], braf_v600e)
+    assertion_checks(resps[3], braf_v600e)
+
+    assert await test_handler.normalize_many([]) == []
+
+    with pytest.raises(ValueError, match="`max_concurrency` must be greater than 0"):
+        await test_handler.normalize_many(queries, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_mane_first(test_handler):
+    """Test that MANE first mode normalizes to the same variation and warnings"""
+    mane_first_handler = Normalize(
+        test_handler.seqrepo_access,
+        test_handler.tokenizer,
+        test_handler.classifier,
+        test_handler.validator,
+        test_handler.translator,
+        test_handler.uta,
+        mane_transcript_mappings=test_handler.mane_transcript_mappings,
+        mane_first=True,
+    )
+    for q in [
+        "BRAF V600E",
+        "EGFR L858R",
+        "BRAF c.1799T>A",
+        "ERBB2 c.2263_2277delTTGAGGGAAAACACA",
+        "BRAF V9999E",
+        "NP_004324.2:p.Val600Glu",
+    ]:
+        expected = await test_handler.normalize(q)
+        resp = await mane_first_handler.normalize(q)
+        assert resp.variation == expected.variation, q
+        assert resp.warnings == expected.warnings, q
+
+    with pytest.raises(ValueError, match="`mane_transcript_mappings` is required"):
+        Normalize(
+            test_handler.seqrepo_access,
+            test_handler.tokenizer,
+            test_handler.classifier,
+            test_handler.validator,
+            test_handler.translator,
+            test_handler.uta,
+            mane_first=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_translations(test_query_handler):
+    """Test that concurrent translation returns the same translations, in the same
+    order, as translating one at a time, whatever order they are started in
+    """
+    handler = test_query_handler.normalize_handler
+    for q in ["BRAF V600E", "BRAF c.1799T>A", "NC_000007.13:g.140453136A>T"]:
+        tokens = handler.tokenizer.perform(q, [])
+        classification = handler.classifier.perform(tokens)
+        validation_summary = await handler.validator.perform(classification)
+        reverse_order = list(reversed(range(len(validation_summary.valid_results))))
+        resps = [
+            await handler.get_translations(
+                validation_summary.valid_results,
+                [],
+                endpoint_name=Endpoint.NORMALIZE,
+                do_liftover=True,
+                max_concurrency=max_concurrency,
+                translation_order=translation_order,
+            )
+            for max_concurrency, translation_order in (
+                (1, None),
+                (10, None),
+                (1, reverse_order),
+            )
+        ]
+        assert resps[0][0], q
+        assert resps[0] == resps[1], q
+        assert resps[0] == resps[2], q
+
+    with pytest.raises(ValueError, match="`max_concurrency` must be greater than 0"):
+        await handler.get_translations([], [], max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_to_vrs_stream(test_query_handler):
+    """Test that streaming to_vrs returns results in input order"""
+    queries = ["BRAF V600E", "this-wont-normalize", "NC_000007.13:g.140453136A>T"]
+
+    async def _queries():
+        for q in queries:
+            yield q
+
+    resps = [
+        resp
+        async for resp in test_query_handler.to_vrs_handler.to_vrs_stream(
+            _queries(), max_concurrency=2
+        )
+    ]
+    assert [r.search_term for r in resps] == queries
+    assert resps[0].variations
+    assert resps[1].variations == []
+    assert resps[1].warnings
+    assert resps[2].variations
+
+
 @pytest.mark.asyncio
 async def test_service_meta():
     """Test that service meta info populates correctly."""
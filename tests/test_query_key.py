@@ -0,0 +1,39 @@
+"""Module for testing canonical query keys"""
+
+from variation.query_key import get_query_key, get_query_text_key
+
+
+def test_get_query_text_key():
+    """Test that query text keys ignore whitespace and URL encoding"""
+    assert get_query_text_key(" BRAF   V600E\t") == "BRAF V600E"
+    assert get_query_text_key("BRAF%20V600E") == "BRAF V600E"
+    assert get_query_text_key("NC_000007.13%3Ag.140453136A%3ET") == (
+        "NC_000007.13:g.140453136A>T"
+    )
+
+
+async def test_get_query_key(test_tokenizer, test_classifier):
+    """Test that queries that are translated the same way have the same key"""
+
+    async def _get_key(q):
+        return await get_query_key(test_tokenizer, test_classifier, q)
+
+    braf_v600e = await _get_key("BRAF V600E")
+    assert braf_v600e
+    assert await _get_key(" braf  V600E ") == braf_v600e
+    assert await _get_key("BRAF Val600Glu") == braf_v600e
+    assert await _get_key("BRAF%20V600E") == braf_v600e
+    assert await _get_key("BRAF V600K") != braf_v600e
+
+    np_v600e = await _get_key("NP_004324.2:p.Val600Glu")
+    assert np_v600e
+    assert await _get_key("NP_004324.2:p.V600E") == np_v600e
+    assert np_v600e != braf_v600e
+
+    gnomad_vcf = await _get_key("7-140753336-A-T")
+    assert gnomad_vcf
+    assert await _get_key("chr7-140753336-a-t") == gnomad_vcf
+    assert await _get_key("7-140753336-A-G") != gnomad_vcf
+
+    assert await _get_key("BRAF") is None
+    assert await _get_key("not a variant") is None
@@ -0,0 +1,60 @@
+"""Module for testing the persistent result cache"""
+
+import pytest
+
+from tests.conftest import FakeNormalize, FakeService
+from variation.result_cache import ResultCache
+from variation.schemas.normalize_response_schema import HGVSDupDelModeOption
+
+
+@pytest.mark.usefixtures("query_keys")
+async def test_result_cache(tmp_path):
+    """Test that responses are cached on disk for the same version"""
+    path = tmp_path / "results.db"
+    cache = ResultCache(path, "v1")
+    handler = FakeNormalize()
+    cache.cache_method(handler, "normalize", FakeService, "variation_query")
+
+    resp = await handler.normalize("BRAF V600E")
+    assert resp.variation == {"mode": "default", "copies": None}
+    cached = await handler.normalize("BRAF V600E", HGVSDupDelModeOption.DEFAULT)
+    assert cached.variation == resp.variation
+    assert cached.service_meta_.response_datetime.year != 2020
+    assert handler.n_calls == 1
+
+    # Queries with the same canonical key share responses
+    cached = await handler.normalize(" BRAF  V600E")
+    assert cached.variation == resp.variation
+    assert cached.variation_query == " BRAF  V600E"
+    assert handler.n_calls == 1
+
+    # Queries that can not be classified are not cached
+    await handler.normalize("?")
+    await handler.normalize("?")
+    assert handler.n_calls == 3
+
+    # Options are part of the key
+    await handler.normalize("BRAF V600E", hgvs_dup_del_mode=HGVSDupDelModeOption.ALLELE)
+    assert handler.n_calls == 4
+
+    # Responses without a variation are not cached
+    await handler.normalize("invalid")
+    await handler.normalize("invalid")
+    assert handler.n_calls == 6
+    assert cache.cache_info().currsize == 2
+
+    # Responses are shared with other caches using the same file and version
+    other_handler = FakeNormalize()
+    ResultCache(path, "v1").cache_method(
+        other_handler, "normalize", FakeService, "variation_query"
+    )
+    await other_handler.normalize("BRAF V600E")
+    assert other_handler.n_calls == 0
+
+    # Responses for other versions are removed
+    new_cache = ResultCache(path, "v2")
+    assert len(new_cache) == 0
+    assert len(cache) == 0
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 0, 0)
@@ -0,0 +1,148 @@
+"""Module for testing priority lanes"""
+
+import asyncio
+
+import pytest
+
+from variation.scheduler import (
+    FairLimiter,
+    Lane,
+    LaneScheduler,
+    enable_fair_uta_access,
+    get_lane,
+    use_lane,
+)
+
+
+async def test_use_lane():
+    """Test that the lane is set for the current context and the tasks it creates"""
+
+    async def _get_lane():
+        return get_lane()
+
+    assert get_lane() == Lane.INTERACTIVE
+    with use_lane(Lane.BULK):
+        assert get_lane() == Lane.BULK
+        assert await asyncio.create_task(_get_lane()) == Lane.BULK
+    assert get_lane() == Lane.INTERACTIVE
+    assert await asyncio.create_task(_get_lane()) == Lane.INTERACTIVE
+
+
+async def test_fair_limiter():
+    """Test that waiting work is admitted from each lane in turn"""
+    limiter = FairLimiter(1)
+    order = []
+
+    async def _work(lane, name):
+        with use_lane(lane):
+            async with limiter.slot():
+                order.append(name)
+                await asyncio.sleep(0)
+
+    await limiter.acquire()
+    tasks = [
+        *(asyncio.create_task(_work(Lane.BULK, f"bulk{i}")) for i in range(3)),
+        *(asyncio.create_task(_work(Lane.INTERACTIVE, f"int{i}")) for i in range(2)),
+    ]
+    await asyncio.sleep(0)
+    assert limiter.waiting() == {Lane.INTERACTIVE: 2, Lane.BULK: 3}
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+    assert order == ["int0", "bulk0", "int1", "bulk1", "bulk2"]
+
+    # Cancelled work gives up its place
+    await limiter.acquire()
+    task = asyncio.create_task(_work(Lane.BULK, "cancelled"))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0)
+    assert limiter.waiting() == {Lane.INTERACTIVE: 0, Lane.BULK: 0}
+    limiter.release()
+    await asyncio.wait_for(limiter.acquire(), 1)
+
+    with pytest.raises(ValueError, match="`capacity` must be greater than 0"):
+        FairLimiter(0)
+
+
+class FakeHandler:
+    """Handler that records the lane of each call"""
+
+    def __init__(self) -> None:
+        """Initialize the FakeHandler class"""
+        self.release = asyncio.Event()
+        self.lanes = []
+
+    async def normalize(self, q):
+        """Normalize a query"""
+        self.lanes.append(get_lane())
+        await self.release.wait()
+        return q
+
+    async def to_vrs(self, q):
+        """Translate a query, using a nested scheduled call"""
+        return await self.normalize(q)
+
+
+async def test_lane_scheduler():
+    """Test that each lane has its own concurrency budget"""
+    scheduler = LaneScheduler(interactive_max_concurrency=2, bulk_max_concurrency=1)
+    handler = FakeHandler()
+    scheduler.schedule_method(handler, "normalize")
+    scheduler.schedule_method(handler, "to_vrs")
+
+    async def _call(lane, q):
+        with use_lane(lane):
+            return await handler.to_vrs(q)
+
+    tasks = [asyncio.create_task(_call(Lane.BULK, f"bulk{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(_call(Lane.INTERACTIVE, "int0")))
+    await asyncio.sleep(0)
+
+    # Bulk work does not use the interactive budget, and nested calls do not take
+    # another slot
+    assert scheduler.lane_info() == {
+        Lane.INTERACTIVE: (2, 1, 0),
+        Lane.BULK: (1, 1, 2),
+    }
+    assert handler.lanes == [Lane.BULK, Lane.INTERACTIVE]
+
+    handler.release.set()
+    assert await asyncio.gather(*tasks) == ["bulk0", "bulk1", "bulk2", "int0"]
+    assert scheduler.lane_info() == {
+        Lane.INTERACTIVE: (2, 0, 0),
+        Lane.BULK: (1, 0, 0),
+    }
+
+    with pytest.raises(ValueError, match="`max_concurrency` must be greater than 0"):
+        LaneScheduler(bulk_max_concurrency=0)
+
+
+class FakeUtaDatabase:
+    """UTA database that counts queries in progress"""
+
+    def __init__(self) -> None:
+        """Initialize the FakeUtaDatabase class"""
+        self.n_running = 0
+        self.max_running = 0
+
+    async def execute_query(self, query):
+        """Execute a query"""
+        self.n_running += 1
+        self.max_running = max(self.max_running, self.n_running)
+        await asyncio.sleep(0.01)
+        self.n_running -= 1
+        return [query]
+
+
+async def test_enable_fair_uta_access():
+    """Test that UTA queries are limited"""
+    uta_db = FakeUtaDatabase()
+    limiter = enable_fair_uta_access(uta_db, max_concurrency=2)
+    assert enable_fair_uta_access(uta_db) is limiter
+    assert limiter.capacity == 2
+
+    resps = await asyncio.gather(*(uta_db.execute_query(i) for i in range(5)))
+    assert resps == [[i] for i in range(5)]
+    assert uta_db.max_running == 2
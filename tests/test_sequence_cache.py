@@ -0,0 +1,129 @@
+"""Module for testing the reference sequence cache"""
+
+import pytest
+from cool_seq_tool.schemas import CoordinateType
+
+from variation.sequence_cache import SequenceBlockCache, enable_sequence_cache
+
+SEQUENCE = "MAALSGGGGGGAEPGQALFNGDMEPEAGAGAGAAASSAADPAIPEEVWNIKQMIKLTQEHIEALLDKFGG"
+
+
+class FakeSequences:
+    """SeqRepo sequence storage that counts fetches"""
+
+    def __init__(self) -> None:
+        """Initialize the FakeSequences class"""
+        self.n_fetches = 0
+        self.schema_version = 1
+
+    def fetch(self, seq_id: str, start: int | None = None, end: int | None = None):
+        """Fetch sequence for a SeqRepo sequence ID"""
+        self.n_fetches += 1
+        if seq_id != "seq":
+            raise KeyError(seq_id)
+        if start is not None and start > len(SEQUENCE):
+            msg = "start out of range"
+            raise ValueError(msg)
+        return SEQUENCE[start:end]
+
+
+def test_sequence_block_cache():
+    """Test that slices are served from cached blocks"""
+    sequences = FakeSequences()
+    cache = SequenceBlockCache(sequences, block_size=16, max_bytes=1000)
+
+    assert cache.fetch("seq", 10, 20) == SEQUENCE[10:20]
+    assert sequences.n_fetches == 2
+    assert cache.fetch("seq", 12, 30) == SEQUENCE[12:30]
+    assert cache.fetch("seq", 0, 5) == SEQUENCE[0:5]
+    assert cache.fetch("seq", 15, 16) == SEQUENCE[15:16]
+    assert sequences.n_fetches == 2
+    assert cache.cache_info().hits == 4
+
+    # Last block is shorter than the block size
+    assert cache.fetch("seq", 60, len(SEQUENCE)) == SEQUENCE[60:]
+
+    # Unbounded and out of range requests behave the same as without the cache
+    assert cache.fetch("seq") == SEQUENCE
+    assert cache.fetch("seq", 60, 100) == SEQUENCE[60:100]
+    assert cache.fetch("seq", 20, 10) == ""
+    with pytest.raises(ValueError, match="start out of range"):
+        cache.fetch("seq", 100, 110)
+    with pytest.raises(KeyError):
+        cache.fetch("unknown", 0, 10)
+
+    # Other attributes are delegated
+    assert cache.schema_version == 1
+
+    cache.clear()
+    assert cache.cache_info().currsize == 0
+
+
+def test_sequence_block_cache_eviction():
+    """Test that least recently used blocks are evicted once full"""
+    sequences = FakeSequences()
+    cache = SequenceBlockCache(sequences, block_size=16, max_bytes=32)
+
+    cache.fetch("seq", 0, 10)
+    cache.fetch("seq", 16, 20)
+    cache.fetch("seq", 32, 40)
+    assert cache.cache_info().currsize == 32
+    assert sequences.n_fetches == 3
+
+    cache.fetch("seq", 0, 10)
+    assert sequences.n_fetches == 4
+
+
+def test_sequence_block_cache_invalid():
+    """Test that invalid cache parameters raise"""
+    with pytest.raises(ValueError, match="`block_size` must be greater than 0"):
+        SequenceBlockCache(FakeSequences(), block_size=0)
+
+    with pytest.raises(ValueError, match="`max_bytes` must be greater than 0"):
+        SequenceBlockCache(FakeSequences(), max_bytes=0)
+
+
+def test_enable_sequence_cache(test_cool_seq_tool):
+    """Test that SeqRepo access returns the same reference sequence with the cache"""
+    seqrepo_access = test_cool_seq_tool.seqrepo_access
+    queries = [
+        ("NP_004324.2", 600, 600),
+        ("NP_004324.2", 598, 602),
+        ("NC_000007.14", 140753336, 140753336),
+        ("NC_000007.14", 140753330, 140753340),
+        ("NP_004324.2", 766, 767),
+        ("NP_004324.2", 767, 800),
+        ("NM_999999.9", 1, 2),
+    ]
+    expected = [
+        seqrepo_access.get_reference_sequence(
+            ac, start=start, end=end, coordinate_type=CoordinateType.RESIDUE
+        )
+        for ac, start, end in queries
+    ]
+
+    cache = enable_sequence_cache(seqrepo_access)
+    assert enable_sequence_cache(seqrepo_access) is cache
+    for (ac, start, end), resp in zip(queries, expected, strict=True):
+        assert (
+            seqrepo_access.get_reference_sequence(
+                ac, start=start, end=end, coordinate_type=CoordinateType.RESIDUE
+            )
+            == resp
+        ), ac
+    assert cache.cache_info().currsize
+
+
+def test_sequence_block_cache_for_sequences():
+    """Test that caches for other storage share cached blocks"""
+    sequences = FakeSequences()
+    cache = SequenceBlockCache(sequences, block_size=16, max_bytes=1000)
+    assert cache.fetch("seq", 10, 20) == SEQUENCE[10:20]
+
+    other_sequences = FakeSequences()
+    other_cache = cache.for_sequences(other_sequences)
+    assert other_cache.fetch("seq", 12, 30) == SEQUENCE[12:30]
+    assert other_sequences.n_fetches == 0
+    assert other_cache.fetch("seq", 40, 50) == SEQUENCE[40:50]
+    assert other_sequences.n_fetches == 2
+    assert cache.cache_info() == other_cache.cache_info()
@@ -0,0 +1,108 @@
+"""Module for testing the sequence length index"""
+
+import pytest
+
+from variation.sequence_length_index import SequenceLengthIndex
+from variation.validators import GenomicDeletion
+
+
+@pytest.fixture(scope="module")
+def test_index(test_cool_seq_tool):
+    """Create test fixture for sequence length index"""
+    return SequenceLengthIndex(test_cool_seq_tool.seqrepo_access)
+
+
+def test_slice_length(test_index, test_cool_seq_tool):
+    """Test that slice lengths match the length of sequence fetched from SeqRepo"""
+    sr = test_cool_seq_tool.seqrepo_access.sr
+    length = test_index.get_length("NP_004324.2")
+    assert length == len(sr["NP_004324.2"][:])
+
+    for start, end in [
+        (0, 1),
+        (599, 600),
+        (length - 1, length),
+        (length - 1, length + 5),
+        (length, length + 1),
+        (length + 10, length + 20),
+        (5, 5),
+    ]:
+        assert test_index.slice_length("NP_004324.2", start, end) == len(
+            sr["NP_004324.2"][start:end]
+        ), (start, end)
+
+    for start in [0, length - 1, length, length + 10]:
+        assert test_index.slice_length("NP_004324.2", start) == len(
+            sr["NP_004324.2"][start]
+        ), start
+
+    # SeqRepo raises for these, so the index defers to SeqRepo
+    assert test_index.slice_length("NP_004324.2", -1) is None
+    assert test_index.slice_length("NP_004324.2", 10, 5) is None
+    assert test_index.get_length("NM_999999.9") is None
+    assert test_index.slice_length("NM_999999.9", 0, 1) is None
+
+
+def test_save_load(test_index, test_cool_seq_tool, tmp_path):
+    """Test that a saved index is only loaded for the same SeqRepo instance"""
+    seqrepo_access = test_cool_seq_tool.seqrepo_access
+    path = tmp_path / "lengths.json"
+    test_index.get_length("NC_000007.14")
+
+    index = SequenceLengthIndex(seqrepo_access, path=path)
+    assert not index.load()
+    with pytest.raises(ValueError, match="`path` is required"):
+        SequenceLengthIndex(seqrepo_access).save()
+
+    test_index.path = path
+    test_index.save()
+    assert index.load()
+    assert len(index) == len(test_index)
+    assert index.get_length("NC_000007.14") == test_index.get_length("NC_000007.14")
+
+    path.write_text(path.read_text().replace(index.seqrepo_root_dir, "/other"))
+    assert not SequenceLengthIndex(seqrepo_access, path=path).load()
+
+
+async def test_validate_ac_and_pos(test_index, val_params):
+    """Test that the index gives the same validation messages as SeqRepo"""
+    validator = GenomicDeletion(*val_params)
+    indexed_validator = GenomicDeletion(*val_params, sequence_length_index=test_index)
+    for ac, start, end in [
+        ("NC_000007.14", 140753336, None),
+        ("NC_000007.14", 140753336, 140753340),
+        ("NC_000007.14", 159345973, None),
+        ("NC_000007.14", 159345973, 159345980),
+        ("NC_000007.14", 159345980, 159345990),
+        ("NC_000007.14", 0, None),
+        ("NC_000007.14", 10, 5),
+        ("NC_999999.9", 10, 20),
+    ]:
+        assert await indexed_validator.validate_ac_and_pos(
+            ac, start, end_pos=end
+        ) == await validator.validate_ac_and_pos(ac, start, end_pos=end), (
+            ac,
+            start,
+            end,
+        )
+
+
+async def test_validate_ac_and_pos_lazy_index(
+    test_cool_seq_tool, val_params, monkeypatch
+):
+    """Test that an empty index is used and filled, without fetching sequence"""
+    index = SequenceLengthIndex(test_cool_seq_tool.seqrepo_access)
+    assert len(index) == 0
+    validator = GenomicDeletion(*val_params, sequence_length_index=index)
+
+    async def _slice_length(*_args, **_kwargs):
+        msg = "Sequence should not be fetched"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(validator.async_seqrepo_access, "slice_length", _slice_length)
+    assert await validator.validate_ac_and_pos("NC_000007.14", 140753336) is None
+    assert (
+        await validator.validate_ac_and_pos("NC_000007.14", 140753336, 140753340)
+        is None
+    )
+    assert len(index) == 1
@@ -28,6 +28,7 @@ from variation.schemas.token_response_schema import (
     ProteinReferenceAgreeToken,
     ProteinStopGainToken,
     ProteinSubstitutionToken,
+    TokenType,
 )
 from variation.tokenizers import (
     CdnaDeletion,
@@ -243,3 +244,37 @@ def test_genomic_duplication_ambiguous(all_fixtures):
     tokenizer_instance = GenomicDuplication
     expected_token = GenomicDuplicationAmbiguousToken
     tokenizer_checks(all_fixtures, fixture_name, tokenizer_instance, expected_token)
+
+
+def test_tokenize_planner(test_tokenizer):
+    """Test that trying regex tokenizers before the gene normalizer does not change
+    the tokens found
+    """
+    with Path(f"{PROJECT_ROOT}/tests/fixtures/classifiers.yml").open() as stream:
+        classifier_fixtures = yaml.safe_load(stream)
+
+    queries = {
+        x["query"]
+        for fixtures in classifier_fixtures.values()
+        for label in ("should_match", "should_not_match")
+        for x in fixtures.get(label) or []
+    }
+    # Gene symbols that also match variant patterns
+    queries.update(["IL6R V600E", "C1S", "FAM83A L858R"])
+
+    for query in queries:
+        expected = []
+        for term in query.split():
+            for tokenizer in test_tokenizer.tokenizers:
+                token = tokenizer.match(term)
+                if token:
+                    expected.append(token)
+                    break
+            else:
+                expected.append(None)
+
+        tokens = [
+            None if t.token_type == TokenType.UNKNOWN else t
+            for t in test_tokenizer.perform(query, [])
+        ]
+        assert tokens == expected, query
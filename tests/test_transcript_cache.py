@@ -0,0 +1,87 @@
+"""Module for testing the UTA transcript metadata cache"""
+
+import asyncio
+
+import pytest
+
+from variation.transcript_cache import TranscriptMetadataCache, enable_transcript_cache
+
+CDS_START_END = {"NM_004333.6": (226, 2527), "NM_000551.4": (70, 712)}
+
+
+class FakeUtaDatabase:
+    """UTA database that counts lookups"""
+
+    def __init__(self) -> None:
+        """Initialize the FakeUtaDatabase class"""
+        self.n_lookups = 0
+        self.max_in_progress = 0
+        self._in_progress = 0
+
+    async def get_cds_start_end(self, tx_ac):
+        """Get coding start and end site for a transcript"""
+        self.n_lookups += 1
+        self._in_progress += 1
+        self.max_in_progress = max(self.max_in_progress, self._in_progress)
+        await asyncio.sleep(0.01)
+        self._in_progress -= 1
+        if tx_ac == "error":
+            msg = "connection lost"
+            raise ConnectionError(msg)
+        return CDS_START_END.get(tx_ac)
+
+    async def get_chr_assembly(self, ac):
+        """Get chromosome and assembly for a genomic accession"""
+        self.n_lookups += 1
+        return ("chr7", "GRCh37") if ac == "NC_000007.13" else None
+
+
+async def test_transcript_metadata_cache():
+    """Test that UTA lookups are cached and concurrent lookups are shared"""
+    uta_db = FakeUtaDatabase()
+    cache = enable_transcript_cache(uta_db)
+    assert enable_transcript_cache(uta_db) is cache
+
+    resp = await asyncio.gather(
+        *(uta_db.get_cds_start_end("NM_004333.6") for _ in range(5))
+    )
+    assert resp == [CDS_START_END["NM_004333.6"]] * 5
+    assert uta_db.n_lookups == 1
+
+    assert await uta_db.get_cds_start_end("NM_004333.6") == (226, 2527)
+    assert await uta_db.get_cds_start_end("NM_999999.9") is None
+    assert await uta_db.get_cds_start_end("NM_999999.9") is None
+    assert await uta_db.get_chr_assembly("NC_000007.13") == ("chr7", "GRCh37")
+    assert await uta_db.get_chr_assembly("NC_000007.13") == ("chr7", "GRCh37")
+    assert await uta_db.get_chr_assembly("NC_000007.14") is None
+    assert uta_db.n_lookups == 4
+
+    # Errors are raised for every caller and are not cached
+    resp = await asyncio.gather(
+        *(uta_db.get_cds_start_end("error") for _ in range(2)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, ConnectionError) for r in resp)
+    with pytest.raises(ConnectionError):
+        await uta_db.get_cds_start_end("error")
+    assert uta_db.n_lookups == 6
+
+    cache.clear()
+    assert cache.cache_info().currsize == 0
+
+
+async def test_transcript_metadata_cache_preload():
+    """Test that transcripts are preloaded with bounded concurrency"""
+    uta_db = FakeUtaDatabase()
+    cache = TranscriptMetadataCache(uta_db)
+    tx_acs = [f"NM_{i:06}.1" for i in range(10)] + list(CDS_START_END)
+    await cache.preload(tx_acs, max_concurrency=3)
+    assert uta_db.n_lookups == len(tx_acs)
+    assert uta_db.max_in_progress == 3
+
+    for tx_ac, cds_start_end in CDS_START_END.items():
+        assert await cache.get_cds_start_end(tx_ac) == cds_start_end
+    assert uta_db.n_lookups == len(tx_acs)
+
+    with pytest.raises(ValueError, match="`max_concurrency` must be greater than 0"):
+        await cache.preload(tx_acs, max_concurrency=0)
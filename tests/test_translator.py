@@ -7,7 +7,10 @@ import yaml
 
 from tests import PROJECT_ROOT
 from tests.conftest import _vrs_id_and_digest_existence_checks
+from variation import validators
 from variation.hgvs_dup_del_mode import HGVSDupDelMode
+from variation.schemas.classification_response_schema import ClassificationType
+from variation.translate import TRANSLATORS, Translate
 from variation.translators import (
     Amplification,
     CdnaDeletion,
@@ -30,7 +33,7 @@ from variation.translators import (
     ProteinStopGain,
     ProteinSubstitution,
 )
-from variation.validate import Validate
+from variation.validate import VALIDATORS, Validate
 from variation.vrs_representation import VRSRepresentation
 
 
@@ -456,3 +459,56 @@ async def test_amplification(
         fixture_name,
         translator_instance,
     )
+
+
+async def test_classification_types(
+    val_params, trans_params, test_tokenizer, test_classifier, test_validator
+):
+    """Test that only validators and translators for the requested classification
+    types are created, and that other classification types are not supported
+    """
+    for t in ClassificationType:
+        assert VALIDATORS[t].classification_type == t
+        assert TRANSLATORS[t].classification_type == t
+
+    classification_types = [ClassificationType.PROTEIN_SUBSTITUTION, "cdna_deletion"]
+    validate = Validate(*val_params, classification_types=classification_types)
+    translate = Translate(*trans_params, classification_types=classification_types)
+    assert {t: type(v) for t, v in validate.validators.items()} == {
+        ClassificationType.PROTEIN_SUBSTITUTION: validators.ProteinSubstitution,
+        ClassificationType.CDNA_DELETION: validators.CdnaDeletion,
+    }
+    assert {t: type(v) for t, v in translate.translators.items()} == {
+        ClassificationType.PROTEIN_SUBSTITUTION: ProteinSubstitution,
+        ClassificationType.CDNA_DELETION: CdnaDeletion,
+    }
+    assert validate.validators[
+        ClassificationType.PROTEIN_SUBSTITUTION
+    ].validates_classification_type(ClassificationType.PROTEIN_SUBSTITUTION)
+    assert not translate.translators[ClassificationType.CDNA_DELETION].can_translate(
+        ClassificationType.PROTEIN_SUBSTITUTION
+    )
+
+    # Supported classification types give the same results
+    tokens = test_tokenizer.perform("BRAF V600E", [])
+    classification = test_classifier.perform(tokens)
+    summary = await validate.perform(classification)
+    assert summary == await test_validator.perform(classification)
+    warnings = []
+    assert await translate.perform(summary.valid_results[0], warnings)
+
+    # Other classification types are not validated or translated
+    tokens = test_tokenizer.perform("VHL g.10188279_10188297del", [])
+    classification = test_classifier.perform(tokens)
+    summary = await validate.perform(classification)
+    assert summary.valid_results == []
+    assert summary.invalid_results == []
+    assert summary.warnings == ["Unsupported classification type: genomic_deletion"]
+
+    summary = await test_validator.perform(classification)
+    assert await translate.perform(summary.valid_results[0], []) is None
+
+    with pytest.raises(ValueError, match="'unknown' is not a valid ClassificationType"):
+        Validate(*val_params, classification_types=["unknown"])
+    with pytest.raises(ValueError, match="'unknown' is not a valid ClassificationType"):
+        Translate(*trans_params, classification_types=["unknown"])
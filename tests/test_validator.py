@@ -6,6 +6,8 @@ import pytest
 import yaml
 
 from tests import PROJECT_ROOT
+from variation.cache import TTLCache
+from variation.schemas.service_schema import ClinVarAssembly
 from variation.validators import (
     Amplification,
     CdnaDeletion,
@@ -414,3 +416,52 @@ async def test_amplification(all_fixtures, test_tokenizer, test_classifier, val_
         fixture_name,
         validator_instance,
     )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_accessions(test_tokenizer, test_classifier, val_params):
+    """Test that validating accessions concurrently gives the same results, in the
+    same order, as validating them one at a time
+    """
+    for validator_instance, query in [
+        (CdnaSubstitution, "BRAF c.1799T>A"),
+        (CdnaSubstitution, "BRAF c.18000000000000T>A"),
+        (CdnaDeletion, "ERBB2 c.2263_2277delTTGAGGGAAAACACA"),
+        (GenomicDeletion, "VHL g.10188279_10188297del"),
+    ]:
+        tokens = test_tokenizer.perform(query, [])
+        classification = test_classifier.perform(tokens)
+        sequential = await validator_instance(*val_params).validate(classification)
+        concurrent = await validator_instance(*val_params, max_concurrency=4).validate(
+            classification
+        )
+        assert concurrent == sequential, query
+
+    with pytest.raises(ValueError, match="`max_concurrency` must be greater than 0"):
+        CdnaSubstitution(*val_params, max_concurrency=0)
+
+
+async def test_gene_cache(test_tokenizer, test_classifier, val_params):
+    """Test that free text genomic queries give the same results when gene accessions
+    and gene bounds are cached
+    """
+    gene_cache = TTLCache(100)
+    for validator_instance, query, input_assembly in [
+        (GenomicSubstitution, "EGFR g.55191822T>G", None),
+        (GenomicSubstitution, "EGFR g.55191822T>G", ClinVarAssembly.GRCH38),
+        (GenomicDeletion, "VHL g.10188279_10188297del", None),
+        (GenomicDeletion, "VHL g.10188279_10188297del", ClinVarAssembly.GRCH37),
+    ]:
+        tokens = test_tokenizer.perform(query, [])
+        classification = test_classifier.perform(tokens)
+        expected = await validator_instance(*val_params).validate(
+            classification, input_assembly=input_assembly
+        )
+        validator = validator_instance(*val_params, gene_cache=gene_cache)
+        for _ in range(2):
+            resp = await validator.validate(
+                classification, input_assembly=input_assembly
+            )
+            assert resp == expected, query
+
+    assert gene_cache.cache_info().hits